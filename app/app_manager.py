@@ -1,8 +1,8 @@
 import os
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Tuple, List, Optional, Callable, FrozenSet
 
 # Import custom exception classes for specific error handling scenarios.
-from app.exceptions import InvalidPayloadError, InvalidJiraConfigurationParser, MissingRequiredDataError, GcpProvisioningError, InvalidMethodError, GitHubOperationError
+from app.exceptions import InvalidPayloadError, InvalidJiraConfigurationParser, MissingRequiredDataError, GcpProvisioningError, GitHubOperationError
 # Import the GitHub handler for repository operations.
 from app.github import GitHubHandler
 
@@ -10,21 +10,66 @@ from app.github import GitHubHandler
 # These classes are responsible for generating GCP-specific configurations (e.g., Terraform).
 from app.provisioners.hierarchy.folders import GcpFolderProvisioner
 from app.provisioners.hierarchy.projects import GcpProjectProvisioner
+from app.payloads import GitHubPayload
 # Import configurations for Jira ticket fields, mapping them to expected payload structures.
 from configs.jira.configurations import project_creation_ticket_fields, folder_creation_ticket_fields
 # Import the payload parser for extracting data from Jira webhooks.
 from app.parsers import PayloadParser
+# JSON helpers backed by orjson, with a stdlib json fallback.
+from app.serialization import json_parse_lazy, json_dumps, get_pointer, materialize, is_json_array
+# Parses boolean environment flags.
+from app.logger import get_env_flag, CommentType
 
-import json
-import traceback
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, Future, wait
 
 # Debug flags for controlling logging verbosity.
-DEBUG: bool = os.getenv('DEBUG', True)  
-DEBUG_PAYLOAD: bool = os.getenv('DEBUG_PAYLOAD', True)  # bool(os.getenv('DEBUG_PAYLOAD')) # Controls logging of the full payload.
+DEBUG: bool = get_env_flag('DEBUG', False)
+DEBUG_PAYLOAD: bool = get_env_flag('DEBUG_PAYLOAD', False)  # Controls logging of the full payload (expensive for large payloads).
+
+# Maximum number of branches pushed to GitHub concurrently by `push_to_github`.
+# Kept low to stay under GitHub's secondary rate limits for concurrent requests.
+GITHUB_PUSH_MAX_WORKERS: int = 4
+# Maximum number of issues of a batched delivery processed concurrently by `process_batch`.
+BATCH_MAX_WORKERS: int = 4
+# Generic body used for every pull request created by the application.
+PR_BODY: str = "This pull request adds new files with YAML content, autogenerated by the Jira to GitHub application."
 
 # Import GitHub repository credentials mapping issue types to specific repos.
 from configs.github.credentials import github_configs
 
+# GitHub credentials resolved once at import time, keyed like `github_configs`.
+GitHubCredentials = namedtuple("GitHubCredentials", ["token", "repo_owner", "repo_name"])
+RESOLVED_GITHUB_CREDENTIALS: Dict[str, GitHubCredentials] = {
+    config_key: GitHubCredentials(credentials["GITHUB_TOKEN"], credentials["REPO_OWNER"], credentials["REPO_NAME"])
+    for config_key, credentials in github_configs.items()
+    if credentials
+}
+# In DEBUG mode every issue type uses the debug repository configuration.
+DEBUG_GITHUB_CONFIG_KEY: Optional[str] = "debug_config" if DEBUG else None
+
+# Dispatch tables keyed by Jira issue type name.
+# Field configurations used to parse the Jira payload for each supported issue type.
+ISSUE_TYPE_FIELD_CONFIGS: Dict[str, Dict[str, Any]] = {
+    "New GCP Project Provisioning": project_creation_ticket_fields,
+    "New GCP Folder Provisioning": folder_creation_ticket_fields,
+}
+# Provisioner class responsible for each supported issue type.
+ISSUE_TYPE_PROVISIONERS: Dict[str, type] = {
+    "New GCP Project Provisioning": GcpProjectProvisioner,
+    "New GCP Folder Provisioning": GcpFolderProvisioner,
+}
+# Output names of the mandatory fields of each issue type.
+ISSUE_TYPE_MANDATORY_FIELDS: Dict[str, FrozenSet[str]] = {
+    issue_type_name: PayloadParser.get_mandatory_fields(ticket_fields)
+    for issue_type_name, ticket_fields in ISSUE_TYPE_FIELD_CONFIGS.items()
+}
+# Field parsers specialized once per issue type from its static field configuration.
+ISSUE_TYPE_FIELD_PARSERS: Dict[str, Callable[[PayloadParser], None]] = {
+    issue_type_name: PayloadParser.compile_field_parser(ticket_fields)
+    for issue_type_name, ticket_fields in ISSUE_TYPE_FIELD_CONFIGS.items()
+}
+
 
 class AppManager(PayloadParser):
     """
@@ -38,6 +83,13 @@ class AppManager(PayloadParser):
 
     It inherits payload parsing capabilities from PayloadParser and logging from AppLogger.
     """
+    # One instance is created per webhook (and per issue of a batched delivery): slots keep its
+    # per-request state in a fixed layout instead of a per-instance __dict__.
+    __slots__ = (
+        "config_data", "request_json", "batch_payloads", "dw_env_project_list", "parent_folder_id",
+        "issue_type_name", "jira_id", "provisioner", "ticket_fields", "field_parser", "mandatory_fields",
+        "provisioner_class", "github_credentials", "github_manager",
+    )
 
     def __init__(self):
         """
@@ -48,31 +100,24 @@ class AppManager(PayloadParser):
         super().__init__() # Initialize PayloadParser, passing an empty dict for request_json initially.
 
         self.config_data: Dict[str, Any] = {}  # Stores parsed configuration data extracted from Jira fields.
-        self.request_json: Dict[str, Any] = {}  # Stores the raw incoming Jira webhook payload.
+        self.request_json: Any = {}  # Stores the raw incoming Jira webhook payload (a lazy document when simdjson is available).
+        self.batch_payloads: Optional[List[Any]] = None # Individual webhook payloads when the request is a batched delivery.
 
         # Attributes specific to provisioning flows, populated during validation and processing.
-        self.dw_env_project_name_list: List[str] = [] # List of Datawave environment project names.
+        self.dw_env_project_list: List[Tuple[str, str]] = [] # (environment, project name) pairs of the Datawave environment projects.
         self.parent_folder_id: Optional[str] = None # ID of the parent GCP folder.
 
         self.issue_type_name: str = "" # Name of the Jira issue type (e.g., "New GCP Project Provisioning").
         self.jira_id: str = "" # Key of the Jira issue (e.g., "PROJ-123").
         self.provisioner: Optional[Any] = None # Instance of the selected GCP provisioner (e.g., GcpProjectProvisioner).
-        self.github_manager: Optional[GitHubHandler] = None # Instance of the GitHub handler for repository operations.
-
-    def check_if_post_request(self, request: Any) -> None:
-        """
-        Validates if the incoming request method is POST.
-        Raises an InvalidMethodError if the method is not POST.
 
-        Args:
-            request (Any): The incoming HTTP request object (e.g., Flask request object).
-        """
-        # Ensure only POST requests are processed for webhooks.
-        if request.method != 'POST':
-            self.log_error(f"Received non-POST request: {request.method}. Method Not Allowed.")
-            raise InvalidMethodError("Received non-POST request. Method Not Allowed.")
-        else:
-            self.log_info("Received a POST request. Method Allowed.")
+        # State derived from the issue type, resolved once by `_resolve_issue_type_configuration`.
+        self.ticket_fields: Dict[str, Any] = {} # Jira field configuration of the issue type.
+        self.field_parser: Optional[Callable[[PayloadParser], None]] = None # Field parser specialized for the issue type.
+        self.mandatory_fields: FrozenSet[str] = frozenset() # Output names of the mandatory fields of the issue type.
+        self.provisioner_class: Optional[type] = None # Provisioner class responsible for the issue type.
+        self.github_credentials: Optional[GitHubCredentials] = None # GitHub credentials of the effective configuration key.
+        self.github_manager: Optional[GitHubHandler] = None # Instance of the GitHub handler for repository operations.
 
     def transform_into_json(self, request: Any) -> None:
         """
@@ -80,18 +125,46 @@ class AppManager(PayloadParser):
         Validates the basic structure of the JSON payload to ensure it's a valid Jira webhook.
         Raises an InvalidPayloadError if the payload is empty or malformed.
 
+        A batched delivery (a JSON object with a 'deliveries' list of individual webhook
+        payloads) is also accepted; its payloads are stored in `self.batch_payloads` and
+        validated one by one in `process_batch`.
+
         Args:
             request (Any): The incoming HTTP request object.
         """
-        # Attempt to parse the request body as JSON. 'silent=True' prevents errors if not JSON.
-        self.request_json = request.get_json(silent=True)
-        # Validate critical keys expected in a Jira webhook payload.
-        if not isinstance(self.request_json, dict) or \
-           'issue' not in self.request_json or \
-           'key' not in self.request_json['issue'] or \
-           "fields" not in self.request_json['issue'] or \
-           "issuetype" not in self.request_json['issue']['fields'] or \
-           "name" not in self.request_json["issue"]["fields"]["issuetype"]:
+        # Parse the raw request body directly from bytes. With simdjson available, fields are only
+        # materialized when accessed. Malformed JSON is treated as an empty payload.
+        raw_body = request.get_data(cache=False)
+        try:
+            self.request_json = json_parse_lazy(raw_body) if raw_body else None
+        except ValueError:
+            self.request_json = None
+
+        # Detect batched deliveries before validating the single-issue structure.
+        try:
+            deliveries = get_pointer(self.request_json, "/deliveries")
+        except KeyError:
+            deliveries = None
+        if is_json_array(deliveries):
+            self.batch_payloads = list(deliveries)
+            self.log_info(f"Valid batched JSON payload received from request body with {len(self.batch_payloads)} deliveries.")
+            return
+
+        self._validate_issue_payload()
+
+    def _validate_issue_payload(self) -> None:
+        """
+        Validates that `self.request_json` contains the keys required for a single Jira
+        webhook payload ('issue'.'key' and 'issue'.'fields'.'issuetype'.'name').
+
+        Raises:
+            InvalidPayloadError: If the payload is empty or malformed.
+        """
+        # Validate critical keys expected in a Jira webhook payload with two JSON Pointer probes.
+        try:
+            get_pointer(self.request_json, "/issue/key")
+            get_pointer(self.request_json, "/issue/fields/issuetype/name")
+        except KeyError:
             self.log_error("Empty or invalid JSON payload received from request body.")
             raise InvalidPayloadError("Empty or invalid JSON payload received from request body. "
                                       "If not empty, check that the fields 'key' under 'issue' is present "
@@ -100,7 +173,113 @@ class AppManager(PayloadParser):
             self.log_info("Valid JSON payload received from request body.")
             # Log the full payload if DEBUG_PAYLOAD is enabled.
             if DEBUG_PAYLOAD:
-                self.log_info(f"Full Jira payload: {json.dumps(self.request_json, indent=2)}")
+                self.log_info(f"Full Jira payload: {json_dumps(materialize(self.request_json))}")
+
+    def is_batch_request(self) -> bool:
+        """
+        Indicates whether the parsed request is a batched delivery of several webhook payloads.
+
+        Returns:
+            bool: True if `transform_into_json` found a 'deliveries' list.
+        """
+        return self.batch_payloads is not None
+
+    def _reset_issue_state(self, request_json: Any) -> None:
+        """
+        Loads a single webhook payload and clears all per-issue state, so that the same
+        AppManager (and its GitHub manager) can process several issues in a row.
+
+        Args:
+            request_json (Any): The webhook payload of the next issue to process.
+        """
+        self.request_json = request_json
+        self.config_data = {}
+        self.dw_env_project_list = []
+        self.parent_folder_id = None
+        self.issue_type_name = ""
+        self.jira_id = ""
+        self.provisioner = None
+        self.ticket_fields = {}
+        self.field_parser = None
+        self.mandatory_fields = frozenset()
+        self.provisioner_class = None
+        self.github_credentials = None
+
+    def process_issue(self) -> None:
+        """
+        Runs the full provisioning workflow for the issue currently loaded in `self.request_json`:
+        extraction, parsing, validation, Terraform YAML generation, GitHub push and final
+        Jira status update.
+
+        Raises:
+            JiraWebhookError: Or one of its subclasses, if any step of the workflow fails.
+            ValueError: If the Jira payload cannot be parsed.
+        """
+        self.extract_issue()
+
+        self.parse_jira_request()
+        self.select_provisioner()
+        self.validate_jira_request()
+
+        # Setting up the GitHub manager (which posts a Jira comment) and generating the Terraform YAMLs
+        # are independent: the YAMLs are built while the comment round trip is in flight.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            github_manager_initialized = executor.submit(self.initialize_github_manager)
+            try:
+                self.built_terraform_yaml(pending_setup=github_manager_initialized)
+            except Exception:
+                # The build error is propagated, but a failed set-up must not go unnoticed.
+                setup_error = github_manager_initialized.exception()
+                if setup_error is not None:
+                    self.log_error(f"The GitHub manager set-up also failed: {setup_error}")
+                raise
+            github_manager_initialized.result()
+
+        self.push_to_github()
+
+        self.change_issue_status("Set as done", jira_id=self.jira_id)
+
+    def process_batch(self) -> Dict[str, str]:
+        """
+        Processes the payloads of a batched delivery concurrently (up to BATCH_MAX_WORKERS at a
+        time), so that the Jira and GitHub round-trips of different issues overlap. Each issue
+        is processed by its own AppManager, since the workflow state is kept on the instance.
+        A failure on one issue is logged and recorded but does not affect the other issues.
+
+        Returns:
+            Dict[str, str]: The outcome ("processed" or the error message) for each Jira issue key.
+        """
+        payloads = self.batch_payloads or []
+        max_workers = max(1, min(BATCH_MAX_WORKERS, len(payloads)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results: Dict[str, str] = dict(executor.map(self._process_batch_item, range(len(payloads)), payloads))
+        self.log_info(f"Processed batched delivery: {json_dumps(results)}")
+        return results
+
+    def _process_batch_item(self, index: int, payload: Any) -> Tuple[str, str]:
+        """
+        Runs the full workflow for one payload of a batched delivery with a dedicated AppManager.
+        Runs in a worker thread of `process_batch`.
+
+        Args:
+            index (int): The position of the payload in the delivery, used to label failures without a Jira key.
+            payload (Any): The webhook payload of the issue.
+
+        Returns:
+            Tuple[str, str]: The Jira issue key (or delivery label) and its outcome.
+        """
+        issue_manager = AppManager()
+        issue_manager._reset_issue_state(payload)
+        try:
+            issue_manager._validate_issue_payload()
+            issue_manager.process_issue()
+            return issue_manager.jira_id, "processed"
+        except Exception as e:
+            # Any failure (including unexpected ones, e.g. request errors) only fails this issue;
+            # letting it escape `executor.map` would discard the results of the other issues.
+            issue_label = issue_manager.jira_id or f"delivery #{index}"
+            self.log_error(f"Failed to process {issue_label} of the batched delivery: {e}")
+            return issue_label, f"failed: {e}"
 
     def _extract_jira_id(self) -> str:
         """
@@ -132,6 +311,7 @@ class AppManager(PayloadParser):
 
         Raises:
             MissingRequiredDataError: If the issue type name or Jira ID are not found.
+            InvalidJiraConfigurationParser: If the issue type is not configured in the application.
         """
         self.issue_type_name = self._extract_issue_type_name()
         self.jira_id = self._extract_jira_id()
@@ -145,32 +325,38 @@ class AppManager(PayloadParser):
             raise MissingRequiredDataError("Issue Jira ID not found in the request.")
         else:
             self.log_info(f"[START] Received Jira webhook payload from {self.jira_id} for a {self.issue_type_name}.")
+            # List the issue transitions in the background; the final status change then only needs its POST.
+            self.prefetch_transitions(self.jira_id)
             # Add an informational comment to the Jira issue indicating processing has started.
             self.add_comment_to_jira_issue(
                 comment_text=f"[START] Received Jira webhook payload for {self.jira_id} ({self.issue_type_name}).",
                 jira_id=self.jira_id,
-                comment_type="info"
+                comment_type=CommentType.INFO
             )
 
-    def _extract_config_field_values_for_issue_request(self) -> Dict[str, Any]:
-        """
-        Selects the appropriate Jira field configuration based on the issue type name.
-        This configuration guides how to parse the Jira payload.
+        self._resolve_issue_type_configuration()
 
-        Returns:
-            Dict[str, Any]: The dictionary containing field configurations for the specific issue type.
+    def _resolve_issue_type_configuration(self) -> None:
+        """
+        Resolves, once per issue, all the state derived from the issue type name: the field
+        configuration, the specialized field parser, the mandatory fields, the provisioner
+        class and the GitHub credentials. Later workflow steps use these attributes directly
+        instead of dispatching on `self.issue_type_name` again.
 
         Raises:
             InvalidJiraConfigurationParser: If the issue type is not recognized in the configurations.
         """
-        # Dispatch to different configuration based on issue type.
-        if self.issue_type_name == "New GCP Project Provisioning":
-            return project_creation_ticket_fields
-        elif self.issue_type_name == "New GCP Folder Provisioning":
-            return folder_creation_ticket_fields
-        else:
+        issue_type_name = self.issue_type_name
+        try:
+            self.ticket_fields = ISSUE_TYPE_FIELD_CONFIGS[issue_type_name]
+            self.field_parser = ISSUE_TYPE_FIELD_PARSERS[issue_type_name]
+            self.mandatory_fields = ISSUE_TYPE_MANDATORY_FIELDS[issue_type_name]
+            self.provisioner_class = ISSUE_TYPE_PROVISIONERS[issue_type_name]
+        except KeyError:
             # If the issue type is not configured, raise an error.
-            raise InvalidJiraConfigurationParser(f"Issue type '{self.issue_type_name}' not found in the configuration file to parse the request arguments.")
+            raise InvalidJiraConfigurationParser(f"Issue type '{issue_type_name}' not found in the configuration file to parse the request arguments.") from None
+        # Missing credentials are only reported when the GitHub manager is initialized.
+        self.github_credentials = RESOLVED_GITHUB_CREDENTIALS.get(DEBUG_GITHUB_CONFIG_KEY or issue_type_name)
 
     def _log_request_details(self) -> None:
         """
@@ -179,9 +365,9 @@ class AppManager(PayloadParser):
         """
         if DEBUG_PAYLOAD:
             log_data = {
-                "request_json": self.request_json,
+                "request_json": materialize(self.request_json),
             }
-            self.log_info(f"Request details: {json.dumps(log_data, indent=2)}")
+            self.log_info(f"Request details: {json_dumps(log_data)}")
 
     def parse_jira_request(self) -> None:
         """
@@ -193,39 +379,19 @@ class AppManager(PayloadParser):
         Raises:
             ValueError: If there's a missing key in the Jira payload or an unexpected error during parsing.
         """
-        # Get the specific ticket field configurations for the current issue type.
-        ticket_fields = self._extract_config_field_values_for_issue_request()
         self._log_request_details() # Log the raw request for debugging.
+        self.pending_validation_errors = []
 
         try:
-            # Iterate through each field configuration to extract and process values.
-            for key, element in ticket_fields.items():
-                self.log_info(f"Processing field '{key}' with config: {element}")
-                # Extract the raw field value from the Jira payload.
-                field_value = self._extract_field_value(element)
-
-                # Dispatch to the appropriate processing method based on the field type.
-                if element["type"] == "dropdown":
-                    self._process_dropdown(element, field_value)
-                elif element["type"] == "people":
-                    self._process_people(element, field_value)
-                elif element["type"] == "reporter":
-                    self._process_reporter(element, field_value)
-                elif element["type"] == "dropdown_nested":
-                    self._process_dropdown_nested(element, field_value)
-                elif element["type"] == "checklist":
-                    self._process_checklist(element, field_value)
-                elif element["type"] == "textfield":
-                    self._process_textfield(element, field_value)
-                elif element["type"] == "numericfield":
-                    self._process_numericfield(element, field_value)
-                else:
-                    self.log_warning(f"Unsupported field type: '{element['type']}' for field '{key}'. Skipping.")
+            # Extract and process every configured field with the parser specialized for this issue type.
+            self.field_parser(self)
 
             # After processing all fields, check if all mandatory fields are present.
-            self._check_mandatory_fields(ticket_fields)
+            self._check_mandatory_fields(self.mandatory_fields)
 
-            self.log_info(f"Successfully extracted configuration data: {json.dumps(self.config_data, indent=2)}")
+            self.log_info("Successfully extracted configuration data.")
+            if DEBUG:
+                self.log_debug("Extracted configuration data: %s", json_dumps(self.config_data))
 
         except ValueError:
             # Re-raise ValueError exceptions (e.g., from _check_mandatory_fields or type conversions).
@@ -237,9 +403,13 @@ class AppManager(PayloadParser):
             raise ValueError(error_message) # Re-raise as ValueError for consistent handling.
         except Exception as e:
             # Catch any other unexpected errors during parsing.
-            error_message = f"An unexpected error occurred during parsing: {traceback.format_exc()}"
+            # log_error already appends the active traceback, so it is not formatted again here.
+            error_message = f"An unexpected error occurred during parsing: {e}"
             self.log_error(error_message)
-            raise ValueError(error_message) # Re-raise as ValueError.
+            raise ValueError(error_message) from e # Re-raise as ValueError.
+        finally:
+            # Report all validation errors found while parsing in a single Jira comment.
+            self.flush_validation_errors()
 
     def select_provisioner(self) -> None:
         """
@@ -249,16 +419,13 @@ class AppManager(PayloadParser):
         Raises:
             InvalidJiraConfigurationParser: If the issue type is not recognized for provisioning.
         """
-        # Dispatch to different provisioner classes based on the issue type.
-        if self.issue_type_name == "New GCP Project Provisioning":
-            self.provisioner = GcpProjectProvisioner(config_data=self.config_data)
-            self.log_info(f"Selected GcpProjectProvisioner for issue type '{self.issue_type_name}'.")
-        elif self.issue_type_name == "New GCP Folder Provisioning":
-            self.provisioner = GcpFolderProvisioner(config_data=self.config_data)
-            self.log_info(f"Selected GcpFolderProvisioner for issue type '{self.issue_type_name}'.")
-        else:
+        # The provisioner class was resolved from the issue type by `extract_issue`.
+        provisioner_class = self.provisioner_class
+        if provisioner_class is None:
             # If no matching provisioner is found, raise an error.
             raise InvalidJiraConfigurationParser(f"Issue type '{self.issue_type_name}' not configured for provisioning.")
+        self.provisioner = provisioner_class(config_data=self.config_data)
+        self.log_info(f"Selected {provisioner_class.__name__} for issue type '{self.issue_type_name}'.")
 
     def _get_github_credentials(self) -> Tuple[str, str, str]:
         """
@@ -271,15 +438,11 @@ class AppManager(PayloadParser):
         Raises:
             GitHubOperationError: If GitHub configuration is missing for the effective issue type.
         """
-        # Determine the effective configuration key (debug_config if DEBUG is True, otherwise issue_type_name).
-        effective_config_key = "debug_config" if DEBUG else self.issue_type_name
-
-        credentials = github_configs.get(effective_config_key)
-        if not credentials:
+        # The credentials were resolved from the effective configuration key by `extract_issue`.
+        if self.github_credentials is None:
             # If credentials are not found, raise an error.
-            raise GitHubOperationError(f"GitHub configuration missing for issue type: {effective_config_key}")
-
-        return (credentials["GITHUB_TOKEN"], credentials["REPO_OWNER"], credentials["REPO_NAME"])
+            raise GitHubOperationError(f"GitHub configuration missing for issue type: {DEBUG_GITHUB_CONFIG_KEY or self.issue_type_name}")
+        return self.github_credentials
 
     def initialize_github_manager(self) -> None:
         """
@@ -302,7 +465,7 @@ class AppManager(PayloadParser):
             self.add_comment_to_jira_issue(
                 comment_text=f"Connecting to GitHub '{REPO_NAME}' under '{REPO_OWNER}' for '{self.issue_type_name}'.",
                 jira_id=self.jira_id,
-                comment_type="info"
+                comment_type=CommentType.INFO
             )
         except Exception as e:
             self.log_error(f"Failed to initialize GitHub manager: {e}")
@@ -325,7 +488,7 @@ class AppManager(PayloadParser):
                 self.add_comment_to_jira_issue(
                     comment_text=self.provisioner._get_request_comment_message(),
                     jira_id=self.jira_id,
-                    comment_type="info"
+                    comment_type=CommentType.INFO
                 )
             else:
                 self.log_error("Provisioner not initialized before validation.")
@@ -334,16 +497,20 @@ class AppManager(PayloadParser):
         except GcpProvisioningError as e:
             # If GCP provisioning validation fails, log the error, comment on Jira, and block the issue.
             self.log_error(f"GCP provisioning validation failed: {e}")
-            self.add_comment_to_jira_issue(comment_text=str(e), jira_id=self.jira_id, comment_type="error")
-            self.change_issue_status(jira_id=self.jira_id, transition_name="Set as blocked")
+            self.comment_and_change_issue_status(jira_id=self.jira_id, comment_text=str(e), transition_name="Set as blocked")
             raise # Re-raise the exception to propagate the error.
 
-    def built_terraform_yaml(self) -> None:
+    def built_terraform_yaml(self, pending_setup: Optional[Future] = None) -> None:
         """
         Instructs the selected provisioner to build the necessary Terraform YAML configurations.
         If an error occurs during this process, it logs the error, adds an error comment to Jira,
         and changes the issue status to "Set as blocked".
 
+        Args:
+            pending_setup (Optional[Future]): A concurrent step (e.g., the GitHub manager set-up) that is
+                                              waited for before an error is reported, so that the Jira
+                                              comments and logs keep the order of a sequential run.
+
         Raises:
             GcpProvisioningError: If the provisioner fails to build the Terraform YAMLs.
         """
@@ -358,16 +525,18 @@ class AppManager(PayloadParser):
 
         except GcpProvisioningError as e:
             # If building YAMLs fails, log the error, comment on Jira, and block the issue.
+            if pending_setup is not None:
+                wait([pending_setup])
             self.log_error(f"Failed to build Terraform YAMLs: {e}")
-            self.add_comment_to_jira_issue(comment_text=str(e), jira_id=self.jira_id, comment_type="error")
-            self.change_issue_status(jira_id=self.jira_id, transition_name="Set as blocked")
+            self.comment_and_change_issue_status(jira_id=self.jira_id, comment_text=str(e), transition_name="Set as blocked")
             raise # Re-raise the exception to propagate the error.
 
     def push_to_github(self) -> None:
         """
         Pushes the generated Terraform YAML files to GitHub by committing them to a new branch
         and creating a pull request. It iterates through the `github_payload` generated by
-        the provisioner. It handles auto-approval and updates Jira issue status accordingly.
+        the provisioner, pushing entries that target different branches concurrently.
+        It handles auto-approval and updates Jira issue status accordingly once all pushes are done.
 
         Raises:
             GcpProvisioningError: If any GitHub operation fails or if the provisioner's payload is invalid.
@@ -380,59 +549,83 @@ class AppManager(PayloadParser):
                 self.log_error("Provisioner or its github_payload is not available.")
                 raise GcpProvisioningError("Provisioner did not generate GitHub payload.")
 
-            # Iterate through the generated GitHub payload, which contains data for each project/environment.
+            # Group the generated GitHub payload (one entry per project/environment) by target branch.
+            # Entries sharing a branch are committed in order; distinct branches are pushed concurrently.
+            payloads_by_branch: Dict[str, List[GitHubPayload]] = {}
             for dw_project_data in self.provisioner.github_payload.values():
-                # Iterate through the encoded YAML content for each file type within the project data.
-                for file_type_key, file_data in dw_project_data.get("yaml_content_encoded", {}).items():
-                    self.log_info(f"Committing file: {file_data.get('path')} to branch: {dw_project_data.get('new_branch_name')}")
-                    # Commit each file to the new branch using the GitHub manager.
-                    self.github_manager._commit_new_file(
-                        file_data.get("path"),
-                        file_data.get("commit_message"),
-                        file_data.get("file"), # This is the base64 encoded content
-                        dw_project_data.get("new_branch_name")
-                    )
-                self.log_info(f"All files committed for project data: {dw_project_data.get('pr_title')}")
-
-                # Define a generic body for the pull request.
-                pr_body = "This pull request adds new files with YAML content, autogenerated by the Jira to GitHub application."
-                # Create the pull request using the GitHub manager.
-                pr_url = self.github_manager._create_pull_request_logic(
-                    dw_project_data.get("pr_title"),
-                    pr_body,
-                    dw_project_data.get("autoapprove"),
-                    dw_project_data.get("new_branch_name")
-                )
-                self.log_info(f"Pull request creation initiated for: {dw_project_data.get('pr_title')}. URL: {pr_url}")
+                payloads_by_branch.setdefault(dw_project_data.new_branch_name, []).append(dw_project_data)
+            jira_id = self.jira_id
+
+            max_workers = max(1, min(GITHUB_PUSH_MAX_WORKERS, len(payloads_by_branch)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pushed_branches = list(executor.map(self._push_branch_payloads, payloads_by_branch.values()))
 
+            # Apply the Jira comments and status updates once all pushes have completed.
+            for dw_project_data, pr_url in (result for branch_results in pushed_branches for result in branch_results):
                 # Update Jira issue status based on auto-approval setting.
-                if dw_project_data.get("autoapprove") is True:
+                if dw_project_data.autoapprove is True:
                     self.add_comment_to_jira_issue(
                         comment_text=f"Created and auto-approved PR at {pr_url}",
-                        jira_id=self.jira_id,
-                        comment_type="info"
+                        jira_id=jira_id,
+                        comment_type=CommentType.INFO
                     )
-                    self.change_issue_status(jira_id=self.jira_id, transition_name="Set as done")
-                    self.log_info(f"Jira issue {self.jira_id} status changed to 'Set as done'.")
+                    self.change_issue_status(jira_id=jira_id, transition_name="Set as done")
+                    self.log_info(f"Jira issue {jira_id} status changed to 'Set as done'.")
                 else:
                     self.add_comment_to_jira_issue(
                         comment_text=f'Created a PR that needs manual approval at {pr_url}',
-                        jira_id=self.jira_id,
-                        comment_type="manual"
+                        jira_id=jira_id,
+                        comment_type=CommentType.MANUAL
                     )
-                    self.change_issue_status(jira_id=self.jira_id, transition_name="Set as to be reviewed")
-                    self.log_info(f"Jira issue {self.jira_id} status changed to 'Set as to be reviewed'.")
+                    self.change_issue_status(jira_id=jira_id, transition_name="Set as to be reviewed")
+                    self.log_info(f"Jira issue {jira_id} status changed to 'Set as to be reviewed'.")
 
         except GcpProvisioningError as e:
             # Catch and handle errors specific to GCP provisioning or related GitHub operations.
             self.log_error(f"GCP provisioning or GitHub push failed: {e}")
-            self.add_comment_to_jira_issue(comment_text=str(e), jira_id=self.jira_id, comment_type="error")
-            self.change_issue_status(jira_id=self.jira_id, transition_name="Set as blocked")
+            self.comment_and_change_issue_status(jira_id=self.jira_id, comment_text=str(e), transition_name="Set as blocked")
             raise # Re-raise the exception to propagate the error.
         except Exception as e:
             # Catch any other unexpected errors during the GitHub push process.
-            self.log_error(f"An unexpected error occurred during GitHub push: {traceback.format_exc()}")
-            self.add_comment_to_jira_issue(comment_text=f"An unexpected error occurred during GitHub push: {e}", jira_id=self.jira_id, comment_type="error")
-            self.change_issue_status(jira_id=self.jira_id, transition_name="Set as blocked")
+            self.log_error(f"An unexpected error occurred during GitHub push: {e}")
+            self.comment_and_change_issue_status(jira_id=self.jira_id, comment_text=f"An unexpected error occurred during GitHub push: {e}", transition_name="Set as blocked")
             raise # Re-raise the exception.
 
+    def _push_branch_payloads(self, branch_payloads: List[GitHubPayload]) -> List[Tuple[GitHubPayload, Optional[str]]]:
+        """
+        Commits the files and creates the pull request for each project data entry targeting
+        the same branch, in order. Runs in a worker thread of `push_to_github`.
+
+        Args:
+            branch_payloads (List[GitHubPayload]): The `github_payload` entries sharing one branch.
+
+        Returns:
+            List[Tuple[GitHubPayload, Optional[str]]]: Each project data entry with the URL of its pull request.
+        """
+        return [(dw_project_data, self._push_project_payload(dw_project_data)) for dw_project_data in branch_payloads]
+
+    def _push_project_payload(self, dw_project_data: GitHubPayload) -> Optional[str]:
+        """
+        Commits all encoded YAML files of one project data entry to its branch in a single
+        commit and creates the corresponding pull request.
+
+        Args:
+            dw_project_data (GitHubPayload): One entry of the provisioner's `github_payload`.
+
+        Returns:
+            Optional[str]: The URL of the created pull request.
+        """
+        # Bind the payload entries and the GitHub manager once.
+        github_manager = self.github_manager
+        branch = dw_project_data.new_branch_name
+        pr_title = dw_project_data.pr_title
+        files = dw_project_data.files
+
+        self.log_info(f"Committing files: {[file_data.path for file_data in files]} to branch: {branch}")
+        github_manager._commit_files_as_tree(branch, files)
+        self.log_info(f"All files committed for project data: {pr_title}")
+
+        # Create the pull request using the GitHub manager.
+        pr_url = github_manager._create_pull_request_logic(pr_title, PR_BODY, dw_project_data.autoapprove, branch)
+        self.log_info(f"Pull request creation initiated for: {pr_title}. URL: {pr_url}")
+        return pr_url
@@ -1,7 +1,11 @@
 from typing import Any
+import requests
 
 class JiraWebhookError(Exception):
     """Base exception for errors related to Jira webhook processing."""
+    # Slots keep 'details' out of a per-instance __dict__; subclasses declare empty slots.
+    __slots__ = ("details",)
+
     def __init__(self, message="An error occurred during Jira webhook processing.", details: Any = None):
         super().__init__(message)
         self.details = details
@@ -10,41 +14,52 @@ class JiraWebhookError(Exception):
 
 class InvalidJiraConfigurationParser(JiraWebhookError):
     """Raised when the name of the issue type has no configuration dictionary in the application."""
-    pass 
+    __slots__ = ()
     
 class InvalidMethodError(JiraWebhookError):
     """Raised when the raw Jira webhook payload is not a the expected method."""
-    pass
+    __slots__ = ()
 
 class InvalidPayloadError(JiraWebhookError):
     """Raised when the raw Jira webhook payload is malformed, empty, or invalid JSON."""
-    pass
+    __slots__ = ()
 
 class MissingRequiredDataError(JiraWebhookError):
     """Raised when essential data (e.g., 'issue', 'issuetype', critical custom fields)
     is missing from a *validly structured* Jira payload."""
-    pass
+    __slots__ = ()
 
 class UnhandledIssueTypeError(JiraWebhookError):
     """Raised when a valid issue type is received but not explicitly handled by the application logic."""
-    pass
+    __slots__ = ()
 
 class ExternalServiceError(JiraWebhookError):
     """Base exception for errors when interacting with external services (e.g., GCP APIs, GitHub)."""
-    pass
+    __slots__ = ()
 
 class GcpProvisioningError(ExternalServiceError):
     """Raised when a GCP provisioning operation fails."""
-    pass
+    __slots__ = ()
 
 class PermissionDeniedError(ExternalServiceError):
     """Raised when an operation fails due to insufficient permissions."""
-    pass
+    __slots__ = ()
 
 class GitHubOperationError(ExternalServiceError):
     """Raised when a GitHub operation (e.g., PR creation) fails."""
-    pass
+    __slots__ = ()
 
 class ErrorAddingCommentToJira(JiraWebhookError):
     """Raised when there is an error while adding a commet to the Jira Issue"""
-    pass
\ No newline at end of file
+    __slots__ = ()
+
+# GitHub API errors subclass requests' RequestException, so that they are handled like any other
+# failed GitHub request, while letting callers tell unrecoverable errors apart from transient ones.
+class GitHubAPIError(requests.exceptions.RequestException):
+    """Raised when a GitHub API request fails with an error status code."""
+
+class BranchNotFound(GitHubAPIError):
+    """Raised when a GitHub branch does not exist (404). Not worth retrying."""
+
+class RateLimited(GitHubAPIError):
+    """Raised when a GitHub API request is still rejected by rate limiting after retrying."""
@@ -2,17 +2,72 @@
 
 
 import requests
-from typing import Optional
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 import os
-import requests
-import base64
-import yaml
+import hashlib
+import random
+import threading
+import time
+from urllib.parse import urlencode
+# pybase64 is an optional SIMD-accelerated drop-in for the standard base64 module.
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 from app.logger import AppLogger
+from app.serialization import json_loads, json_dumps_bytes
+from app.payloads import YamlFile
+from app.exceptions import GitHubOperationError, GitHubAPIError, BranchNotFound, RateLimited
 
 
 # Define the default branch name for GitHub operations.
 BRANCH_NAME: str = os.getenv('BRANCH_NAME', 'main')
 
+# Retries of a GitHub API call rejected by rate limiting (403/429 with an exhausted quota or Retry-After).
+GITHUB_RATE_LIMIT_RETRIES: int = 3
+# Base delay (seconds) of the jittered exponential backoff used when GitHub gives no reset time.
+GITHUB_RETRY_BASE_DELAY: float = 1.0
+# Longest wait (seconds) for a rate limit reset; longer waits fail fast instead of blocking the function.
+GITHUB_RETRY_MAX_DELAY: float = 60.0
+
+# Endpoint of the GitHub GraphQL API.
+GITHUB_GRAPHQL_URL: str = 'https://api.github.com/graphql'
+
+# Creates a commit with several file additions on an existing branch in a single request.
+CREATE_COMMIT_ON_BRANCH_MUTATION: str = """
+mutation ($input: CreateCommitOnBranchInput!) {
+  createCommitOnBranch(input: $input) {
+    commit { oid }
+  }
+}
+"""
+
+# Seconds during which the latest SHA of a branch is reused without asking GitHub again.
+BRANCH_SHA_CACHE_TTL: float = 30.0
+
+# Enables auto-merge on a pull request; it is merged by GitHub as soon as its requirements are met.
+ENABLE_AUTO_MERGE_MUTATION: str = """
+mutation ($pullRequestId: ID!, $mergeMethod: PullRequestMergeMethod!) {
+  enablePullRequestAutoMerge(input: {pullRequestId: $pullRequestId, mergeMethod: $mergeMethod}) {
+    pullRequest { number }
+  }
+}
+"""
+# Merge method used for auto-merged pull requests (same as the REST merge endpoint default).
+AUTO_MERGE_METHOD: str = 'MERGE'
+
+# Repositories ("owner/name") where deleting head branches after merge was already enabled.
+REPOS_DELETING_MERGED_BRANCHES = set()
+
+# Maximum number of GET responses kept for ETag conditional requests (oldest entries are evicted first).
+ETAG_CACHE_MAX_ENTRIES: int = 256
+
+# ETag, decoded JSON body and next page URL of recent GET responses, keyed by full URL. It lives at module level so
+# that it survives across webhook invocations handled by the same (warm) function instance.
+ETAG_CACHE: Dict[str, Tuple[str, Any, Optional[str]]] = {}
+# Guards ETAG_CACHE, read and updated concurrently by branch pushes, GitHub manager set-ups and batched issues.
+ETAG_CACHE_LOCK = threading.Lock()
+
 class GitHubRepoManager(AppLogger):
     """
     GitHubRepoManager Class
@@ -28,9 +83,96 @@ class GitHubRepoManager(AppLogger):
     Attributes:
         repo_owner (str): The owner of the GitHub repository (e.g., 'octocat').
         repo_name (str): The name of the GitHub repository (e.g., 'Spoon-Knife').
+        repo_url (str): The base URL of the repository REST endpoints, built once per instance.
         headers (Dict[str, str]): HTTP headers required for GitHub API authentication
                                    and content type negotiation.
     """
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Sends a GitHub API request through the shared session, retrying when GitHub rejects it
+        because of rate limiting.
+
+        Transient 5xx responses of idempotent requests are already retried by the session's
+        adapter. Rate limiting (429, or 403 for an exhausted primary rate limit) is only handled here:
+        the wait honors `Retry-After` and `X-RateLimit-Reset`, or falls back to an exponential
+        backoff with jitter.
+
+        Args:
+            method (str): The HTTP method (e.g., 'GET', 'POST').
+            url (str): The full URL of the GitHub API endpoint.
+            **kwargs (Any): Extra arguments passed to `requests.Session.request`. A `json` body
+                            is serialized once with `json_dumps_bytes` (orjson when installed).
+
+        Returns:
+            requests.Response: The last response received.
+        """
+        headers = kwargs.pop('headers', self.headers)
+        if 'json' in kwargs:
+            kwargs['data'] = json_dumps_bytes(kwargs.pop('json'))
+            headers = {**headers, 'Content-Type': 'application/json'}
+        for attempt in range(GITHUB_RATE_LIMIT_RETRIES + 1):
+            response = self.http.request(method, url, headers=headers, **kwargs)
+            if attempt == GITHUB_RATE_LIMIT_RETRIES:
+                return response
+            delay = self._rate_limit_delay(response, attempt)
+            if delay is None:
+                return response
+            self.log_warning(f"GitHub rate limit hit on {method} {url}. Retrying in {delay:.1f}s (attempt {attempt + 1}/{GITHUB_RATE_LIMIT_RETRIES}).")
+            time.sleep(delay)
+        return response
+
+    @staticmethod
+    def _error_body(response: requests.Response) -> str:
+        """
+        Returns a short description of a GitHub error response for logging.
+
+        GitHub error bodies are UTF-8 JSON objects with a 'message'; only that message is
+        returned. The body is decoded directly as UTF-8 instead of through `response.text`,
+        which runs charset detection over the body.
+
+        Args:
+            response (requests.Response): The error response.
+
+        Returns:
+            str: The error message, or the raw body if it is not a JSON object with a message.
+        """
+        content = response.content
+        try:
+            body = json_loads(content)
+            if isinstance(body, dict) and body.get('message'):
+                return body['message']
+        except ValueError:
+            pass
+        return content.decode('utf-8', errors='replace')
+
+    @staticmethod
+    def _rate_limit_delay(response: requests.Response, attempt: int) -> Optional[float]:
+        """
+        Computes how long to wait before retrying a rate-limited GitHub response.
+
+        Args:
+            response (requests.Response): The response to inspect.
+            attempt (int): The zero-based retry attempt.
+
+        Returns:
+            Optional[float]: The delay in seconds, or None if the response is not rate limited
+                             or the limit resets later than GITHUB_RETRY_MAX_DELAY.
+        """
+        if response.status_code not in (403, 429):
+            return None
+        headers = response.headers
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None and retry_after.isdigit():
+            delay = float(retry_after)
+        elif headers.get('X-RateLimit-Remaining') == '0' and headers.get('X-RateLimit-Reset', '').isdigit():
+            delay = max(0.0, int(headers['X-RateLimit-Reset']) - time.time())
+        elif response.status_code == 429:
+            delay = GITHUB_RETRY_BASE_DELAY * 2 ** attempt * (0.5 + random.random())
+        else:
+            # A 403 without rate limit headers is a permission error and is not retried.
+            return None
+        return delay if delay <= GITHUB_RETRY_MAX_DELAY else None
+
     def create_branch(self, new_branch_name, sha):
         """
         Creates a new branch in the GitHub repository from a specified SHA.
@@ -42,29 +184,127 @@ class GitHubRepoManager(AppLogger):
         Returns:
             Dict[str, Any]: The JSON response from the GitHub API,
                             containing details of the newly created reference.
+                            For a branch that already exists, GitHub's 422 error body
+                            (without a 'ref') is returned instead.
+
+        Raises:
+            RateLimited: If GitHub still rejects the request because of rate limiting.
+            GitHubAPIError: For any other GitHub API error.
         """
-        url = f'https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/git/refs'
+        url = f'{self.repo_url}/git/refs'
         data = {
             'ref': f'refs/heads/{new_branch_name}',
             'sha': sha
         }
-        response = requests.post(url, json=data, headers=self.headers)
-        return response.json()
+        response = self._request('POST', url, json=data, headers=self.headers)
+        if not response.ok:
+            error_body = self._error_body(response)
+            # GitHub answers 422 'Reference already exists' for a branch left by a previous run.
+            if response.status_code == 422 and 'Reference already exists' in error_body:
+                return self._json(response)
+            if response.status_code in (403, 429) and response.headers.get('X-RateLimit-Remaining') == '0':
+                raise RateLimited(f"GitHub rate limit exceeded while creating branch '{new_branch_name}'.", response=response)
+            raise GitHubAPIError(f"Error creating branch '{new_branch_name}': {response.status_code} {error_body}", response=response)
+        return self._json(response)
+
+
+    def check_open_pr(self, base_branch_name, head_branch_name: Optional[str] = None):
+        """
+        Checks for open pull requests targeting a specific base branch, across all result pages.
 
+        Args:
+            base_branch_name (str): The name of the base branch to check for open PRs against.
+            head_branch_name (Optional[str]): If given, only the open PR from this branch of the
+                                              repository is returned (at most one), instead of
+                                              every open PR against the base branch.
+
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries, each representing an open pull request.
+
+        Raises:
+            requests.exceptions.HTTPError: If GitHub answers with an error status code.
+        """
+        return list(self.iter_open_prs(base_branch_name, head_branch_name))
 
-    def check_open_pr(self, base_branch_name):
+    def iter_open_prs(self, base_branch_name: str, head_branch_name: Optional[str] = None) -> Iterator[Dict[str, Any]]:
         """
-        Checks for open pull requests targeting a specific base branch.
+        Yields the open pull requests targeting a base branch one at a time, following the
+        'next' page links of GitHub's pagination. Pages are only requested as the caller
+        consumes the iterator, so a search that stops at the first match reads a single page.
 
         Args:
             base_branch_name (str): The name of the base branch to check for open PRs against.
+            head_branch_name (Optional[str]): If given, only the open PR from this branch of the
+                                              repository is returned (at most one).
+
+        Yields:
+            Dict[str, Any]: Each open pull request.
+
+        Raises:
+            requests.exceptions.HTTPError: If GitHub answers with an error status code.
+        """
+        params = {'state': 'open', 'base': base_branch_name, 'per_page': 100}
+        if head_branch_name:
+            params['head'] = f'{self.repo_owner}:{head_branch_name}'
+            params['per_page'] = 1
+        url = f'{self.repo_url}/pulls?{urlencode(params)}'
+        while url:
+            pull_requests, url = self._get_page_with_etag(url)
+            yield from pull_requests
+
+    def _get_with_etag(self, url: str) -> Any:
+        """
+        Performs a conditional GET request, using the ETag of the last response for the same URL.
+
+        When the resource has not changed, GitHub answers 304 Not Modified without a body
+        (and without consuming rate limit), and the cached body is returned instead.
+
+        Args:
+            url (str): The full URL of the GitHub API resource.
 
         Returns:
-            List[Dict[str, Any]]: A list of dictionaries, each representing an open pull request.
+            Any: The decoded JSON body of the resource.
+
+        Raises:
+            requests.exceptions.HTTPError: If the response has an error status code (4xx or 5xx).
+        """
+        return self._get_page_with_etag(url)[0]
+
+    def _get_page_with_etag(self, url: str) -> Tuple[Any, Optional[str]]:
+        """
+        Performs a conditional GET request like `_get_with_etag`, also returning the URL of
+        the next result page from the response's 'Link' header.
+
+        Args:
+            url (str): The full URL of the GitHub API resource.
+
+        Returns:
+            Tuple[Any, Optional[str]]: The decoded JSON body and the next page URL (None on the last page).
+
+        Raises:
+            requests.exceptions.HTTPError: If the response has an error status code (4xx or 5xx).
         """
-        url = f'https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/pulls?state=open&base={base_branch_name}'
-        response = requests.get(url, headers=self.headers)
-        return response.json()
+        with self._etag_cache_lock:
+            cached = self._etag_cache.get(url)
+        headers = self.headers
+        if cached is not None:
+            headers = {**self.headers, 'If-None-Match': cached[0]}
+
+        response = self._request('GET', url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return cached[1], cached[2]
+        response.raise_for_status()
+
+        body = self._json(response)
+        next_url = response.links.get('next', {}).get('url')
+        etag = response.headers.get('ETag')
+        if etag:
+            with self._etag_cache_lock:
+                self._etag_cache.pop(url, None)
+                if len(self._etag_cache) >= ETAG_CACHE_MAX_ENTRIES:
+                    self._etag_cache.pop(next(iter(self._etag_cache)), None)
+                self._etag_cache[url] = (etag, body, next_url)
+        return body, next_url
 
     def create_pull_request(self, title, head_branch_name, base_branch_name, body='This PR updates the file content.', auto_merge=True, delete_branch_after_merge=True):
 
@@ -87,24 +327,27 @@ class GitHubRepoManager(AppLogger):
                                       or None if an error occurs.
         """
 
-        url = f'https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/pulls'
+        url = f'{self.repo_url}/pulls'
         data = {
             'title': title,
             'head': head_branch_name,
             'base': base_branch_name,
             'body': body
         }
+        response = None
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self._request('POST', url, headers=self.headers, json=data)
             response.raise_for_status()
-            pull_request_data = response.json()
+            pull_request_data = self._json(response)
+            # Merging the PR (e.g., with auto-merge) moves the base branch; drop its cached SHA.
+            self._sha_cache.pop(base_branch_name, None)
             self.log_info(f"Pull request created successfully: {pull_request_data['html_url']}")
 
             if auto_merge:
-                self.enable_auto_merge(pull_request_data['number'])
+                self.enable_auto_merge(pull_request_data['number'], pull_request_data.get('node_id'))
                 if delete_branch_after_merge:
                     self.log_info(f"Will attempt to delete branch '{head_branch_name}' after merge.")
-                    self._set_delete_branch_on_merge(pull_request_data['number'])
+                    self._set_delete_branch_on_merge()
 
             return pull_request_data
 
@@ -112,20 +355,35 @@ class GitHubRepoManager(AppLogger):
             self.log_error(f"Error creating pull request: {e}")
             if response is not None:
                 self.log_error(f"Response status code: {response.status_code}")
-                self.log_error(f"Response body: {response.text}")
+                self.log_error(f"Response body: {self._error_body(response)}")
             return None
 
-    def enable_auto_merge(self, pull_request_number):
+    def enable_auto_merge(self, pull_request_number, pull_request_node_id: Optional[str] = None):
         """
         Enables auto-merge for a given pull request.
 
+        With the pull request's GraphQL node ID, a single `enablePullRequestAutoMerge` mutation
+        is used. If it is not available (no node ID, or auto-merge is not allowed in the
+        repository), the pull request is merged with the REST merge endpoint instead.
+
         Args:
             pull_request_number (int): The number of the pull request.
+            pull_request_node_id (Optional[str]): The 'node_id' of the pull request, from the REST create response.
         """
-        url = f'https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/pulls/{pull_request_number}/merge'
+        if pull_request_node_id and self.graphql_auto_merge:
+            try:
+                self._graphql(ENABLE_AUTO_MERGE_MUTATION, {'pullRequestId': pull_request_node_id, 'mergeMethod': AUTO_MERGE_METHOD})
+                self.log_info(f"Auto-merge enabled for pull request #{pull_request_number}")
+                return
+            except (GitHubOperationError, requests.exceptions.RequestException) as e:
+                self.log_info(f"GraphQL auto-merge failed, falling back to the REST merge endpoint: {e}")
+                self.graphql_auto_merge = False
+
+        url = f'{self.repo_url}/pulls/{pull_request_number}/merge'
         params = {'auto_merge': True}
+        response = None
         try:
-            response = requests.put(url, headers=self.headers, params=params)
+            response = self._request('PUT', url, headers=self.headers, params=params)
             if response.status_code == 200:
                 self.log_info(f"Auto-merge enabled for pull request #{pull_request_number}")
             elif response.status_code == 405:
@@ -135,88 +393,125 @@ class GitHubRepoManager(AppLogger):
             elif response.status_code == 409:
                 self.log_error(f"Could not auto-merge pull request #{pull_request_number}. Merge conflict exists.")
             else:
-                self.log_error(f"Error enabling auto-merge for pull request #{pull_request_number}. Status code: {response.status_code}, Response: {response.text}")
+                self.log_error(f"Error enabling auto-merge for pull request #{pull_request_number}. Status code: {response.status_code}, Response: {self._error_body(response)}")
             response.raise_for_status()  # Raise for other unexpected errors
 
         except requests.exceptions.RequestException as e:
             self.log_error(f"Error enabling auto-merge for pull request #{pull_request_number}: {e}")
             if response is not None:
                 self.log_error(f"Response status code: {response.status_code}")
-                self.log_error(f"Response body: {response.text}")
+                self.log_error(f"Response body: {self._error_body(response)}")
 
 
-    def _set_delete_branch_on_merge(self, pull_request_number):
+    def _set_delete_branch_on_merge(self):
         """
-        Sets the head branch of a pull request to be deleted automatically after it is merged.
-        This uses a GitHub API preview feature.
-
-        Args:
-            pull_request_number (int): The number of the pull request.
+        Enables the repository setting that deletes head branches automatically once their pull
+        request is merged. The setting is applied once per repository and warm instance.
 
         Returns:
-            Optional[Dict[str, Any]]: The JSON response from the GitHub API, or None if an error occurs.
+            bool: True if the setting is enabled, False if it could not be changed.
         """
-        url = f'https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/pulls/{pull_request_number}/update_branch'
-        headers = self.headers.copy()
-        headers['Accept'] = 'application/vnd.github.loki-preview+json'  # Preview header for delete branch on merge
-        data = {
-            'expected_head_sha': None  # GitHub will determine the latest SHA
-        }
+        repo_key = f'{self.repo_owner}/{self.repo_name}'
+        if repo_key in REPOS_DELETING_MERGED_BRANCHES:
+            return True
         response = None
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = self._request('PATCH', self.repo_url, headers=self.headers, json={'delete_branch_on_merge': True})
             response.raise_for_status()
-            self.log_info(f"Set branch to be deleted after merge for pull request #{pull_request_number}.")
-            return response.json()
+            REPOS_DELETING_MERGED_BRANCHES.add(repo_key)
+            self.log_info(f"Enabled deleting head branches after merge for repository '{repo_key}'.")
+            return True
         except requests.exceptions.RequestException as e:
-            self.log_error(f"Error setting delete branch after merge for pull request #{pull_request_number}: {e}")
+            self.log_error(f"Error enabling delete branch on merge for repository '{repo_key}': {e}")
             if response is not None:
                 self.log_error(f"Response status code: {response.status_code}")
-                self.log_error(f"Response body: {response.text}")
-            return None
+                self.log_error(f"Response body: {self._error_body(response)}")
+            return False
 
-    def commit_file_in_branch(self, file_path, commit_message, yaml_content_encoded, new_branch_name):
+    def commit_file_in_branch(self, file_path, commit_message, yaml_content, new_branch_name):
 
         """
         Commits a file (creates or updates) in a specified branch of the repository.
 
         Handles cases where the file already exists with the same content (no error)
-        or different content (raises FileExistsError).
+        or different content (raises FileExistsError). If the file was already read in
+        this instance (its ETag is cached) and its Git blob SHA matches the new content,
+        the PUT is skipped entirely.
 
         Args:
             file_path (str): The path to the file in the repository (e.g., 'path/to/file.yaml').
             commit_message (str): The commit message for the file operation.
-            yaml_content_encoded (str): The base64 encoded content of the file.
+            yaml_content (bytes): The UTF-8 encoded content of the file. It is base64 encoded
+                                  here, as required by the Contents API.
             new_branch_name (str): The name of the branch where the file will be committed.
 
         Raises:
             requests.exceptions.RequestException: For general GitHub API request errors.
             FileExistsError: If the file exists with different content.
-            BaseException: For unexpected errors during file creation.
+            GitHubAPIError: For GitHub API errors other than an existing file (422).
         """
         try:
-            url = f'https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/contents/{file_path}'
+            url = f'{self.repo_url}/contents/{file_path}'
+            if self._is_unchanged_file(f'{url}?ref={new_branch_name}', yaml_content):
+                self.log_info(f"File '{file_path}' is unchanged in branch '{new_branch_name}'. No-op, skipping commit.")
+                return
             data = {
                 'message': commit_message,
-                'content': yaml_content_encoded,
+                'content': base64.b64encode(yaml_content).decode('ascii'),
                 'branch': new_branch_name
             }
-            response = requests.put(url, json=data, headers=self.headers)
+            response = self._request('PUT', url, json=data, headers=self.headers)
             response.raise_for_status()
             self.log_info(f"File '{file_path}' created in branch '{new_branch_name}'.")
 
         except requests.exceptions.RequestException as e:
-            self.log_info(e.response)
+            self.log_info("GitHub response: %s", e.response)
             if e.response is not None and e.response.status_code == 422:
-                self.compare_existing_file(url,new_branch_name, yaml_content_encoded, file_path, e)
+                self.compare_existing_file(url,new_branch_name, yaml_content, file_path, e)
 
             else:
-                raise requests.exceptions.RequestException(f"Error during GitHub API request: {e}") from e
-        except Exception as e:
-            raise BaseException(f"An unexpected error occurred while creating the file: {e}") from e
+                raise GitHubAPIError(f"Error during GitHub API request: {e}", response=e.response) from e
+
+
+    @staticmethod
+    def _git_blob_sha(data: bytes) -> str:
+        """
+        Computes the Git blob SHA of some content, as returned in the 'sha' of the Contents API.
+
+        Args:
+            data (bytes): The raw file content.
+
+        Returns:
+            str: The hexadecimal SHA-1 of the Git blob object.
+        """
+        return hashlib.sha1(b"blob " + str(len(data)).encode('ascii') + b"\0" + data).hexdigest()
+
+    def _is_unchanged_file(self, contents_url: str, yaml_content: bytes) -> bool:
+        """
+        Checks, without an extra full download, whether a file already has the given content.
+
+        Only files whose Contents API response is already in the ETag cache are checked, so new
+        files (the common case) cost no additional request. For cached files the conditional GET
+        usually answers 304 Not Modified.
 
+        Args:
+            contents_url (str): The Contents API URL of the file, including the '?ref=' branch.
+            yaml_content (bytes): The new content of the file.
 
-    def compare_existing_file(self, url,new_branch_name, yaml_content_encoded, file_path, e):
+        Returns:
+            bool: True if the file exists with exactly the same content.
+        """
+        with self._etag_cache_lock:
+            if contents_url not in self._etag_cache:
+                return False
+        try:
+            existing_content_data = self._get_with_etag(contents_url)
+        except requests.exceptions.RequestException:
+            # The file may have been deleted since it was cached; commit it normally.
+            return False
+        return existing_content_data.get('sha') == self._git_blob_sha(yaml_content)
+
+    def compare_existing_file(self, url,new_branch_name, yaml_content, file_path, e):
         """
         Compares the content of an existing file in a branch with new content.
 
@@ -226,7 +521,7 @@ class GitHubRepoManager(AppLogger):
         Args:
             url (str): The base URL for the file content API (e.g., '.../contents/file_path').
             new_branch_name (str): The name of the branch where the file exists.
-            yaml_content_encoded (str): The base64 encoded new content to compare.
+            yaml_content (bytes): The UTF-8 encoded new content to compare.
             file_path (str): The path to the file in the repository.
             original_exception (requests.exceptions.RequestException): The original exception
                                                                         that triggered this comparison.
@@ -238,15 +533,15 @@ class GitHubRepoManager(AppLogger):
             FileExistsError: If the file exists with different content.
         """
         try:
-            existing_content_response = requests.get(
-                f'{url}?ref={new_branch_name}',
-                headers=self.headers
-            )
-            existing_content_response.raise_for_status()
-            existing_content_data = existing_content_response.json()
-            existing_content_decoded = base64.b64decode(existing_content_data['content']).decode('utf-8')
-
-            if existing_content_decoded.strip() == base64.b64decode(yaml_content_encoded).decode('utf-8').strip():
+            existing_content_data = self._get_with_etag(f'{url}?ref={new_branch_name}')
+            # GitHub returns the content base64 encoded with embedded newlines. Identical files are
+            # detected on the base64 forms; only differing ones are decoded to ignore surrounding whitespace.
+            existing_content_b64 = ''.join(existing_content_data['content'].split()).encode('ascii')
+            same_content = (existing_content_data.get('sha') == self._git_blob_sha(yaml_content) or
+                            existing_content_b64 == base64.b64encode(yaml_content) or
+                            base64.b64decode(existing_content_b64).strip() == yaml_content.strip())
+
+            if same_content:
                 self.log_info(f"File '{file_path}' already exists with the same content in branch '{new_branch_name}'. No error raised.")
                 return existing_content_data  # Return existing file info
             else:
@@ -254,61 +549,268 @@ class GitHubRepoManager(AppLogger):
         except requests.exceptions.RequestException as get_error:
             self.log_info(f"Warning: Could not retrieve existing file content to compare: {get_error}")
             # raise FileExistsError(f"File '{file_path}' already exists in branch '{new_branch_name}'. Could not verify if content is the same.") from e
-            return yaml_content_encoded
+            return yaml_content
 
-    def _commit_new_file(self, file_path: str, commit_message: str, yaml_content_encoded: str, new_branch_name: str):
+    def _commit_files_as_tree(self, new_branch_name: str, files: List[YamlFile]) -> None:
         """
-        Orchestrates the process of committing a new file:
-        1. Gets the latest SHA of the base branch.
-        2. Creates a new branch from the base branch.
-        3. Commits the file to the newly created branch.
+        Commits several files to a branch as a single Git commit using the Git Data API:
+        1. Creates the branch from the base branch (once per branch and handler).
+        2. Commits every file on top of the branch head with a single GraphQL
+           `createCommitOnBranch` mutation.
+        3. If the mutation is not available, creates one tree and one commit with the
+           REST Git Data API and moves the branch ref to it instead.
+
+        This takes a constant number of API requests per branch instead of one
+        Contents API request per file. Files that already exist in the tree of the branch
+        head are checked first with `_skip_existing_files`, like `compare_existing_file` does
+        for a single file. If the branch already existed on GitHub before this run, files
+        are committed one by one with `commit_file_in_branch` instead.
 
         Args:
-            file_path (str): The path where the file will be created/updated.
-            commit_message (str): The commit message.
-            yaml_content_encoded (str): The base64 encoded content of the file.
-            new_branch_name (str): The name of the new branch to create and commit to.
+            new_branch_name (str): The name of the branch to create and commit to.
+            files (List[YamlFile]): The files to commit, each with a `path`,
+                                    a `commit_message` and the UTF-8 encoded `file` content (bytes).
 
         Raises:
-            requests.exceptions.RequestException: For GitHub API errors.
-            yaml.YAMLError: For errors during YAML serialization (though YAML is already encoded here).
-            KeyError: For issues accessing JSON data.
-            Exception: For any other unexpected errors.
-        """        
+            GitHubAPIError: For GitHub API errors (BranchNotFound, RateLimited and other typed
+                            errors are propagated unchanged).
+            FileExistsError: If a file already exists in the branch with different content.
+            GitHubOperationError: If GitHub rejects the commit, or for unexpected errors
+                                  (e.g., missing keys in a GitHub response).
+        """
         try:
-            self.log_info("Getting the SHA of the base branch...")
-            base_sha = self.get_latest_sha_from_branch(self.branch_name)
-            self.log_info(f"Base branch SHA: {base_sha[:7]}...")
-
-            self.log_info(f"Creating a new branch '{new_branch_name}' from '{self.branch_name}'...")
-            self.create_branch(new_branch_name, base_sha)
-            self.log_info(f"Branch '{new_branch_name}' created successfully.")
-
-            self.log_info(f"Committing the new file to branch '{new_branch_name}'...")
-            self.commit_file_in_branch(file_path, commit_message, yaml_content_encoded, new_branch_name)
-            self.log_info(f"File '{file_path}' committed successfully to '{new_branch_name}'.")
-
+            head_sha = self._ensure_branch(new_branch_name)
+            if head_sha is None:
+                self.log_info(f"Branch '{new_branch_name}' already existed. Committing {len(files)} file(s) one by one.")
+                for file_data in files:
+                    self.commit_file_in_branch(file_data.path, file_data.commit_message, file_data.file, new_branch_name)
+                return
+
+            files = self._skip_existing_files(new_branch_name, head_sha, files)
+            if not files:
+                self.log_info(f"Every file already exists with the same content in '{new_branch_name}'. No-op, skipping commit.")
+                return
+
+            commit_sha = None
+            commit_api = "GraphQL"
+            if self.graphql_commits:
+                try:
+                    commit_sha = self._commit_tree_with_graphql(new_branch_name, head_sha, files)
+                except (GitHubOperationError, requests.exceptions.RequestException) as e:
+                    # Fall back to the Git Data API (e.g., GitHub Enterprise servers without the mutation,
+                    # or an HTTP error of the GraphQL endpoint).
+                    self.log_info(f"GraphQL commit failed, falling back to the REST Git Data API: {e}")
+                    self.graphql_commits = False
+            if commit_sha is None:
+                commit_api = "REST Git Data API"
+                commit_sha = self._commit_tree_with_rest(new_branch_name, head_sha, files)
+
+            self.branch_heads[new_branch_name] = commit_sha
+            self.log_info(f"Committed {len(files)} file(s) to '{new_branch_name}' in a single commit ({commit_sha[:7]}) with the {commit_api}.")
+
+        except (GitHubAPIError, GitHubOperationError, FileExistsError):
+            # Typed errors are propagated unchanged, so that callers can still tell them apart.
+            raise
         except requests.exceptions.RequestException as e:
-            error_message = f"Error during GitHub API request (file commit): {e}"
-            self.log_info(error_message)
-            raise requests.exceptions.RequestException(error_message) from e
-        except yaml.YAMLError as e:
-            error_message = f"Error serializing YAML data: {e}"
-            self.log_info(error_message)
-            raise yaml.YAMLError(error_message) from e
+            error_message = f"Error during GitHub API request (tree commit): {e}"
+            self.log_error(error_message)
+            raise GitHubAPIError(error_message, response=e.response) from e
         except KeyError as e:
-            error_message = f"Error accessing JSON data (file commit): {e}"
-            self.log_info(error_message)
-            raise KeyError(error_message) from e
+            error_message = f"Error accessing JSON data (tree commit): {e}"
+            self.log_error(error_message)
+            raise GitHubOperationError(error_message) from e
         except Exception as e:
-            error_message = f"An unexpected error occurred during file commit: {e}"
-            self.log_info(error_message)
-            raise Exception(error_message) from e
+            error_message = f"An unexpected error occurred during tree commit: {e}"
+            self.log_error(error_message)
+            raise GitHubOperationError(error_message) from e
+
+    def _skip_existing_files(self, new_branch_name: str, head_sha: str, files: List[YamlFile]) -> List[YamlFile]:
+        """
+        Checks the files to commit against the tree of the branch head, which a tree commit
+        would otherwise silently overwrite. The rules of `compare_existing_file` apply: a file
+        that exists with the same content is skipped, one with different content is rejected.
+
+        The whole tree is read with a single recursive request. Only files whose blob SHA
+        differs are downloaded, to compare them without their surrounding whitespace.
+
+        Args:
+            new_branch_name (str): The name of the branch to commit to (for messages).
+            head_sha (str): The SHA of the branch head commit.
+            files (List[YamlFile]): The files to commit (see `_commit_files_as_tree`).
+
+        Returns:
+            List[YamlFile]: The files that do not exist yet in the branch.
+
+        Raises:
+            FileExistsError: If a file exists in the branch with different content.
+            requests.exceptions.HTTPError: If GitHub answers with an error status code.
+        """
+        tree = self._get_with_etag(f'{self.repo_url}/git/trees/{head_sha}?recursive=1')
+        if tree.get('truncated'):
+            # Very large trees are not listed completely; fall back to one Contents API check per file.
+            existing_blobs = {}
+            for file_data in files:
+                try:
+                    existing_blobs[file_data.path] = self._get_with_etag(f'{self.repo_url}/contents/{file_data.path}?ref={head_sha}')['sha']
+                except requests.exceptions.HTTPError as e:
+                    if e.response is None or e.response.status_code != 404:
+                        raise
+        else:
+            existing_blobs = {entry['path']: entry['sha'] for entry in tree['tree'] if entry.get('type') == 'blob'}
+
+        new_files = []
+        for file_data in files:
+            existing_sha = existing_blobs.get(file_data.path)
+            if existing_sha is None:
+                new_files.append(file_data)
+                continue
+            if existing_sha != self._git_blob_sha(file_data.file):
+                blob = self._get_with_etag(f'{self.repo_url}/git/blobs/{existing_sha}')
+                if base64.b64decode(''.join(blob['content'].split())).strip() != file_data.file.strip():
+                    raise FileExistsError(f"File '{file_data.path}' already exists in branch '{new_branch_name}' with different content.")
+            self.log_info(f"File '{file_data.path}' already exists with the same content in branch '{new_branch_name}'. No error raised.")
+        return new_files
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Executes a GitHub GraphQL query or mutation.
+
+        Args:
+            query (str): The GraphQL document.
+            variables (Dict[str, Any]): The variables of the document.
+
+        Returns:
+            Dict[str, Any]: The 'data' member of the GraphQL response.
+
+        Raises:
+            requests.exceptions.RequestException: For HTTP errors of the GraphQL endpoint.
+            GitHubOperationError: If the GraphQL response reports errors.
+        """
+        response = self._request('POST', GITHUB_GRAPHQL_URL, json={'query': query, 'variables': variables}, headers=self.headers)
+        response.raise_for_status()
+        result = self._json(response)
+        if result.get('errors') or not result.get('data'):
+            messages = "; ".join(error.get('message', str(error)) for error in result.get('errors') or [])
+            raise GitHubOperationError(f"GitHub GraphQL request failed: {messages or 'empty response'}", details=result)
+        return result['data']
+
+    def _commit_tree_with_graphql(self, new_branch_name: str, head_sha: str, files: List[YamlFile]) -> str:
+        """
+        Commits every file to the branch with a single GraphQL `createCommitOnBranch` mutation.
+
+        Args:
+            new_branch_name (str): The name of the (existing) branch to commit to.
+            head_sha (str): The expected SHA of the branch head; GitHub rejects the commit if it moved.
+            files (List[YamlFile]): The files to commit (see `_commit_files_as_tree`).
+
+        Returns:
+            str: The SHA of the new commit.
+
+        Raises:
+            GitHubOperationError: If GitHub rejects the mutation.
+        """
+        headline, *body = [file_data.commit_message for file_data in files]
+        commit_input = {
+            'branch': {
+                'repositoryNameWithOwner': f'{self.repo_owner}/{self.repo_name}',
+                'branchName': new_branch_name
+            },
+            'message': {'headline': headline, 'body': "\n".join(body)},
+            'fileChanges': {
+                'additions': [
+                    {'path': file_data.path, 'contents': base64.b64encode(file_data.file).decode('ascii')}
+                    for file_data in files
+                ]
+            },
+            'expectedHeadOid': head_sha
+        }
+        data = self._graphql(CREATE_COMMIT_ON_BRANCH_MUTATION, {'input': commit_input})
+        return data['createCommitOnBranch']['commit']['oid']
+
+    def _commit_tree_with_rest(self, new_branch_name: str, head_sha: str, files: List[YamlFile]) -> str:
+        """
+        Commits every file to the branch as one commit with the REST Git Data API
+        (tree, commit and ref update requests).
+
+        Args:
+            new_branch_name (str): The name of the (existing) branch to commit to.
+            head_sha (str): The SHA of the branch head, used as the parent commit.
+            files (List[YamlFile]): The files to commit (see `_commit_files_as_tree`).
+
+        Returns:
+            str: The SHA of the new commit.
+
+        Raises:
+            requests.exceptions.RequestException: For GitHub API errors.
+        """
+        base_url = f'{self.repo_url}/git'
+
+        # Resolve the tree of the current branch head, used as the base of the new tree.
+        response = self._request('GET', f'{base_url}/commits/{head_sha}', headers=self.headers)
+        response.raise_for_status()
+        base_tree_sha = self._json(response)['tree']['sha']
+
+        # Blobs are created implicitly from the inline content of each tree entry.
+        tree = [
+            {
+                'path': file_data.path,
+                'mode': '100644',
+                'type': 'blob',
+                'content': file_data.file.decode('utf-8')
+            }
+            for file_data in files
+        ]
+        response = self._request('POST', f'{base_url}/trees', json={'base_tree': base_tree_sha, 'tree': tree}, headers=self.headers)
+        response.raise_for_status()
+        tree_sha = self._json(response)['sha']
+
+        commit_message = "\n".join(file_data.commit_message for file_data in files)
+        response = self._request(
+            'POST', f'{base_url}/commits',
+            json={'message': commit_message, 'tree': tree_sha, 'parents': [head_sha]},
+            headers=self.headers
+        )
+        response.raise_for_status()
+        commit_sha = self._json(response)['sha']
+
+        response = self._request('PATCH', f'{base_url}/refs/heads/{new_branch_name}', json={'sha': commit_sha}, headers=self.headers)
+        response.raise_for_status()
+        return commit_sha
+
+    def _ensure_branch(self, new_branch_name: str) -> Optional[str]:
+        """
+        Creates a branch from the base branch unless this handler already created it.
+
+        Args:
+            new_branch_name (str): The name of the branch to create.
+
+        Returns:
+            Optional[str]: The SHA of the branch head, or None if the branch already
+                           existed on GitHub before this handler tried to create it.
+
+        Raises:
+            GitHubAPIError: If the branch cannot be created for any other reason.
+        """
+        if new_branch_name in self.branch_heads:
+            return self.branch_heads[new_branch_name]
+
+        self.log_info("Getting the SHA of the base branch...")
+        base_sha = self.get_latest_sha_from_branch(self.branch_name)
+        self.log_info(f"Creating a new branch '{new_branch_name}' from '{self.branch_name}'...")
+        created_ref = self.create_branch(new_branch_name, base_sha)
+        if created_ref.get('ref') != f'refs/heads/{new_branch_name}':
+            # Only a 422 'Reference already exists' gets here; other errors are raised by `create_branch`.
+            self.branch_heads[new_branch_name] = None
+            return None
+        self.branch_heads[new_branch_name] = base_sha
+        self.log_info(f"Branch '{new_branch_name}' created successfully.")
+        return base_sha
 
     
     def get_latest_sha_from_branch(self,branch_name):
         """
         Retrieves the SHA of the latest commit on a specified branch.
+        The SHA is reused for BRANCH_SHA_CACHE_TTL seconds without another request.
 
         Args:
             branch_name (str): The name of the branch (e.g., 'main', 'develop').
@@ -317,18 +819,27 @@ class GitHubRepoManager(AppLogger):
             str: The SHA of the latest commit on the branch.
 
         Raises:
-            BaseException: If there's an error retrieving the SHA, potentially indicating
-                           the branch does not exist or an API issue.
+            BranchNotFound: If the branch does not exist.
+            RateLimited: If GitHub still rejects the request because of rate limiting.
+            GitHubAPIError: For any other GitHub API error.
         """
-        try:
-            url = f'https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/git/refs/heads/{branch_name}'
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            base_branch_data = response.json()
-            return base_branch_data['object']['sha']
+        cached = self._sha_cache.get(branch_name)
+        if cached is not None and time.monotonic() - cached[0] < BRANCH_SHA_CACHE_TTL:
+            return cached[1]
 
-        except Exception as e: 
-            raise BaseException(f"Check if file exist")
+        url = f'{self.repo_url}/git/refs/heads/{branch_name}'
+        try:
+            base_branch_data = self._get_with_etag(url)
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code == 404:
+                raise BranchNotFound(f"Branch '{branch_name}' not found in '{self.repo_owner}/{self.repo_name}'.", response=e.response) from e
+            if status_code in (403, 429) and e.response.headers.get('X-RateLimit-Remaining') == '0':
+                raise RateLimited(f"GitHub rate limit exceeded while reading branch '{branch_name}'.", response=e.response) from e
+            raise GitHubAPIError(f"Error retrieving the latest SHA of branch '{branch_name}': {e}", response=e.response) from e
+        sha = base_branch_data['object']['sha']
+        self._sha_cache[branch_name] = (time.monotonic(), sha)
+        return sha
 
 
 
@@ -346,7 +857,7 @@ class GitHubHandler(GitHubRepoManager):
     creation logic. It leverages the methods provided by GitHubRepoManager.
     """
 
-    def __init__(self, token, repo_owner, repo_name):
+    def __init__(self, token: str, repo_owner: str, repo_name: str):
 
         """
         Initializes the GitHubHandler, setting up GitHub authentication
@@ -363,12 +874,20 @@ class GitHubHandler(GitHubRepoManager):
         self.token = token
         self.repo_owner = repo_owner
         self.repo_name = repo_name
+        self.repo_url = f'https://api.github.com/repos/{repo_owner}/{repo_name}' # Base URL of the repository REST endpoints.
         self.headers = {
             'Authorization': f'token {self.token}',
             'Accept': 'application/vnd.github.v3+json'
         }
         self.branch_name = BRANCH_NAME
         self.pr_list = []
+        self.pr_list_lock = threading.Lock() # Guards pr_list, appended to by concurrent branch pushes.
+        self.branch_heads = {} # Head SHA of each branch after the last tree commit (None if the branch pre-existed).
+        self.graphql_commits = True # Whether to commit with GraphQL; disabled after the first GraphQL failure.
+        self.graphql_auto_merge = True # Whether to enable auto-merge with GraphQL; disabled after the first GraphQL failure.
+        self._sha_cache: Dict[str, Tuple[float, str]] = {} # Latest SHA of each branch with the (monotonic) time it was read.
+        self._etag_cache = ETAG_CACHE # ETag cache for conditional GET requests, shared across handlers.
+        self._etag_cache_lock = ETAG_CACHE_LOCK # Guards every access to the shared ETag cache.
         
 
     def _create_pull_request_logic(self, pr_title: str, body: str, auto_merge: bool, new_branch_name: str) -> Optional[str]:
@@ -404,7 +923,8 @@ class GitHubHandler(GitHubRepoManager):
             if pr_response and 'html_url' in pr_response:
                 pr_url = pr_response['html_url']
                 self.log_info(f"Pull request created: {pr_url}")
-                self.pr_list.append(pr_url)
+                with self.pr_list_lock:
+                    self.pr_list.append(pr_url)
                 return pr_url
             else:
                 error_message = "Failed to create pull request or received an empty response."
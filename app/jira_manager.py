@@ -25,8 +25,8 @@ class JiraCommenterAndStatusUpdater(AppLogger):
                             such as issue key, folder name, project type, etc.
                             This is expected to be passed during initialization
                             or set as an instance variable.
-        dw_env_project_name_list (list): A list of project names for different
-                                         Datawave environments.
+        dw_env_project_list (list): The (environment, project name) pairs of the
+                                    Datawave environment projects.
     """
 
     def prepare_ticket_description_for_commenting(self, comment_type: str = 'project') -> str:
@@ -45,33 +45,25 @@ class JiraCommenterAndStatusUpdater(AppLogger):
             str: A multi-line string containing the formatted description,
                  ready to be added as a Jira comment.
         """
-        issue_key = self.config_data.get('ISSUE_KEY', 'N/A')
-        folder_name = self.config_data.get('FOLDER_NAME', 'N/A')
-        project_type = self.config_data.get('PROJECT_TYPE', 'N/A')
-        project_type_folder = self.config_data.get('PROJECT_TYPE_FOLDER', 'N/A')
-        data_security = self.config_data.get('DATASECURITY', 'N/A')
+        config_data = self.config_data
 
         description_parts = [
-            f"*Jira Issue:* 🔑 {issue_key}",
-            f"*Target Folder:* 📂 {folder_name}",
-            f"*Project Type:* 🏷️ {project_type}",
-            f"*Project Type Folder:* 🗂️ {project_type_folder}"]
+            f"*Jira Issue:* 🔑 {config_data.get('ISSUE_KEY', 'N/A')}",
+            f"*Target Folder:* 📂 {config_data.get('FOLDER_NAME', 'N/A')}",
+            f"*Project Type:* 🏷️ {config_data.get('PROJECT_TYPE', 'N/A')}",
+            f"*Project Type Folder:* 🗂️ {config_data.get('PROJECT_TYPE_FOLDER', 'N/A')}"]
 
         if comment_type=='project':
-            description_parts.extend([
-                f"*Data Security Level:* {data_security} 🛡️",
+            description_parts += [
+                f"*Data Security Level:* {config_data.get('DATASECURITY', 'N/A')} 🛡️",
                 "*Target Environments:* 🌐",
-            ])
-
-            environment_details = []
-            for dw_env_project_name in self.dw_env_project_name_list:
-                env = ResourceValidator.extract_dw_environment(dw_env_project_name) 
-                budget_key = f"BUDGET_{env.upper()}"
-                budget = self.config_data.get(budget_key, 'N/A')
-                environment_details.append(f"- *{env.upper()}*: Name: `{dw_env_project_name}`, Budget (euros): `{budget}`")
-
-
-            description_parts.extend(environment_details)
+            ]
+            # One line per Datawave environment project, with the budget of its environment ("BUDGET_<ENV>").
+            description_parts += [
+                f"- *{env}*: Name: `{dw_env_project_name}`, Budget (euros): `{config_data.get(f'BUDGET_{env}', 'N/A')}`"
+                for environment, dw_env_project_name in self.dw_env_project_list
+                for env in (environment.upper(),)
+            ]
 
         return "\n".join(description_parts)
 
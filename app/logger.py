@@ -1,19 +1,135 @@
 import os
+import sys
 import traceback
 import json 
+import logging
+from functools import partial, cache
 from google.cloud import logging as cloud_logging
+from google.cloud.logging_v2.handlers import CloudLoggingHandler
+from google.cloud.logging_v2.handlers.transports import BackgroundThreadTransport
 from requests.auth import HTTPBasicAuth
-import traceback
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import time
 import requests
-from typing import  Optional
+from enum import Enum
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import  Any, Optional, Dict, Tuple, List
+from app.serialization import json_loads, json_dumps_bytes
  
 
+def get_env_flag(name: str, default: bool = False) -> bool:
+    """
+    Reads a boolean flag from an environment variable.
+
+    Environment variables are always strings, so values such as "False" or "0"
+    would otherwise be truthy. Only "1", "true", "yes" and "on" (case-insensitive)
+    are treated as True.
+
+    Args:
+        name (str): The name of the environment variable.
+        default (bool): The value returned when the variable is not set.
+
+    Returns:
+        bool: The parsed flag value.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def get_env_float(name: str, default: float) -> float:
+    """
+    Reads a number from an environment variable.
+
+    A malformed value is logged and replaced by the default, so that a misconfigured
+    variable does not prevent the module reading it from being imported.
+
+    Args:
+        name (str): The name of the environment variable.
+        default (float): The value returned when the variable is not set or not a number.
+
+    Returns:
+        float: The parsed value.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logging.warning("Invalid number '%s' for environment variable %s. Using the default: %s.", value, name, default)
+        return default
+
+
 # Define the logging name for Google Cloud Logging.
 # Read from environment variable LOGGING_NAME, with a default fallback.
 logging_name: str = os.getenv('LOGGING_NAME', 'medium-jira-github-automation-func')
 
-# Initialize the Google Cloud Logging client.
-logging_client = cloud_logging.Client()
+# Log entries are buffered and written to Cloud Logging in batches by a background thread,
+# instead of one blocking write RPC per entry on the request path.
+LOG_BATCH_SIZE: int = 50 # Maximum number of entries per write RPC.
+LOG_MAX_LATENCY: float = 1.0 # Seconds the background thread waits to fill a batch.
+
+
+@cache
+def get_logging_client() -> cloud_logging.Client:
+    """
+    Returns the Google Cloud Logging client, creating it on first use.
+
+    Building the client sets up its gRPC channel, so it is deferred out of module import
+    and shared by the whole (warm) function instance.
+
+    Returns:
+        cloud_logging.Client: The shared Cloud Logging client.
+    """
+    return cloud_logging.Client()
+
+
+@cache
+def get_cloud_logging_handler() -> CloudLoggingHandler:
+    """
+    Returns the shared batching Cloud Logging handler, creating it on first use.
+
+    Returns:
+        CloudLoggingHandler: The handler writing entries through a background thread.
+    """
+    return CloudLoggingHandler(
+        get_logging_client(),
+        name=logging_name,
+        transport=partial(BackgroundThreadTransport, batch_size=LOG_BATCH_SIZE, max_latency=LOG_MAX_LATENCY),
+    )
+
+
+@cache
+def get_app_logger() -> logging.Logger:
+    """
+    Returns the standard library logger shared by every AppLogger, writing through the
+    batching handler. It is configured once, on first use.
+
+    Returns:
+        logging.Logger: The shared application logger.
+    """
+    app_logger = logging.getLogger(logging_name)
+    app_logger.setLevel(logging.DEBUG)
+    app_logger.addHandler(get_cloud_logging_handler())
+    app_logger.propagate = False
+    return app_logger
+
+
+def flush_logs() -> None:
+    """
+    Writes all buffered log entries to Cloud Logging.
+    Called at the end of each webhook invocation, since the instance may be throttled
+    (and the background thread paused) once the response has been returned.
+    Nothing is done if no entry was logged yet (the handler was never created).
+    """
+    if get_cloud_logging_handler.cache_info().currsize:
+        get_cloud_logging_handler().flush()
+
+# Enables DEBUG level messages (log_debug). When disabled, they are dropped before any formatting.
+DEBUG_LOGGING: bool = get_env_flag('DEBUG', False)
 
 # Jira authentication details.
 # These credentials are now read from environment variables for security.
@@ -21,148 +137,354 @@ JIRA_USER: str = os.getenv('JIRA_USER', "") # IMPORTANT: Replace with actual USE
 JIRA_TOKEN: str = os.getenv('JIRA_TOKEN', "") # IMPORTANT: Replace with actual token or ensure env var is set
 JIRA_SERVER: str = os.getenv('JIRA_SERVER',  "https://NAME.atlassian.net" ) # IMPORTANT: Replace with actual Jira server URL
 
+# Jira authentication and headers, built once at import and shared by every AppLogger (never mutated).
+JIRA_AUTH: HTTPBasicAuth = HTTPBasicAuth(JIRA_USER, JIRA_TOKEN)
+JIRA_HEADERS: Dict[str, str] = {"Accept": "application/json"}
+# Headers of requests with a JSON body, serialized by `AppLogger._post_json`.
+JIRA_JSON_HEADERS: Dict[str, str] = {**JIRA_HEADERS, "Content-Type": "application/json"}
+
+
+# Transport-level retries of HTTP calls to Jira and GitHub, with exponential backoff
+# (0s, 1s, 2s, 4s, ... between attempts; Retry-After is honored when present).
+HTTP_RETRY_TOTAL: int = 5
+HTTP_RETRY_BACKOFF_FACTOR: float = 0.5
+# Rate limiting (429) is not retried here: GitHub calls handle it in `GitHubRepoManager._request`
+# (honoring Retry-After), and retrying in both layers would multiply the attempts.
+HTTP_RETRY_STATUSES: Tuple[int, ...] = (500, 502, 503, 504)
+
+
+def create_http_session() -> requests.Session:
+    """
+    Creates a requests Session with a pooled HTTPS adapter.
+
+    Connections (and their TLS handshakes) are kept alive and reused across calls.
+    Idempotent requests are retried with exponential backoff on transient server errors (5xx).
+    Non-idempotent requests (e.g. POST) are never replayed on an error status, so a comment
+    or a pull request is never created twice.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=HTTP_RETRY_TOTAL,
+        backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries))
+    return session
+
+
+# HTTP session shared by all Jira and GitHub API calls of a (warm) function instance.
+http_session: requests.Session = create_http_session()
+
+# Seconds during which a Jira transition ID is reused without listing the issue transitions again.
+TRANSITION_CACHE_TTL: float = 300.0
+
+# Jira transition IDs keyed by (project key, transition name), with the (monotonic) time they were read.
+# Shared by all AppLogger instances of a (warm) function instance.
+TRANSITION_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+# Background listings of Jira transitions started by `prefetch_transitions`, keyed by project key.
+TRANSITION_PREFETCHES: Dict[str, Future] = {}
+TRANSITION_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jira-transitions")
 
 
 
 
+
+def format_active_traceback() -> str:
+    """
+    Formats the traceback of the exception currently being handled, if any.
+
+    Outside of an `except` block there is nothing to format, and `traceback.format_exc()`
+    would only produce "NoneType: None" at the cost of building the string.
+
+    Returns:
+        str: The traceback prefixed with a newline, or an empty string when no exception is active.
+    """
+    if sys.exc_info()[0] is None:
+        return ""
+    return f"\n{traceback.format_exc()}"
+
+
+class CommentType(str, Enum):
+    """
+    Types of Jira comments posted by the application. Each type has a fixed prefix
+    (see COMMENT_PREFIXES). Members compare equal to their plain string values
+    ("info", "error", "manual"), so string callers keep working.
+    """
+    INFO = "info"
+    ERROR = "error"
+    MANUAL = "manual"
+
+
+# Prefix prepended to the comment text for each comment type, formatted once at import time.
+COMMENT_PREFIXES = {
+    CommentType.ERROR: "❌[ERROR]: ",
+    CommentType.INFO: "✅[INFO]: ",
+    CommentType.MANUAL: "🧑‍🔧[MANUAL APPROVAL]: ",
+}
+
+
 class AppLogger():
     """
     AppLogger Class
 
     This class provides a centralized logging mechanism for the application,
-    utilizing Google Cloud Logging. It supports logging messages at INFO,
-    ERROR, and WARNING levels.
+    utilizing Google Cloud Logging through a batching, background-thread handler.
+    It supports logging messages at DEBUG, INFO, ERROR, and WARNING levels.
 
     It also encapsulates Jira connection details and provides methods
     for interacting with the Jira API, such as adding comments and
     changing issue statuses.
 
     Attributes:
-        logger (google.cloud.logging.Logger): The logger instance for Cloud Logging.
+        logger (logging.Logger): The shared logger writing to Cloud Logging.
         jira_url (str): The base URL of the Jira instance.
         auth (HTTPBasicAuth): Basic authentication object for Jira API requests.
         headers (dict): HTTP headers for Jira API requests, specifying JSON content.
     """
+    # Slots keep the shared connection attributes out of a per-instance __dict__. Subclasses that
+    # do not declare their own __slots__ still get a __dict__ for their attributes.
+    __slots__ = ("logger", "http", "jira_url", "auth", "headers", "json_headers")
 
     def __init__(self):
 
         """
-        Initializes the AppLogger with a Google Cloud Logger instance
+        Initializes the AppLogger with the shared Cloud Logging logger
         and Jira connection parameters.
         """
-        self.logger = logging_client.logger(logging_name)
+        self.logger = get_app_logger()
+        self.http = http_session # Shared, connection-pooled HTTP session for Jira and GitHub API calls.
 
         # Jira Connection details.
         self.jira_url = JIRA_SERVER
-        self.auth =  HTTPBasicAuth(JIRA_USER, JIRA_TOKEN)
-        self.headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        self.auth = JIRA_AUTH
+        self.headers = JIRA_HEADERS
+        self.json_headers = JIRA_JSON_HEADERS
 
-    def log_info(self, message: str) -> None:
+    @staticmethod
+    def _json(response: requests.Response) -> Any:
+        """
+        Decodes the JSON body of an HTTP response with `json_loads` (orjson when installed)
+        instead of the standard library parser used by `requests.Response.json()`.
+
+        Args:
+            response (requests.Response): The HTTP response.
+
+        Returns:
+            Any: The decoded JSON body.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return json_loads(response.content)
+
+    @staticmethod
+    def _error_response_text(error: requests.exceptions.RequestException) -> str:
+        """
+        Returns the body of the HTTP response attached to a requests exception.
+
+        Connection errors and timeouts are raised before any response exists, so the
+        `response` local of the caller may be unbound; the exception's own (possibly None)
+        response is used instead.
+
+        Args:
+            error (requests.exceptions.RequestException): The exception raised by requests.
+
+        Returns:
+            str: The response body, or an empty string if no response was received.
+        """
+        return getattr(getattr(error, 'response', None), 'text', '')
+
+    def _post_json(self, url: str, payload: Any) -> requests.Response:
+        """
+        POSTs a JSON body to the Jira API, serialized with `json_dumps_bytes` (orjson when installed)
+        instead of the standard library encoder used for requests' `json=` argument.
+
+        Args:
+            url (str): The full URL of the Jira API endpoint.
+            payload (Any): The JSON-serializable request body.
+
+        Returns:
+            requests.Response: The HTTP response.
+        """
+        return self.http.post(url, auth=self.auth, headers=self.json_headers, data=json_dumps_bytes(payload))
+
+    def log_debug(self, message: str, *args: Any) -> None:
+        """
+        Log a DEBUG level message.
+
+        The message is only formatted (with %-style `args`) and sent when DEBUG_LOGGING
+        is enabled, so verbose per-field logging costs nothing in production.
+
+        Args:
+            message (str): The debug message to log, optionally with %-style placeholders.
+            *args (Any): Values for the placeholders in `message`.
+
+        """
+        if DEBUG_LOGGING:
+            self.logger.debug(f"[DEBUG] {message % args if args else message}")
+
+    def log_info(self, message: str, *args: Any) -> None:
         """
         Log an INFO level message.
-        
+
+        %-style `args` are handed to the logging module, which only formats the message
+        when a handler actually emits it (e.g., large YAML documents are not stringified
+        when INFO is filtered out).
+
         Args:
-            message (str): The informational message to log.
+            message (str): The informational message to log, optionally with %-style placeholders.
+            *args (Any): Values for the placeholders in `message`.
 
         """
-        self.logger.log_text(f"[INFO] {message}", severity='INFO')
+        self.logger.info("[INFO] " + message, *args)
 
-    def log_error(self, message: str) -> None:
+    def log_error(self, message: str, *args: Any) -> None:
         """
         Log an ERROR level message.
         
         Args:
-            message (str): The error message to log.
+            message (str): The error message to log, optionally with %-style placeholders.
+            *args (Any): Values for the placeholders in `message`.
 
         """
-        self.logger.log_text(f"[ERROR] {message}:\n{traceback.format_exc()}", severity='ERROR')
+        # Format before appending the traceback, which may itself contain '%' characters.
+        self.logger.error(f"[ERROR] {message % args if args else message}{format_active_traceback()}")
 
-    def log_warning(self, message: str) -> None:
+    def log_warning(self, message: str, *args: Any) -> None:
         """
         Log a WARNING level message.
         
         Args:
-            message (str): The warning message to log.
+            message (str): The warning message to log, optionally with %-style placeholders.
+            *args (Any): Values for the placeholders in `message`.
         
         Returns:
             None
         """
-        self.logger.log_text(f"[WARNING] {message}:\n{traceback.format_exc()}", severity='WARNING')
+        self.logger.warning(f"[WARNING] {message % args if args else message}{format_active_traceback()}")
 
-    def add_comment_to_jira_issue(self, jira_id: str, comment_text: str = "Testing", comment_type="info") -> bool:
+    def add_comment_to_jira_issue(self, jira_id: str, comment_text: str = "Testing", comment_type: CommentType = CommentType.INFO) -> bool:
         """
         Adds a comment to an existing Jira issue.
 
         Args:
             comment_text (str): The text of the comment you want to add.
+            comment_type (CommentType): The type of the comment, which selects its prefix.
 
         """
-        if comment_type == "error": 
-            comment_text = f"❌[ERROR]: {comment_text}"
-        elif comment_type == "info": 
-            comment_text = f"✅[INFO]: {comment_text}"
-        elif comment_type == "manual": 
-            comment_text = f"🧑‍🔧[MANUAL APPROVAL]: {comment_text}"
+        comment_text = f"{COMMENT_PREFIXES.get(comment_type, '')}{comment_text}"
 
         #  The base URL of Jira instance (e.g., "https://bip-xtech.atlassian.net")
         self.log_info(f"Commenting '{jira_id}' on '{self.jira_url}': {comment_text}")
         url = f"{self.jira_url}/rest/api/2/issue/{jira_id}/comment"
         payload = {"body": comment_text}
 
-        json_payload = json.dumps(payload)
-
         try:
-            response = requests.post(url, auth=self.auth, headers=self.headers, data=json_payload)
+            response = self._post_json(url, payload)
             response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
             self.log_info(f"Successfully added comment to issue {jira_id}.")
 
         except requests.exceptions.RequestException as e:
-            self.log_error(f"Error adding comment to issue {jira_id}: {e}. Response text: {response.text}")
+            self.log_error(f"Error adding comment to issue {jira_id}: {e}. Response text: {self._error_response_text(e)}")
             raise 
         except Exception as e:
-            error_message = f"{traceback.print_exc()}"
-            self.log_error(f"An unexpected error occurred while adding comment: {error_message}")
+            # log_error appends the active traceback.
+            self.log_error(f"An unexpected error occurred while adding comment: {e}")
             raise
 
-    def get_transition_id(self, jira_id: str, transition_name: str) -> Optional[str]:
+    def get_transition_id(self, jira_id: str, transition_name: str, use_cache: bool = True) -> Optional[str]:
         """
         Retrieves the ID of a specific transition for a given Jira issue.
 
-        This ID is required to change the status of a Jira issue.
+        This ID is required to change the status of a Jira issue. Transition IDs are
+        cached per Jira project and transition name for TRANSITION_CACHE_TTL seconds,
+        since they only change with the project's workflow.
 
         Args:
             jira_id (str): The key of the Jira issue (e.g., "AUTOTEST-123").
             transition_name (str): The name of the desired transition (e.g., "Start Progress", "Done").
+            use_cache (bool): If False, the transitions are always fetched from Jira.
 
         Returns:
             Optional[str]: The ID of the transition if found, otherwise None.
         """
+        project_key = jira_id.split('-')[0]
+        if use_cache:
+            prefetch = TRANSITION_PREFETCHES.pop(project_key, None)
+            if prefetch is not None:
+                # Wait for the listing already in flight instead of sending a second GET.
+                prefetch.result()
+            cached = TRANSITION_CACHE.get((project_key, transition_name))
+            if cached is not None and time.monotonic() - cached[1] < TRANSITION_CACHE_TTL:
+                return cached[0]
+
+        transitions = self._list_transitions(jira_id)
+        if transitions is None:
+            return None
+
+        for transition in transitions:
+            if transition["name"] == transition_name:
+                self.log_info(f"Found transition ID {transition['id']} for '{transition_name}'")
+                return transition["id"]
+
+        self.log_warning(f"Transition '{transition_name}' not found for issue {jira_id}")
+        return None
+
+    def _list_transitions(self, jira_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lists the transitions available for a Jira issue and caches all of their IDs
+        in TRANSITION_CACHE, not only the one being looked up.
 
+        Args:
+            jira_id (str): The key of the Jira issue (e.g., "AUTOTEST-123").
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: The transitions of the issue, or None if they could not be read.
+        """
+        project_key = jira_id.split('-')[0]
         url = f"{self.jira_url}/rest/api/2/issue/{jira_id}/transitions"
         try:
-            response = requests.get(url, auth=self.auth, headers=self.headers)
+            response = self.http.get(url, auth=self.auth, headers=self.headers)
             response.raise_for_status()
-            transitions_data = response.json()
-
+            transitions = self._json(response)["transitions"]
 
-            for transition in transitions_data["transitions"]:
-                if transition["name"] == transition_name:
-                    self.log_info(f"Found transition ID {transition['id']} for '{transition_name}'")
-                    return transition["id"]
-
-            self.log_warning(f"Transition '{transition_name}' not found for issue {jira_id}")
-            return None
+            now = time.monotonic()
+            for transition in transitions:
+                TRANSITION_CACHE[(project_key, transition["name"])] = (transition["id"], now)
+            return transitions
 
         except requests.exceptions.RequestException as e:
-            self.log_error(f"Error getting transitions for {jira_id}: {e}. Response text: {response.text}")
+            self.log_error(f"Error getting transitions for {jira_id}: {e}. Response text: {self._error_response_text(e)}")
             return None
         except json.JSONDecodeError as e:
             self.log_error(f"Error decoding JSON response: {e}. Response text: {response.text}")
             return None
 
+    def prefetch_transitions(self, jira_id: str) -> None:
+        """
+        Starts listing the transitions of a Jira issue in a background thread, unless they
+        are already cached, so that a later `change_issue_status` only needs its POST.
+        The GET then overlaps with the rest of the processing instead of adding a round trip
+        to the status change.
+
+        Args:
+            jira_id (str): The key of the Jira issue (e.g., "AUTOTEST-123").
+        """
+        project_key = jira_id.split('-')[0]
+        if project_key in TRANSITION_PREFETCHES:
+            return
+        now = time.monotonic()
+        if any(key[0] == project_key and now - read_at < TRANSITION_CACHE_TTL
+               for key, (_, read_at) in list(TRANSITION_CACHE.items())):
+            return
+        TRANSITION_PREFETCHES[project_key] = TRANSITION_PREFETCH_EXECUTOR.submit(self._list_transitions, jira_id)
+
 
     def change_issue_status(self,  transition_name: str, jira_id:str) -> bool:
         """
@@ -181,22 +503,63 @@ class AppLogger():
             return False
 
         url = f"{self.jira_url}/rest/api/2/issue/{jira_id}/transitions"
-        payload = {
-            "transition": {
-                "id": transition_id,
-            }
-        }
-        json_payload = json.dumps(payload)
-
         try:
-            response = requests.post(url, auth=self.auth, headers=self.headers, data=json_payload)
+            response = self._post_json(url, {"transition": {"id": transition_id}})
+            if response.status_code in (400, 404):
+                # The cached transition may not apply to this issue (workflow drift): refresh it and retry once.
+                TRANSITION_CACHE.pop((jira_id.split('-')[0], transition_name), None)
+                fresh_transition_id = self.get_transition_id(jira_id, transition_name, use_cache=False)
+                if fresh_transition_id is not None and fresh_transition_id != transition_id:
+                    response = self._post_json(url, {"transition": {"id": fresh_transition_id}})
             response.raise_for_status()
             self.log_info(f"Successfully changed status of issue {jira_id} to '{transition_name}'.")
             return True
         except requests.exceptions.RequestException as e:
-            self.log_error(f"Error changing status of issue {jira_id}: {e}. Response text: {response.text}")
+            self.log_error(f"Error changing status of issue {jira_id}: {e}. Response text: {self._error_response_text(e)}")
             return False
         except Exception as e:
-            self.log_error(f"An unexpected error occurred while changing status of issue {jira_id}", exc_info=True)
+            # log_error appends the active traceback.
+            self.log_error(f"An unexpected error occurred while changing status of issue {jira_id}: {e}")
             return False
 
+    def comment_and_change_issue_status(self, jira_id: str, comment_text: str, transition_name: str,
+                                        comment_type: CommentType = CommentType.ERROR) -> bool:
+        """
+        Adds a comment to a Jira issue and changes its status with a single request, by
+        sending the comment in the `update` block of the transition.
+
+        If the transition cannot be resolved or the combined request is rejected (e.g., by a
+        workflow that does not accept comments on this transition), the comment and the status
+        change are sent as two requests, concurrently.
+
+        Args:
+            jira_id (str): The key of the Jira issue (e.g., "AUTOTEST-123").
+            comment_text (str): The text of the comment to add.
+            transition_name (str): The name of the transition to perform (e.g., "Set as blocked").
+            comment_type (CommentType): The type of the comment, which selects its prefix.
+
+        Returns:
+            bool: True if the status was changed successfully, False otherwise.
+        """
+        transition_id = self.get_transition_id(jira_id, transition_name)
+        if transition_id is not None:
+            url = f"{self.jira_url}/rest/api/2/issue/{jira_id}/transitions"
+            payload = {
+                "transition": {"id": transition_id},
+                "update": {"comment": [{"add": {"body": f"{COMMENT_PREFIXES.get(comment_type, '')}{comment_text}"}}]},
+            }
+            try:
+                response = self._post_json(url, payload)
+                response.raise_for_status()
+                self.log_info(f"Successfully commented and changed status of issue {jira_id} to '{transition_name}'.")
+                return True
+            except requests.exceptions.RequestException as e:
+                self.log_warning(f"Could not comment and change status of issue {jira_id} in one request: {e}. "
+                                 f"Response text: {self._error_response_text(e)}. Sending them separately.")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            comment = executor.submit(self.add_comment_to_jira_issue, jira_id=jira_id, comment_text=comment_text, comment_type=comment_type)
+            status_changed = executor.submit(self.change_issue_status, jira_id=jira_id, transition_name=transition_name)
+            comment.result()
+            return status_changed.result()
+
@@ -1,10 +1,96 @@
 from __future__ import annotations
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Tuple, FrozenSet
+from functools import partial
 import re
+import string
 
 # Import the AppLogger class from the 'app.logger' module.
 # This class is expected to provide logging functionalities and base Jira connection details.
-from app.logger import AppLogger
+from app.logger import AppLogger, CommentType
+# JSON Pointer helpers that work on both lazy simdjson documents and plain dicts.
+from app.serialization import get_pointer, materialize
+
+
+# Matches fixed-point 'validation' regexes such as r"^[0-9]{1,10}\.[0-9]{1,5}$" (used for budgets),
+# capturing the maximum number of integer and fractional digits.
+FIXED_POINT_VALIDATION_PATTERN = re.compile(r"^\^\[0-9\]\{1,(\d+)\}\\\.\[0-9\]\{1,(\d+)\}\$$")
+
+# Matches bounded alphanumeric 'validation' regexes such as r"^[0-9A-Za-z-_]{3,30}$" (used for names and WBS),
+# capturing the minimum and maximum length.
+NAME_VALIDATION_PATTERN = re.compile(r"^\^\[0-9A-Za-z-_\]\{(\d+),(\d+)\}\$$")
+
+# Characters accepted by NAME_VALIDATION_PATTERN regexes: ASCII letters, digits, '-' and '_'.
+NAME_CHARACTERS: FrozenSet[str] = frozenset(string.ascii_letters + string.digits + "-_")
+
+
+def _is_ascii_digits(text: str) -> bool:
+    """
+    Checks that a string is made of ASCII digits only (equivalent to r"^[0-9]+$").
+    """
+    return text.isascii() and text.isdigit()
+
+
+def _is_signed_decimal(text: str) -> bool:
+    """
+    Checks that a string is an optionally negative decimal number (equivalent to r"^-?\d+(\.\d+)?$").
+    """
+    integer_part, separator, fractional_part = text.removeprefix("-").partition(".")
+    return integer_part.isdecimal() and (not separator or fractional_part.isdecimal())
+
+
+def _is_fixed_point(max_integer_digits: int, max_fractional_digits: int, text: str) -> bool:
+    """
+    Checks that a string is a fixed-point number with 1 to `max_integer_digits` ASCII digits,
+    a dot, and 1 to `max_fractional_digits` ASCII digits (see FIXED_POINT_VALIDATION_PATTERN).
+    """
+    integer_part, separator, fractional_part = text.partition(".")
+    return (
+        bool(separator)
+        and 0 < len(integer_part) <= max_integer_digits
+        and 0 < len(fractional_part) <= max_fractional_digits
+        and _is_ascii_digits(integer_part)
+        and _is_ascii_digits(fractional_part)
+    )
+
+
+def _is_bounded_name(min_length: int, max_length: int, text: str) -> bool:
+    """
+    Checks that a string has `min_length` to `max_length` characters, all of them
+    ASCII letters, digits, '-' or '_' (see NAME_VALIDATION_PATTERN).
+    """
+    return min_length <= len(text) <= max_length and NAME_CHARACTERS.issuperset(text)
+
+
+# Plain Python predicates replacing common, trivial 'validation' regexes.
+FAST_VALIDATORS: Dict[str, Callable[[str], bool]] = {
+    r"^\d+$": str.isdecimal,
+    r"^[0-9]+$": _is_ascii_digits,
+    r"^-?\d+(\.\d+)?$": _is_signed_decimal,
+}
+
+
+def compile_validator(validation: str) -> Callable[[str], Any]:
+    """
+    Builds the validation predicate of a 'validation' regex. Common, trivial patterns are
+    specialized into plain string checks, which are much cheaper than a regex match;
+    any other pattern is compiled and its `match` method is returned.
+
+    Args:
+        validation (str): The 'validation' regex of a field configuration.
+
+    Returns:
+        Callable[[str], Any]: A predicate whose result is truthy when the value is valid.
+    """
+    fast_validator = FAST_VALIDATORS.get(validation)
+    if fast_validator is not None:
+        return fast_validator
+    fixed_point = FIXED_POINT_VALIDATION_PATTERN.match(validation)
+    if fixed_point:
+        return partial(_is_fixed_point, int(fixed_point.group(1)), int(fixed_point.group(2)))
+    bounded_name = NAME_VALIDATION_PATTERN.match(validation)
+    if bounded_name:
+        return partial(_is_bounded_name, int(bounded_name.group(1)), int(bounded_name.group(2)))
+    return re.compile(validation).match
 
 
 class PayloadParser(AppLogger):
@@ -27,7 +113,18 @@ class PayloadParser(AppLogger):
                                       This acts as the output container for parsed values.
         request_json (Dict[str, Any]): The raw JSON payload received from the Jira webhook.
                                        This is the input data source for parsing.
+        pending_validation_errors (List[str]): Validation errors collected while parsing,
+                                               posted to Jira as a single comment by
+                                               `flush_validation_errors`.
     """
+    __slots__ = ("pending_validation_errors",)
+
+    def __init__(self):
+        """
+        Initializes the PayloadParser and its (empty) list of pending validation errors.
+        """
+        super().__init__()
+        self.pending_validation_errors: List[str] = []
 
 
 
@@ -124,10 +221,10 @@ class PayloadParser(AppLogger):
         """
         # Ensure the field_value is a list.
         if isinstance(field_value, list):
-            # Use a list comprehension to extract 'value' from each item if present.
-            values = [item['value'] for item in field_value if 'value' in item]
-            # Store the list of extracted values.
-            self.config_data[field_config["output_name"]] = values
+            # Extract 'value' from each item if present (a single dict probe per item).
+            self.config_data[field_config["output_name"]] = [
+                value for item in field_value if (value := item.get('value')) is not None
+            ]
 
     def _process_textfield(self, field_config: Dict[str, Any], attribute_found: Optional[str]) -> None:
         """
@@ -145,22 +242,15 @@ class PayloadParser(AppLogger):
         """
         # Process only if an attribute value was found.
         if attribute_found is not None:
-            # Get the regex validation pattern from the field configuration.
-            regex_validation = field_config.get("validation")
-            if regex_validation:
-                # If a regex is defined, attempt to match it against the attribute.
-                if not re.match(regex_validation, attribute_found):
-                    # If the regex does not match, log an error and comment on Jira.
+            # Get the validator of the field's regex (prepared once by `_prepare_config`).
+            validator = self._get_validator(field_config)
+            if validator:
+                # If a regex is defined, check the attribute against it.
+                if not validator(attribute_found):
+                    # If the regex does not match, log an error and queue it for the Jira comment.
                     error_message = f"Invalid value '{attribute_found}' found for '{field_config['output_name']}'. {field_config.get('regex_error_message', '')}"
                     self.log_error(error_message)
-                    # Add an error comment to the Jira issue.
-                    # Note: self.add_comment_to_jira_issue expects jira_id.
-                    # Assuming jira_id is available as self.config_data.get('ISSUE_KEY')
-                    self.add_comment_to_jira_issue(
-                        jira_id=self.config_data.get('ISSUE_KEY', 'UNKNOWN_JIRA_ID'),
-                        comment_text=error_message,
-                        comment_type="error"
-                    )
+                    self.pending_validation_errors.append(error_message)
                 else:
                     # If validation passes, store the attribute.
                     self.config_data[field_config["output_name"]] = attribute_found
@@ -185,101 +275,208 @@ class PayloadParser(AppLogger):
         """
         # Process only if an attribute value was found.
         if attribute_found is not None:
-            regex_validation = field_config.get("validation")
-            # Convert the attribute to a string for regex matching, as re.match expects string.
+            validator = self._get_validator(field_config)
+            # Convert the attribute to a string for validation, as the validators expect a string.
             str_attribute_found = str(attribute_found)
-            if regex_validation:
-                # If a regex is defined, attempt to match it.
-                if not re.match(regex_validation, str_attribute_found):
-                    # If regex does not match, log an error and comment on Jira.
+            if validator:
+                # If a regex is defined, check the attribute against it.
+                if not validator(str_attribute_found):
+                    # If regex does not match, log an error and queue it for the Jira comment.
                     error_message = f"Invalid value '{attribute_found}' for '{field_config['output_name']}'. {field_config.get('regex_error_message', '')}"
                     self.log_error(error_message)
-                    # Add an error comment to the Jira issue.
-                    self.add_comment_to_jira_issue(
-                        jira_id=self.config_data.get('ISSUE_KEY', 'UNKNOWN_JIRA_ID'),
-                        comment_text=error_message,
-                        comment_type="error"
-                    )
+                    self.pending_validation_errors.append(error_message)
                 else:
                     try:
                         # If validation passes, attempt to convert the value to a float.
                         self.config_data[field_config["output_name"]] = float(attribute_found)
                     except ValueError:
-                        # Log and comment if conversion to float fails.
+                        # Log and queue a comment if conversion to float fails.
                         error_message = f"Could not convert '{attribute_found}' to float for '{field_config['output_name']}'."
                         self.log_error(error_message)
-                        self.add_comment_to_jira_issue(
-                            jira_id=self.config_data.get('ISSUE_KEY', 'UNKNOWN_JIRA_ID'),
-                            comment_text=f"Invalid numeric value '{attribute_found}' for '{field_config['output_name']}'",
-                            comment_type="error"
-                        )
+                        self.pending_validation_errors.append(f"Invalid numeric value '{attribute_found}' for '{field_config['output_name']}'")
             else:
                 try:
                     # If no regex validation, directly attempt to convert to float.
                     self.config_data[field_config["output_name"]] = float(attribute_found)
                 except ValueError:
-                    # Log and comment if conversion to float fails.
+                    # Log and queue a comment if conversion to float fails.
                     error_message = f"Could not convert '{attribute_found}' to float for '{field_config['output_name']}'."
                     self.log_error(error_message)
-                    self.add_comment_to_jira_issue(
-                        jira_id=self.config_data.get('ISSUE_KEY', 'UNKNOWN_JIRA_ID'),
-                        comment_text=f"Invalid numeric value '{attribute_found}' for '{field_config['output_name']}'",
-                        comment_type="error"
-                    )
+                    self.pending_validation_errors.append(f"Invalid numeric value '{attribute_found}' for '{field_config['output_name']}'")
 
-    def _check_mandatory_fields(self, ticket_fields: Dict[str, Any]) -> None:
+    @staticmethod
+    def _prepare_config(ticket_fields: Dict[str, Any]) -> None:
         """
-        Checks if all mandatory fields defined in `ticket_fields` configuration
-        are present in the `self.config_data` (i.e., successfully extracted).
+        Builds the validator of the 'validation' regex of every field into '_validator'
+        (see `compile_validator`), once per ticket field configuration.
 
-        If any mandatory field is missing, it logs an error and adds an error
-        comment to the Jira issue. It then raises a ValueError to halt further
-        processing, indicating a critical missing input.
+        Args:
+            ticket_fields (Dict[str, Any]): The field configuration of one issue type.
+        """
+        for field_config in ticket_fields.values():
+            if field_config.get("validation") and "_validator" not in field_config:
+                field_config["_validator"] = compile_validator(field_config["validation"])
+
+    @staticmethod
+    def _get_validator(field_config: Dict[str, Any]) -> Optional[Callable[[str], Any]]:
+        """
+        Returns the validator of a field's 'validation' regex, if it has one.
+
+        Args:
+            field_config (Dict[str, Any]): Configuration of the field.
+
+        Returns:
+            Optional[Callable[[str], Any]]: The prepared validator, built on the fly for configurations
+                                            that did not go through `_prepare_config`, or None.
+        """
+        validator = field_config.get("_validator")
+        if validator is None and field_config.get("validation"):
+            validator = compile_validator(field_config["validation"])
+        return validator
+
+    @staticmethod
+    def get_mandatory_fields(ticket_fields: Dict[str, Any]) -> FrozenSet[str]:
+        """
+        Collects the output names of all fields flagged as mandatory in a ticket field
+        configuration. Meant to be computed once per issue type, not per request.
 
         Args:
             ticket_fields (Dict[str, Any]): A dictionary defining the expected Jira fields,
                                             including their 'output_name' and a 'mandatory' flag.
 
+        Returns:
+            FrozenSet[str]: The output names of the mandatory fields.
+        """
+        return frozenset(config["output_name"] for config in ticket_fields.values() if config.get("mandatory"))
+
+    def _check_mandatory_fields(self, mandatory_fields: FrozenSet[str]) -> None:
+        """
+        Checks if all mandatory fields (as returned by `get_mandatory_fields`)
+        are present in the `self.config_data` (i.e., successfully extracted).
+
+        If any mandatory field is missing, it logs an error and queues it in
+        `pending_validation_errors` for the Jira comment. It then raises a ValueError
+        to halt further processing, indicating a critical missing input.
+
+        Args:
+            mandatory_fields (FrozenSet[str]): The output names of the mandatory fields.
+
         Raises:
             ValueError: If one or more mandatory fields are found to be missing.
         """
-        missing_mandatory_fields = []
-        # Iterate through the configured ticket fields.
-        for key, config in ticket_fields.items():
-            # Check if the field is marked as mandatory and if its output name is not in config_data.
-            if config.get("mandatory") and config["output_name"] not in self.config_data:
-                missing_mandatory_fields.append(config["output_name"])
-                # Log the missing mandatory field.
-                self.log_error(f"Mandatory field '{config['output_name']}' is missing in the extracted data.")
-                # Add an error comment to the Jira issue.
-                self.add_comment_to_jira_issue(
-                    jira_id=self.config_data.get('ISSUE_KEY', 'UNKNOWN_JIRA_ID'),
-                    comment_text=f"Mandatory field '{config['output_name']}' is missing in the request.",
-                    comment_type="error"
-                )
-
-        # If any mandatory fields were missing, raise a ValueError.
+        # A single set difference finds every mandatory output name missing from config_data.
+        # `difference` with a dict argument only probes the dict for each mandatory name,
+        # without copying the set or building one from the dict keys.
+        missing_mandatory_fields = sorted(mandatory_fields.difference(self.config_data))
+
+        # If any mandatory fields were missing, report them and raise a ValueError.
         if missing_mandatory_fields:
+            for output_name in missing_mandatory_fields:
+                # Log the missing mandatory field and queue it for the Jira comment.
+                self.log_error(f"Mandatory field '{output_name}' is missing in the extracted data.")
+                self.pending_validation_errors.append(f"Mandatory field '{output_name}' is missing in the request.")
+
             raise ValueError(f"Missing mandatory fields: {', '.join(missing_mandatory_fields)}")
 
-    def _extract_field_value(self, field_config: Dict[str, Any]) -> Optional[Any]:
+    def flush_validation_errors(self) -> None:
+        """
+        Posts every validation error collected while parsing as a single Jira comment
+        (one bullet per error) instead of one comment per error, then clears the list.
+        """
+        if not self.pending_validation_errors:
+            return
+        errors, self.pending_validation_errors = self.pending_validation_errors, []
+        self.add_comment_to_jira_issue(
+            jira_id=self.config_data.get('ISSUE_KEY', 'UNKNOWN_JIRA_ID'),
+            comment_text="Invalid request:\n" + "\n".join(f"- {error}" for error in errors),
+            comment_type=CommentType.ERROR
+        )
+
+    def _get_issue_fields(self) -> Any:
+        """
+        Resolves the "issue.fields" object of the raw Jira payload once per parse, so that
+        each field is then a single lookup instead of a walk from the payload root.
+
+        Returns:
+            Any: The fields object (a lazy simdjson object or a dict), or an empty dict if missing.
+        """
+        try:
+            return get_pointer(self.request_json, "/issue/fields")
+        except KeyError:
+            return {}
+
+    def _extract_field_value(self, field_config: Dict[str, Any], issue_fields: Any = None) -> Optional[Any]:
         """
         Extracts a single field value from the raw Jira payload (`self.request_json`)
-        based on its input name defined in `field_config`.
+        based on its input name defined in `field_config`. Only the requested field is
+        materialized into Python objects when the payload is a lazy simdjson document.
 
         Args:
             field_config (Dict[str, Any]): Configuration for the field,
                                            including its 'input_name' (the key in the Jira payload).
+            issue_fields (Any): The "issue.fields" object from `_get_issue_fields`; resolved here if omitted.
 
         Returns:
             Optional[Any]: The extracted field value if found, otherwise None.
         """
         input_name = field_config["input_name"]
-        try:
-            # Attempt to access the field value using the input_name from the Jira payload.
-            return self.request_json['issue']['fields'][input_name]
-        except KeyError:
-            # If the field is not found in the payload, log an info message and return None.
-            self.log_info(f"Field '{input_name}' not found in Jira payload.")
+        if issue_fields is None:
+            issue_fields = self._get_issue_fields()
+        value = issue_fields.get(input_name)
+        if value is None:
+            # Absent (or empty) fields are common for optional fields; the parse loop reports them once.
             return None
+        return materialize(value)
+
+    # Dispatch table mapping each configured field 'type' to the method that processes it.
+    # Built once at class creation instead of walking an if/elif chain for every field.
+    FIELD_TYPE_HANDLERS = {
+        "dropdown": _process_dropdown,
+        "people": _process_people,
+        "reporter": _process_reporter,
+        "dropdown_nested": _process_dropdown_nested,
+        "checklist": _process_checklist,
+        "textfield": _process_textfield,
+        "numericfield": _process_numericfield,
+    }
+
+    @classmethod
+    def compile_field_parser(cls, ticket_fields: Dict[str, Any]) -> Callable[["PayloadParser"], None]:
+        """
+        Specializes the field parsing loop for a static ticket field configuration.
+
+        The handler of every field is resolved once here, so the returned function only
+        extracts and processes each field without re-dispatching on its 'type' per request.
 
+        Args:
+            ticket_fields (Dict[str, Any]): The field configuration of one issue type
+                                            (e.g., `project_creation_ticket_fields`).
+
+        Returns:
+            Callable[[PayloadParser], None]: A function that parses all configured fields of
+                                             `parser.request_json` into `parser.config_data`.
+        """
+        cls._prepare_config(ticket_fields)
+        steps: Tuple[Tuple[str, Dict[str, Any], Optional[Callable]], ...] = tuple(
+            (key, field_config, cls.FIELD_TYPE_HANDLERS.get(field_config["type"]))
+            for key, field_config in ticket_fields.items()
+        )
+
+        def parse_fields(parser: "PayloadParser") -> None:
+            issue_fields = parser._get_issue_fields()
+            missing_fields: List[str] = []
+            for key, field_config, handler in steps:
+                if handler is None:
+                    parser.log_warning(f"Unsupported field type: '{field_config['type']}' for field '{key}'. Skipping.")
+                    continue
+                parser.log_debug("Processing field '%s' with config: %s", key, field_config)
+                # Extract the raw field value from the Jira payload and process it.
+                value = parser._extract_field_value(field_config, issue_fields)
+                if value is None:
+                    missing_fields.append(field_config["input_name"])
+                handler(parser, field_config, value)
+            if missing_fields:
+                # A single log entry for all absent fields instead of one per field.
+                parser.log_info(f"Fields not found in Jira payload: {', '.join(missing_fields)}")
+
+        return parse_fields
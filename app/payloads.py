@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from typing import List
+
+
+# Slots are declared explicitly (rather than with `dataclass(slots=True)`) to support Python 3.9.
+@dataclass
+class YamlFile:
+    """
+    A Terraform YAML file to commit to GitHub.
+
+    Attributes:
+        path (str): The path of the file in the repository (e.g., "data/projects/dw-dev-myproject.yaml").
+        commit_message (str): The commit message for the file.
+        file (bytes): The UTF-8 encoded YAML content.
+    """
+    __slots__ = ("path", "commit_message", "file")
+    path: str
+    commit_message: str
+    file: bytes
+
+
+@dataclass
+class GitHubPayload:
+    """
+    The GitHub operations generated by a provisioner for one resource: the files to commit
+    on a branch and the pull request to open for them.
+
+    Attributes:
+        new_branch_name (str): The branch the files are committed to.
+        pr_title (str): The title of the pull request.
+        autoapprove (bool): Whether the pull request is merged automatically.
+        files (List[YamlFile]): The files to commit, in order.
+    """
+    __slots__ = ("new_branch_name", "pr_title", "autoapprove", "files")
+    new_branch_name: str
+    pr_title: str
+    autoapprove: bool
+    files: List[YamlFile]
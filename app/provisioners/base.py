@@ -1,17 +1,26 @@
 import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Tuple, List, Optional
-import re
+from typing import Dict, Any, Tuple, List, Optional, ClassVar
+from functools import lru_cache, cache
+import time
+from concurrent.futures import ThreadPoolExecutor
 import yaml
-import base64
+
+# LibYAML's C emitter is several times faster than the pure-Python one; fall back to it
+# when PyYAML was built without LibYAML. Both produce the same output.
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
 
 
 # Import the base logging class.
-from app.logger import AppLogger # Assuming AppLogger is defined in app/logger.py
+from app.logger import AppLogger, get_env_flag # Assuming AppLogger is defined in app/logger.py
+from app.serialization import json_dumps_bytes
 
 
 
-DEBUG: bool = os.getenv('DEBUG', True) # Controls debug logging and potentially other debug behaviors.
+DEBUG: bool = get_env_flag('DEBUG', False) # Controls debug logging and potentially other debug behaviors.
 # ORG_ID is the Google Cloud Organization ID. It changes based on DEBUG mode.
 if DEBUG is True:
     ORG_ID: str = os.getenv('ORG_ID_DEBUG', '1234567890')
@@ -22,9 +31,72 @@ else:
 # Define the default branch name for GitHub operations.
 BRANCH_NAME: str = os.getenv('BRANCH_NAME', 'main')
 
+# When enabled, Terraform files are written as (indented) JSON instead of block-style YAML.
+# JSON is a subset of YAML 1.2, so Terraform's `yamldecode` reads both; JSON is much faster to emit.
+TERRAFORM_FILES_AS_JSON: bool = get_env_flag('TERRAFORM_FILES_AS_JSON', False)
+
 # Import Google Cloud Asset Inventory client.
 from google.cloud import asset_v1
 
+# Cloud Asset Inventory types of the resources listed by HierarchyrProvisioner.
+FOLDER_ASSET_TYPE: str = "cloudresourcemanager.googleapis.com/Folder"
+PROJECT_ASSET_TYPE: str = "cloudresourcemanager.googleapis.com/Project"
+
+# Maximum page size accepted by Cloud Asset Inventory's ListAssets (fewer round trips than the default).
+ASSET_LIST_PAGE_SIZE: int = 1000
+
+# Seconds during which the listed folders and projects (and their indices) are reused by new
+# provisioners instead of listing them again from Cloud Asset Inventory.
+ASSET_CACHE_TTL: float = 60.0
+
+# Listed assets and their indices: (assets, folders_by_name, projects_by_id, projects_by_name).
+AssetIndex = Tuple[List[Any], Dict[str, List[Any]], Dict[str, str], Dict[str, str]]
+
+# Asset indices keyed by parent organization, with the (monotonic) time they were read.
+# Shared (read-only) by all provisioners of a (warm) function instance.
+ASSET_CACHE: Dict[str, Tuple[float, AssetIndex]] = {}
+
+
+@cache
+def get_asset_client() -> asset_v1.AssetServiceClient:
+    """
+    Returns the Cloud Asset Inventory client, creating it on first use.
+    Client construction sets up credentials and a channel, so it is shared by all provisioners.
+
+    Returns:
+        asset_v1.AssetServiceClient: The shared Cloud Asset Inventory client.
+    """
+    return asset_v1.AssetServiceClient()
+
+
+@lru_cache(maxsize=256)
+def format_label(name: str) -> str:
+    """
+    Lowercases a string and replaces each run of whitespace with a single underscore.
+    Results are memoized, since the same label values (project types, folder names, ...)
+    recur across the fields of a ticket and across tickets.
+
+    Args:
+        name (str): The input string (e.g., "Internal Project").
+
+    Returns:
+        str: The formatted label value (e.g., "internal_project").
+    """
+    # Convert the name to lowercase.
+    formatted_name = name.lower()
+    # Replace one or more whitespace characters with a single underscore. str.split() splits on
+    # the same characters as the regex r'\s+' without going through the regex engine; leading
+    # and trailing whitespace runs are turned into an underscore as well, as re.sub would.
+    parts = formatted_name.split()
+    if not parts:
+        return '_' if formatted_name else ''
+    label = '_'.join(parts)
+    if formatted_name[0].isspace():
+        label = '_' + label
+    if formatted_name[-1].isspace():
+        label += '_'
+    return label
+
 
 class BaseProvisioner(ABC, AppLogger): # Inherit from AppLogger to use logging methods
     """
@@ -39,6 +111,7 @@ class BaseProvisioner(ABC, AppLogger): # Inherit from AppLogger to use logging m
         ABC: Abstract Base Class for defining abstract methods.
         AppLogger: Provides logging functionalities (log_info, log_error, etc.).
     """
+    __slots__ = ("branch_name",)
 
     def __init__(self):
         """
@@ -80,22 +153,24 @@ class BaseProvisioner(ABC, AppLogger): # Inherit from AppLogger to use logging m
         pass # Placeholder for implementation in subclasses.
 
     @staticmethod
-    def encode_yaml_file(yaml_data: Dict[str, Any]) -> str:
+    def encode_yaml_file(yaml_data: Dict[str, Any]) -> bytes:
         """
-        Encodes a Python dictionary into a base64-encoded YAML string.
-        This is typically used before sending YAML content to APIs that require base64 encoding.
+        Encodes a Python dictionary into UTF-8 encoded YAML bytes.
+        With TERRAFORM_FILES_AS_JSON enabled, the content is emitted as JSON (a YAML subset) instead.
+        The raw bytes are committed as-is through the Git Data API; base64 encoding is
+        only applied by the GitHub manager when the Contents API requires it.
 
         Args:
             yaml_data (Dict[str, Any]): The dictionary containing data to be converted to YAML.
 
         Returns:
-            str: The base64-encoded string representation of the YAML content.
+            bytes: The UTF-8 encoded YAML content.
         """
-        # Dump the dictionary to a YAML string with 2-space indentation.
-        yaml_string = yaml.dump(yaml_data, indent=2)
-        # Encode the YAML string to UTF-8 bytes, then base64 encode it, and finally decode to a string.
-        yaml_content_encoded = base64.b64encode(yaml_string.encode('utf-8')).decode('utf-8')
-        return yaml_content_encoded
+        if TERRAFORM_FILES_AS_JSON:
+            return json_dumps_bytes(yaml_data, indent=True)
+        # Dump the dictionary with 2-space indentation; with an encoding, the emitter
+        # writes UTF-8 bytes directly instead of building a str to encode afterwards.
+        return yaml.dump(yaml_data, Dumper=YamlDumper, indent=2, default_flow_style=False, encoding='utf-8')
 
     def format_for_label_system(self, name: str) -> str:
         """
@@ -112,13 +187,10 @@ class BaseProvisioner(ABC, AppLogger): # Inherit from AppLogger to use logging m
         """
         if not isinstance(name, str):
             # Log a warning if a non-string input is received for formatting.
-            self.log_warning(f"Received non-string input for label formatting: {type(name)}. Returning empty string.")
+            self.log_warning("Received non-string input for label formatting: %s. Returning empty string.", type(name))
             return ""
 
-        # Convert the name to lowercase.
-        formatted_name = name.lower()
-        # Replace one or more whitespace characters with a single underscore.
-        return re.sub(r'\s+', '_', formatted_name)
+        return format_label(name)
 
 
 class HierarchyrProvisioner(BaseProvisioner):
@@ -133,54 +205,149 @@ class HierarchyrProvisioner(BaseProvisioner):
     Inherits:
         BaseProvisioner: Provides abstract methods and common utilities.
     """
+    __slots__ = ("parent", "_asset_index", "_resource_lookups")
+
+    # Keys of config_data formatted for GCP labels by `_format_label_elements`; set by concrete subclasses.
+    elements_to_format: ClassVar[Tuple[str, ...]] = ()
 
     def __init__(self):
         """
         Initializes the HierarchyrProvisioner.
         Calls the constructor of the parent BaseProvisioner class.
-        Initializes the Google Cloud Asset Inventory client and fetches
-        a list of existing projects and folders under the configured organization.
+        The Cloud Asset Inventory client and the list of existing projects and folders are
+        only fetched when first needed (see `assets`), so requests rejected before validation
+        do not pay for the listing.
         """
         super().__init__() # Initialize the base BaseProvisioner (and AppLogger).
-        self.client = asset_v1.AssetServiceClient() # Google Cloud Asset Inventory client.
         self.parent = f"organizations/{ORG_ID}" # The parent organization ID for asset listing.
-        self.assets = self._list_projects_and_folders() # List of all projects and folders under the organization.
+        self._asset_index: Optional[AssetIndex] = None # Loaded on first access by `_get_asset_index`.
+        # Results of `check_if_resource_exist`, keyed by (resource name, resource type).
+        self._resource_lookups: Dict[Tuple[str, str], Optional[str]] = {}
+
+    @property
+    def client(self) -> asset_v1.AssetServiceClient:
+        """The shared Google Cloud Asset Inventory client, created on first use."""
+        return get_asset_client()
+
+    @property
+    def assets(self) -> List[Any]:
+        """All projects and folders under the organization."""
+        return self._get_asset_index()[0]
+
+    @property
+    def folders_by_name(self) -> Dict[str, List[Any]]:
+        """Folder display name -> folder assets with that name, in listing order."""
+        return self._get_asset_index()[1]
+
+    @property
+    def projects_by_id(self) -> Dict[str, str]:
+        """Project ID -> full resource name of the project."""
+        return self._get_asset_index()[2]
+
+    @property
+    def projects_by_name(self) -> Dict[str, str]:
+        """Project resource 'name' (e.g., "projects/123") -> full resource name of the project."""
+        return self._get_asset_index()[3]
+
+    def _get_asset_index(self) -> AssetIndex:
+        """
+        Returns the listed assets and their indices, loading them on first access.
+        A listing younger than ASSET_CACHE_TTL seconds is reused from ASSET_CACHE, so the
+        provisioners of a batch share one Cloud Asset Inventory listing.
+        Failed (empty) listings are not cached.
+
+        Returns:
+            AssetIndex: The assets, folders_by_name, projects_by_id and projects_by_name.
+        """
+        if self._asset_index is not None:
+            return self._asset_index
+
+        cached = ASSET_CACHE.get(self.parent)
+        if cached is not None and time.monotonic() - cached[0] < ASSET_CACHE_TTL:
+            self._asset_index = cached[1]
+            self.log_info("Reusing %s cached projects and folders under %s.", len(self._asset_index[0]), self.parent)
+            return self._asset_index
+
+        assets = self._list_projects_and_folders() # List of all projects and folders under the organization.
+        self._asset_index = self._index_assets(assets)
+        if assets:
+            ASSET_CACHE[self.parent] = (time.monotonic(), self._asset_index)
+        return self._asset_index
 
     def _list_projects_and_folders(self) -> List[Dict[str, Any]]:
         """
         Lists all projects and folders directly under the configured Google Cloud organization
         using the Cloud Asset Inventory API. The results are stored in `self.assets`.
 
+        Pages of one listing are chained by their page tokens and can only be read in sequence,
+        so projects and folders are listed as two separate listings running concurrently.
+
         Returns:
             list: A list of asset dictionaries. Each dictionary represents a project or a folder
                   and contains its metadata. Returns an empty list on error or if no assets are found.
         """
-        assets = []
-        # Define the asset types to retrieve.
-        asset_types = [
-            "cloudresourcemanager.googleapis.com/Project",
-            "cloudresourcemanager.googleapis.com/Folder"
-        ]
-        # Create the request object for listing assets.
-        request = {"parent": self.parent, "asset_types": asset_types, "content_type": "RESOURCE"}
-
         try:
-            # Send the request to list assets and iterate through the paged results.
-            paged_result = self.client.list_assets(request=request)
-            for page in paged_result.pages:
-                for asset in page.assets:
-                    assets.append(asset)
-            self.log_info(f"Successfully listed {len(assets)} projects and folders under {self.parent}.")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                projects, folders = executor.map(self._list_assets_of_type, (PROJECT_ASSET_TYPE, FOLDER_ASSET_TYPE))
+            assets = projects + folders
+            self.log_info("Successfully listed %s projects and folders under %s.", len(assets), self.parent)
             return assets
         except Exception as e:
             # Log any errors encountered during asset listing.
-            self.log_error(f"Error listing projects and folders under {self.parent}: {e}")
+            self.log_error("Error listing projects and folders under %s: %s", self.parent, e)
             return []
 
-    def check_if_resource_exist(self, resource_name: str, resource_type: str = "cloudresourcemanager.googleapis.com/Folder") -> Optional[str]:
+    def _list_assets_of_type(self, asset_type: str) -> List[Any]:
+        """
+        Lists all assets of one type under the configured organization, with the largest page size.
+
+        Args:
+            asset_type (str): The Cloud Asset Inventory type (e.g., FOLDER_ASSET_TYPE).
+
+        Returns:
+            List[Any]: The listed assets.
+        """
+        # Create the request object for listing assets.
+        request = {"parent": self.parent, "asset_types": [asset_type], "content_type": "RESOURCE", "page_size": ASSET_LIST_PAGE_SIZE}
+        # Send the request to list assets; the pager yields the assets of every page in turn.
+        return list(self.client.list_assets(request=request))
+
+    @staticmethod
+    def _index_assets(assets: List[Any]) -> AssetIndex:
+        """
+        Indexes the listed assets in a single pass, so that resource lookups are dictionary
+        lookups instead of scans of every asset:
+
+        - `folders_by_name`: folder display name -> folder assets with that name, in listing order
+          (display names are only unique under a given parent).
+        - `projects_by_id`: project ID -> full resource name of the project.
+        - `projects_by_name`: project resource 'name' (e.g., "projects/123") -> full resource name.
+
+        Args:
+            assets (List[Any]): The listed projects and folders.
+
+        Returns:
+            AssetIndex: The assets, folders_by_name, projects_by_id and projects_by_name.
+        """
+        folders_by_name: Dict[str, List[Any]] = {}
+        projects_by_id: Dict[str, str] = {}
+        projects_by_name: Dict[str, str] = {}
+        for asset in assets:
+            data = asset.resource.data
+            if asset.asset_type == FOLDER_ASSET_TYPE:
+                folders_by_name.setdefault(data.get("displayName"), []).append(asset)
+            elif asset.asset_type == PROJECT_ASSET_TYPE:
+                # Keep the first asset listed for a key, as the previous linear scans did.
+                projects_by_id.setdefault(data.get("projectId"), asset.name)
+                projects_by_name.setdefault(data.get("name"), asset.name)
+        return assets, folders_by_name, projects_by_id, projects_by_name
+
+    def check_if_resource_exist(self, resource_name: str, resource_type: str = FOLDER_ASSET_TYPE) -> Optional[str]:
         """
         Checks if a resource with the given display name/ID and type exists
         within the assets fetched from the Cloud Asset Inventory.
+        The listed assets do not change during a provisioning run, so each
+        (name, type) pair is only looked up once per provisioner.
 
         Args:
             resource_name (str): The display name (for Folder) or display name/ID (for Project)
@@ -192,41 +359,75 @@ class HierarchyrProvisioner(BaseProvisioner):
             Optional[str]: The full resource name (e.g., "folders/12345" or "projects/my-project-id")
                            of the found resource if it exists, otherwise None.
         """
-        for asset in self.assets:
-            # Check if the asset type matches the requested resource type.
-            if asset.asset_type == resource_type:
-                data = asset.resource.data # Access the resource data for display name/ID.
-                # For Folders, compare by 'displayName'.
-                if resource_type == "cloudresourcemanager.googleapis.com/Folder" and data.get("displayName") == resource_name:
-                    self.log_info(f"Found existing folder '{resource_name}' (type: {resource_type}) with full name: {asset.name}")
-                    return asset.name
-                # For Projects, compare by 'name' (e.g., "projects/project-id") or 'projectId'.
-                elif resource_type == "cloudresourcemanager.googleapis.com/Project" and (data.get("name") == f"projects/{resource_name}" or data.get("projectId") == resource_name):
-                    self.log_info(f"Found existing project '{resource_name}' (type: {resource_type}) with full name: {asset.name}")
-                    return asset.name
-        self.log_info(f"Resource '{resource_name}' (type: {resource_type}) not found.")
+        key = (resource_name, resource_type)
+        if key in self._resource_lookups:
+            full_name = self._resource_lookups[key]
+        else:
+            lookup = self.RESOURCE_LOOKUPS.get(resource_type)
+            full_name = self._resource_lookups[key] = lookup(self, resource_name) if lookup else None
+        if full_name:
+            self.log_info("Found existing resource '%s' (type: %s) with full name: %s", resource_name, resource_type, full_name)
+            return full_name
+        self.log_info("Resource '%s' (type: %s) not found.", resource_name, resource_type)
         return None
 
+    def _find_folder(self, resource_name: str) -> Optional[str]:
+        """
+        Looks a folder up by 'displayName' (the first folder listed with that name).
+
+        Args:
+            resource_name (str): The display name of the folder.
+
+        Returns:
+            Optional[str]: The full resource name of the folder, or None.
+        """
+        folders = self.folders_by_name.get(resource_name)
+        return folders[0].name if folders else None
+
+    def _find_project(self, resource_name: str) -> Optional[str]:
+        """
+        Looks a project up by 'name' (e.g., "projects/project-id") or 'projectId'.
+
+        Args:
+            resource_name (str): The name or ID of the project.
+
+        Returns:
+            Optional[str]: The full resource name of the project, or None.
+        """
+        return self.projects_by_name.get(f"projects/{resource_name}") or self.projects_by_id.get(resource_name)
+
+    # Dispatch table mapping each Cloud Asset Inventory type to the method looking a resource up by name.
+    RESOURCE_LOOKUPS = {
+        FOLDER_ASSET_TYPE: _find_folder,
+        PROJECT_ASSET_TYPE: _find_project,
+    }
+
     def _format_label_elements(self) -> None:
         """
         Formats specific configuration elements (defined in `self.elements_to_format`)
         for use as labels. It applies the `format_for_label_system` method to these elements.
         Logs a warning if an element specified for formatting is not found in `self.config_data`.
+        The formatted values are applied with a single update and logged in a single entry.
         """
-        # Iterate through the list of elements that need to be formatted for labels.
-        # `self.elements_to_format` is expected to be defined in concrete subclasses.
-        for element in getattr(self, 'elements_to_format', []): # Use getattr for safety
-            if element in self.config_data:
-                # Apply the label formatting.
-                self.config_data[element] = self.format_for_label_system(self.config_data[element])
-                self.log_info(f"Formatted '{element}' for labels: {self.config_data[element]}")
-            else:
-                self.log_warning(f"Key '{element}' not found in config_data for formatting. Skipping.")
+        config_data = self.config_data
+        # Format the elements that need to be formatted for labels (a class-level tuple).
+        updates = {
+            element: self.format_for_label_system(config_data[element])
+            for element in self.elements_to_format
+            if element in config_data
+        }
+        config_data.update(updates)
+        if updates:
+            self.log_info("Formatted for labels: %s", updates)
+        if len(updates) != len(self.elements_to_format):
+            missing_elements = [element for element in self.elements_to_format if element not in updates]
+            self.log_warning("Keys %s not found in config_data for formatting. Skipping.", missing_elements)
 
     def _extract_folder_id(self, parent_folder_id_match: Optional[str]) -> Optional[str]:
         """
         Extracts the numerical folder ID from a full folder resource name string.
-        Expected format: "folders/12345".
+        Expected format: "folders/12345", possibly prefixed
+        (e.g., "//cloudresourcemanager.googleapis.com/folders/12345").
 
         Args:
             parent_folder_id_match (Optional[str]): The full folder resource name string
@@ -237,36 +438,14 @@ class HierarchyrProvisioner(BaseProvisioner):
                            otherwise None.
         """
         if parent_folder_id_match:
-            # Use regex to find the numerical ID after "folders/".
-            match = re.search(r"folders/(\d+)$", parent_folder_id_match)
-            if match:
-                parent_folder_id = f"folders/{match.group(1)}" # Reconstruct with "folders/" prefix.
-                self.log_info(f"Extracted parent folder ID: {parent_folder_id}")
+            # The numerical ID follows the last "folders/" and runs to the end of the string.
+            _, separator, folder_number = parent_folder_id_match.rpartition("folders/")
+            if separator and folder_number.isdecimal():
+                parent_folder_id = f"folders/{folder_number}" # Reconstruct with "folders/" prefix.
+                self.log_info("Extracted parent folder ID: %s", parent_folder_id)
                 return parent_folder_id
             else:
-                self.log_error(f"Warning: Could not extract folder ID from '{parent_folder_id_match}'. Invalid format.")
+                self.log_error("Warning: Could not extract folder ID from '%s'. Invalid format.", parent_folder_id_match)
                 return None
         self.log_info("No parent folder ID match provided.")
         return None
-
-    def extract_dw_environment(self, text: str) -> Optional[str]:
-        """
-        Extracts the environment string (e.g., "dev", "prod") from a given text
-        following the pattern "^dw-" and before the next hyphen.
-
-        Args:
-            text (str): The input string to search within (e.g., "dw-dev-myproject").
-
-        Returns:
-            Optional[str]: The extracted environment string (lowercase) if the pattern is found
-                           at the beginning of the string, otherwise None.
-        """
-        # Use regex to match the pattern "dw-<environment>-" at the beginning of the string.
-        match = re.match(r"^dw-([a-z]+)-", text)
-        if match:
-            extracted_env = match.group(1)
-            self.log_info(f"Extracted Datawave environment: '{extracted_env}' from '{text}'.")
-            return extracted_env
-        self.log_info(f"No Datawave environment found in '{text}' matching pattern '^dw-([a-z]+)-'.")
-        return None
-
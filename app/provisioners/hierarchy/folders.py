@@ -1,9 +1,10 @@
-from app.provisioners.base import HierarchyrProvisioner
+from app.provisioners.base import HierarchyrProvisioner, FOLDER_ASSET_TYPE
 from app.logger import AppLogger
 import re
 from app.exceptions import GcpProvisioningError
+from app.payloads import GitHubPayload, YamlFile
 
-from typing import Dict, Any 
+from typing import Dict, Any, Optional
 
 
 class GcpFolderProvisioner(HierarchyrProvisioner):
@@ -25,6 +26,7 @@ class GcpFolderProvisioner(HierarchyrProvisioner):
                                       This data drives the folder provisioning process.
         logger (AppLogger): An instance of the AppLogger for logging messages.
     """
+    __slots__ = ("config_data", "github_payload")
 
     def __init__(self, config_data: Dict[str, Any]):
         """
@@ -72,14 +74,14 @@ class GcpFolderProvisioner(HierarchyrProvisioner):
             ValueError: If a folder with the specified name already exists.
         """
         folder_name = self.config_data['FOLDER_NAME']
-        self.log_info(f"Checking if folder '{folder_name}' already exists.")
+        self.log_info("Checking if folder '%s' already exists.", folder_name)
         # Check if the folder exists by its display name.
-        if self.check_if_resource_exist(folder_name, resource_type="cloudresourcemanager.googleapis.com/Folder"):
+        if self.check_if_resource_exist(folder_name, resource_type=FOLDER_ASSET_TYPE):
             # If it exists, log an error and raise a ValueError.
             error_message = f"Folder '{folder_name}' exists already in the resource hierarchy."
             self.log_error(error_message)
             raise ValueError(error_message)
-        self.log_info(f"Folder '{folder_name}' does not exist. Proceeding with creation validation.")
+        self.log_info("Folder '%s' does not exist. Proceeding with creation validation.", folder_name)
 
     def _extract_project_type_folder_name(self) -> str:
         """
@@ -94,10 +96,10 @@ class GcpFolderProvisioner(HierarchyrProvisioner):
             GcpProvisioningError: If the specified parent folder does not exist.
         """
         folder_name = self.config_data["PROJECT_TYPE_FOLDER"]
-        self.log_info(f"Attempting to retrieve ID for parent folder '{folder_name}'.")
+        self.log_info("Attempting to retrieve ID for parent folder '%s'.", folder_name)
         # Check if the parent folder exists and extract its ID.
         project_type_folder_name = self._extract_folder_id(
-            self.check_if_resource_exist(folder_name, resource_type="cloudresourcemanager.googleapis.com/Folder")
+            self.check_if_resource_exist(folder_name, resource_type=FOLDER_ASSET_TYPE)
         )
         if not project_type_folder_name:
             # If the parent folder is not found, log an error and raise GcpProvisioningError.
@@ -105,7 +107,7 @@ class GcpFolderProvisioner(HierarchyrProvisioner):
             self.log_error(error_message)
             raise GcpProvisioningError(error_message)
         else:
-            self.log_info(f"Retrieved Parent Folder ID for '{folder_name}' as '{project_type_folder_name}'. Proceeding.")
+            self.log_info("Retrieved Parent Folder ID for '%s' as '%s'. Proceeding.", folder_name, project_type_folder_name)
             return project_type_folder_name
 
     def _validate_jira_request(self) -> None:
@@ -130,19 +132,19 @@ class GcpFolderProvisioner(HierarchyrProvisioner):
 
         except GcpProvisioningError as e:
             # Re-raise specific provisioning errors.
-            self.log_error(f"GCP folder provisioning validation failed: {e}")
+            self.log_error("GCP folder provisioning validation failed: %s", e)
             raise
         except ValueError as e:
             # Re-raise specific value errors (e.g., from uniqueness check).
-            self.log_error(f"Validation error during GCP folder provisioning: {e}")
+            self.log_error("Validation error during GCP folder provisioning: %s", e)
             raise GcpProvisioningError(f"Validation error: {e}")
         except Exception as e:
             # Catch any other unexpected exceptions and re-raise as a generic provisioning error.
-            self.log_error(f"An unexpected error occurred during GCP folder provisioning validation: {e}")
+            self.log_error("An unexpected error occurred during GCP folder provisioning validation: %s", e)
             raise GcpProvisioningError(f"An unexpected error occurred during validation: {e}")
 
 
-    def build_project_folder_terraform_yaml(self, config_data: Dict[str, Any], folder_parent_id: str) -> Dict[str, Any]:
+    def build_project_folder_terraform_yaml(self, config_data: Dict[str, Any], folder_parent_id: str, folder_label: Optional[str] = None) -> Dict[str, Any]:
         """
         Builds the Terraform YAML configuration for creating a new GCP folder.
 
@@ -150,18 +152,20 @@ class GcpFolderProvisioner(HierarchyrProvisioner):
             config_data (Dict[str, Any]): The configuration data for the folder,
                                          including FOLDER_NAME, PROJECT_TYPE, PROJECT_TYPE_FOLDER.
             folder_parent_id (str): The full resource ID of the parent folder (e.g., "folders/12345").
+            folder_label (Optional[str]): FOLDER_NAME already formatted with `format_for_label_system`,
+                                          when the caller has computed it; formatted here otherwise.
 
         Returns:
             Dict[str, Any]: A dictionary representing the Terraform configuration for the folder.
         """
-        self.log_info(f"Building Terraform YAML for folder '{config_data['FOLDER_NAME']}' under parent '{folder_parent_id}'.")
+        self.log_info("Building Terraform YAML for folder '%s' under parent '%s'.", config_data['FOLDER_NAME'], folder_parent_id)
         return {
             "parent": folder_parent_id, # The parent folder ID where the new folder will reside.
             "name": config_data["FOLDER_NAME"], # The display name of the new folder.
             "labels": { # GCP labels for organizing and categorizing the folder.
                 "project_type": self.format_for_label_system(config_data["PROJECT_TYPE"]), # e.g., "internal" or "client".
                 "project_sub_type": self.format_for_label_system(config_data["PROJECT_TYPE_FOLDER"]), # e.g., "asset", "sandbox", "poc".
-                "project_name_folder": self.format_for_label_system(config_data["FOLDER_NAME"]), # The formatted name of the folder itself.
+                "project_name_folder": folder_label if folder_label is not None else self.format_for_label_system(config_data["FOLDER_NAME"]), # The formatted name of the folder itself.
             }
         }
 
@@ -177,44 +181,44 @@ class GcpFolderProvisioner(HierarchyrProvisioner):
                                   the parent folder ID is not available.
         """
         self.log_info("Starting to build Terraform YAMLs for folder creation.")
+        config_data = self.config_data
         # Ensure that PARENT_FOLDER_ID is available from previous validation steps.
-        parent_folder_id = self.config_data.get("PARENT_FOLDER_ID")
+        parent_folder_id = config_data.get("PARENT_FOLDER_ID")
         if not parent_folder_id:
             error_message = "Parent folder ID is missing in config_data. Cannot build Terraform YAMLs."
             self.log_error(error_message)
             raise GcpProvisioningError(error_message)
 
+        folder_name = config_data['FOLDER_NAME']
+        issue_key = config_data.get('ISSUE_KEY')
+        # Format the folder name once; it is reused by the labels, the file path and the branch name.
+        folder_label = self.format_for_label_system(folder_name)
+
         # Build the Terraform YAML content for the folder.
         terraform_yaml_content = self.build_project_folder_terraform_yaml(
-            self.config_data, parent_folder_id
+            config_data, parent_folder_id, folder_label=folder_label
         )
-        self.log_info(f"Generated Terraform YAML content for folder: {terraform_yaml_content}")
+        self.log_info("Generated Terraform YAML content for folder: %s", terraform_yaml_content)
 
-        # Encode the YAML content to base64.
+        # Encode the YAML content to UTF-8 bytes.
         encoded_yaml = self.encode_yaml_file(terraform_yaml_content)
 
         # Define the file path for the Terraform YAML in the GitHub repository.
         # Example path: 'gcp/folders/my-new-folder/folder.yaml'
-        file_path = f"gcp/folders/{self.format_for_label_system(self.config_data['FOLDER_NAME'])}/folder.yaml"
-        commit_message = f"feat: Add GCP folder '{self.config_data['FOLDER_NAME']}' via Jira {self.config_data.get('ISSUE_KEY')}"
-        pr_title = f"feat: GCP Folder '{self.config_data['FOLDER_NAME']}' - Jira {self.config_data.get('ISSUE_KEY')}"
-        new_branch_name = f"feature/jira-{self.config_data.get('ISSUE_KEY')}-folder-{self.format_for_label_system(self.config_data['FOLDER_NAME'])}"
+        file_path = f"gcp/folders/{folder_label}/folder.yaml"
+        commit_message = f"feat: Add GCP folder '{folder_name}' via Jira {issue_key}"
+        pr_title = f"feat: GCP Folder '{folder_name}' - Jira {issue_key}"
+        new_branch_name = f"feature/jira-{issue_key}-folder-{folder_label}"
 
         # Prepare the GitHub payload structure.
         # This structure is designed to be consumed by the GitHubHandler.
         self.github_payload = {
-            self.config_data['FOLDER_NAME']: { # Use folder name as a key for this specific folder's data
-                "new_branch_name": new_branch_name,
-                "pr_title": pr_title,
-                "autoapprove": self.config_data.get("AUTO_APPROVE", False), # Assuming AUTO_APPROVE comes from Jira config
-                "yaml_content_encoded": {
-                    "folder_yaml": {
-                        "path": file_path,
-                        "commit_message": commit_message,
-                        "file": encoded_yaml
-                    }
-                }
-            }
+            folder_name: GitHubPayload( # Use folder name as a key for this specific folder's data
+                new_branch_name=new_branch_name,
+                pr_title=pr_title,
+                autoapprove=config_data.get("AUTO_APPROVE", False), # Assuming AUTO_APPROVE comes from Jira config
+                files=[YamlFile(path=file_path, commit_message=commit_message, file=encoded_yaml)],
+            )
         }
         self.log_info("Terraform YAMLs for folder creation built and GitHub payload prepared.")
 
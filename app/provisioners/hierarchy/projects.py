@@ -1,12 +1,15 @@
-from app.provisioners.base import HierarchyrProvisioner
+from app.provisioners.base import HierarchyrProvisioner, FOLDER_ASSET_TYPE, PROJECT_ASSET_TYPE
 from app.exceptions import GcpProvisioningError
+from app.payloads import GitHubPayload, YamlFile
+from app.logger import get_env_float
 # Import configuration mappings for environments and data security levels.
 from configs.jira.configurations import env_mapping, data_security_mapping
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import os
 
 # Define a global budget limit for auto-approval in development environments.
-BUDGET_LIMIT: int = os.getenv('BUDGET_LIMIT', 150)
+# Parsed once at import time: environment variables are strings and must not be compared to budgets as-is.
+BUDGET_LIMIT: float = get_env_float('BUDGET_LIMIT', 150.0)
 
 
 class GcpProjectProvisioner(HierarchyrProvisioner):
@@ -28,15 +31,19 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
                                       data extracted from the Jira webhook payload.
                                       This data drives the project provisioning process.
         logger (AppLogger): An instance of the AppLogger for logging messages.
-        elements_to_format (List[str]): A list of keys in `config_data` whose values
-                                        should be formatted for labels.
-        dw_env_project_name_list (List[str]): A list to store the generated
-                                              Datawave environment-specific project names.
+        elements_to_format (Tuple[str, ...]): The keys in `config_data` whose values
+                                              should be formatted for labels (class attribute).
+        dw_env_project_list (List[Tuple[str, str]]): The (environment, project name) pairs of the
+                                                     generated Datawave environment-specific projects.
         env_mapping (Dict[str, str]): A mapping from environment names (e.g., "dev")
                                       to their corresponding folder names (e.g., "development").
-        github_payload (Dict[str, Any]): A dictionary that will be populated with
-                                         the structured data required for GitHub operations.
+        github_payload (Dict[str, GitHubPayload]): A dictionary that will be populated with
+                                                   the GitHub operations of each project.
     """
+    __slots__ = ("config_data", "dw_env_project_list", "env_mapping", "github_payload")
+
+    # Elements in config_data that need special formatting for GCP labels.
+    elements_to_format = ("ENGAGEMENT_MANAGER", "PROJECT_NAME", "FOLDER_NAME", "WBS", "DATASECURITY")
 
     def __init__(self, config_data: Dict[str, Any]):
         """
@@ -48,12 +55,9 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
         """
         super().__init__() # Initialize the parent HierarchyrProvisioner (which also initializes AppLogger).
         self.config_data = config_data # Store the parsed configuration data.
-
-        # Define elements in config_data that need special formatting for GCP labels.
-        self.elements_to_format = ["ENGAGEMENT_MANAGER", "PROJECT_NAME", "FOLDER_NAME", "WBS", "DATASECURITY"]
-        self.dw_env_project_name_list: List[str] = [] # List to store generated project IDs (e.g., dw-dev-myproject).
+        self.dw_env_project_list: List[Tuple[str, str]] = [] # Generated (environment, project ID) pairs (e.g., ("dev", "dw-dev-myproject")).
         self.env_mapping = env_mapping # Mapping for environment names to folder names.
-        self.github_payload: Dict[str, Any] = {} # Dictionary to store GitHub-related payload for each project.
+        self.github_payload: Dict[str, GitHubPayload] = {} # GitHub payload for each project.
 
     def _get_request_comment_message(self) -> str:
         """
@@ -65,13 +69,16 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
             str: A multi-line string summarizing the project creation request details.
         """
         # Retrieve general project details from config_data, providing 'N/A' as a fallback.
-        issue_key = self.config_data.get('ISSUE_KEY', 'N/A')
-        folder_name = self.config_data.get('FOLDER_NAME', 'N/A')
-        project_type = self.config_data.get('PROJECT_TYPE', 'N/A')
-        project_type_folder = self.config_data.get('PROJECT_TYPE_FOLDER', 'N/A')
-        data_security = self.config_data.get('DATASECURITY', 'N/A')
-
-        # Create a list of initial description parts, using emojis for clarity.
+        config_data = self.config_data
+        issue_key = config_data.get('ISSUE_KEY', 'N/A')
+        folder_name = config_data.get('FOLDER_NAME', 'N/A')
+        project_type = config_data.get('PROJECT_TYPE', 'N/A')
+        project_type_folder = config_data.get('PROJECT_TYPE_FOLDER', 'N/A')
+        data_security = config_data.get('DATASECURITY', 'N/A')
+
+        # Build all description parts in one list, using emojis for clarity:
+        # the general details, then one line per Datawave environment project,
+        # with the budget of its environment ("BUDGET_<ENV>").
         description_parts = [
             f"*Jira Issue:* 🔑 {issue_key}",
             f"*Target Folder:* 📂 {folder_name}",
@@ -79,23 +86,13 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
             f"*Project Type Folder:* 🗂️ {project_type_folder}",
             f"*Data Security Level:* {data_security} 🛡️",
             "*Target Environments:* 🌐",
+            *(
+                f"- *{env}*: Name: `{dw_env_project_name}`, Budget (euros): `{config_data.get(f'BUDGET_{env}', 'N/A')}`"
+                for environment, dw_env_project_name in self.dw_env_project_list
+                for env in (environment.upper(),)
+            ),
         ]
 
-        environment_details = []
-        # Iterate through the list of generated Datawave environment project names.
-        for dw_env_project_name in self.dw_env_project_name_list:
-            # Extract the environment name (e.g., "dev", "test", "prod") from the project name.
-            env = self.extract_dw_environment(dw_env_project_name)
-            # Construct the key for retrieving the budget for this specific environment.
-            budget_key = f"BUDGET_{env.upper()}"
-            # Retrieve the budget value, defaulting to 'N/A' if not found.
-            budget = self.config_data.get(budget_key, 'N/A')
-            # Add formatted environment-specific details to the list.
-            environment_details.append(f"- *{env.upper()}*: Name: `{dw_env_project_name}`, Budget (euros): `{budget}`")
-
-        # Extend the main description parts with the environment-specific details.
-        description_parts.extend(environment_details)
-
         # Join all parts with newline characters to form the final message.
         return "\n".join(description_parts)
 
@@ -114,7 +111,8 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
 
         Raises:
             ValueError: If the `data` dictionary is empty, or if 'ENVIRONMENT' field
-                        is missing/empty, or if any environment lacks a budget key.
+                        is missing/empty, or if any environment lacks a budget key
+                        (all missing keys are reported together).
         """
         if not data:
             raise ValueError("The config_data structure is empty.")
@@ -125,39 +123,61 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
         else:
             env_list = data["ENVIRONMENT"] # List of environments (e.g., ["dev", "test", "prod"]).
 
-        # Iterate through each environment and check for its corresponding budget key.
-        for env in env_list:
-            budget_key = f"BUDGET_{env.upper()}"
-            if budget_key not in data:
-                # If a budget key is missing, raise a ValueError.
-                raise ValueError(f"The '{env}' environment has no associated budget key ('{budget_key}'). "
-                                 "Please ensure this information is included in the Jira request.")
+        # Compare the expected budget keys of all environments with the keys of config_data at once.
+        missing_budget_keys = {f"BUDGET_{env.upper()}" for env in env_list}.difference(data)
+        if missing_budget_keys:
+            # If any budget key is missing, raise a ValueError listing all of them.
+            raise ValueError(f"Some environments have no associated budget key ({', '.join(sorted(missing_budget_keys))}). "
+                             "Please ensure this information is included in the Jira request.")
 
         return True # All budget keys are present.
 
-    def _validate_folder_existence(self) -> None:
+    def get_data_type_tag(self) -> str:
+        """
+        Resolves the data type tag (e.g., "tagValues/281478635840395") of the requested data security level.
+
+        Returns:
+            str: The tag value mapped to `config_data["DATASECURITY"]` in `data_security_mapping`.
+
+        Raises:
+            GcpProvisioningError: If the data security level has no mapped tag.
+        """
+        data_security = self.config_data["DATASECURITY"]
+        data_type_tag = data_security_mapping.get(data_security)
+        if data_type_tag is None:
+            error_message = f"Unknown data security level '{data_security}'. Expected one of: {', '.join(data_security_mapping)}."
+            self.log_error(error_message)
+            raise GcpProvisioningError(error_message)
+        return data_type_tag
+
+    def _validate_folder_existence(self) -> str:
         """
         Validates if the specified parent folder (where the new projects will reside)
         exists in the Google Cloud resource hierarchy.
 
+        Returns:
+            str: The full resource name of the parent folder (e.g., "folders/12345").
+
         Raises:
             ValueError: If the specified folder is not found.
         """
         folder_name = self.config_data['FOLDER_NAME']
-        self.log_info(f"Checking if parent folder '{folder_name}' exists.")
+        self.log_info("Checking if parent folder '%s' exists.", folder_name)
         # Use the inherited method to check for folder existence.
-        if not self.check_if_resource_exist(folder_name, resource_type="cloudresourcemanager.googleapis.com/Folder"):
+        parent_folder_match = self.check_if_resource_exist(folder_name, resource_type=FOLDER_ASSET_TYPE)
+        if not parent_folder_match:
             # If the folder does not exist, log an error and raise a ValueError.
             error_message = f"Parent folder '{folder_name}' not found in the resource hierarchy."
             self.log_error(error_message)
             raise ValueError(error_message)
-        self.log_info(f"Parent folder '{folder_name}' found. Proceeding with project validation.")
+        self.log_info("Parent folder '%s' found. Proceeding with project validation.", folder_name)
+        return parent_folder_match
 
     def _validate_project_name_uniqueness(self, project_name: str, environment: str) -> None:
         """
         Validates that a new GCP project name, constructed with the environment prefix,
         does not already exist in the Google Cloud resource hierarchy.
-        Appends the generated project name to `self.dw_env_project_name_list` if unique.
+        Appends the environment and the generated project name to `self.dw_env_project_list` if unique.
 
         Args:
             project_name (str): The base project name from Jira (e.g., "myproject").
@@ -168,19 +188,19 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
         """
         # Construct the full Datawave environment-prefixed project name.
         dw_env_project_name = f'dw-{environment}-{project_name}'
-        self.log_info(f"Checking uniqueness for project name '{dw_env_project_name}'.")
+        self.log_info("Checking uniqueness for project name '%s'.", dw_env_project_name)
         # Check if a project with this name already exists.
-        if self.check_if_resource_exist(dw_env_project_name, resource_type="cloudresourcemanager.googleapis.com/Project"):
+        if self.check_if_resource_exist(dw_env_project_name, resource_type=PROJECT_ASSET_TYPE):
             # If it exists, log an error and raise a ValueError.
             error_message = f"Project '{dw_env_project_name}' exists already in the resource hierarchy."
             self.log_error(error_message)
             raise ValueError(error_message)
 
-        self.log_info(f"Project '{dw_env_project_name}' does not exist. Proceeding.")
-        # Add the unique project name to the list for later use.
-        self.dw_env_project_name_list.append(dw_env_project_name)
+        self.log_info("Project '%s' does not exist. Proceeding.", dw_env_project_name)
+        # Add the environment and the unique project name to the list for later use.
+        self.dw_env_project_list.append((environment, dw_env_project_name))
 
-    def _validate_environment_subfolder(self, folder_name: str, environment: str) -> None:
+    def _validate_environment_subfolder(self, folder_name: str, environment: str, parent_folder_id: Optional[str] = None) -> None:
         """
         Validates if the environment-specific subfolder (e.g., 'development', 'production')
         exists directly under the main parent folder. It also stores the ID of this subfolder
@@ -189,6 +209,8 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
         Args:
             folder_name (str): The display name of the main parent folder.
             environment (str): The environment (e.g., "dev", "test", "prod").
+            parent_folder_id (Optional[str]): The already resolved ID of the main parent folder
+                                              (see `get_project_subfolder_id`).
 
         Raises:
             ValueError: If no mapping is found for the environment or if the subfolder is not found.
@@ -197,19 +219,19 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
         subfolder_to_find = self.env_mapping.get(environment)
         if not subfolder_to_find:
             # If no mapping exists for the environment, log a warning and raise an error.
-            self.log_warning(f"No folder mapping found for environment '{environment}'.")
+            self.log_warning("No folder mapping found for environment '%s'.", environment)
             raise ValueError(f"No folder mapping found for environment '{environment}'.")
 
-        self.log_info(f"Checking for subfolder '{subfolder_to_find}' under parent folder '{folder_name}'.")
+        self.log_info("Checking for subfolder '%s' under parent folder '%s'.", subfolder_to_find, folder_name)
         # Get the full resource ID of the environment-specific subfolder.
-        env_folder_id = self.get_project_subfolder_id(folder_name, subfolder_to_find)
+        env_folder_id = self.get_project_subfolder_id(folder_name, subfolder_to_find, parent_folder_id)
         if env_folder_id:
             # If found, extract the clean folder ID and store it in config_data.
             self.config_data[f"FOLDER_{environment.upper()}"] = self._extract_folder_id(env_folder_id)
-            self.log_info(f"ID of subfolder '{subfolder_to_find}' under '{folder_name}': {env_folder_id}")
+            self.log_info("ID of subfolder '%s' under '%s': %s", subfolder_to_find, folder_name, env_folder_id)
         else:
             # If the subfolder is not found, log an error and raise a ValueError.
-            self.log_error(f"Subfolder '{subfolder_to_find}' not found under '{folder_name}'.")
+            self.log_error("Subfolder '%s' not found under '%s'.", subfolder_to_find, folder_name)
             raise ValueError(f"Subfolder '{subfolder_to_find}' not found under '{folder_name}'.")
 
     def validate_folder_and_projects_name(self) -> None:
@@ -223,24 +245,27 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
         """
         try:
             self.log_info("Starting validation of folder and project names.")
-            # Validate the existence of the main parent folder.
-            self._validate_folder_existence()
+            # Validate the existence of the main parent folder, and resolve its ID once for all environments.
+            parent_folder_id = self._extract_folder_id(self._validate_folder_existence())
 
-            project_name = self.config_data["PROJECT_NAME"]
+            config_data = self.config_data
+            project_name = config_data["PROJECT_NAME"]
+            folder_name = config_data["FOLDER_NAME"]
             # Iterate through each environment specified in the Jira request.
-            for each_env in self.config_data["ENVIRONMENT"]:
+            # Every check is an index lookup (see `HierarchyrProvisioner._index_assets`), not a scan of the assets.
+            for each_env in config_data["ENVIRONMENT"]:
                 # Validate uniqueness of the project name for the current environment.
                 self._validate_project_name_uniqueness(project_name, each_env)
                 # Validate the existence of the environment-specific subfolder.
-                self._validate_environment_subfolder(self.config_data['FOLDER_NAME'], each_env)
+                self._validate_environment_subfolder(folder_name, each_env, parent_folder_id)
             self.log_info("Folder and project name validation completed successfully.")
         except Exception as e:
             # Log the error and re-raise to be handled by the AppManager.
-            self.log_error(f"Error during folder and project name validation: {e}")
+            self.log_error("Error during folder and project name validation: %s", e)
             raise GcpProvisioningError(f"Validation error during folder/project name check: {e}")
 
 
-    def get_project_subfolder_id(self, parent_folder_name: str, subfolder_name: str) -> Optional[str]:
+    def get_project_subfolder_id(self, parent_folder_name: str, subfolder_name: str, parent_folder_id: Optional[str] = None) -> Optional[str]:
         """
         Retrieves the full resource ID (e.g., "folders/12345") of a subfolder
         given its parent folder's display name and the subfolder's display name.
@@ -249,6 +274,8 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
         Args:
             parent_folder_name (str): The display name of the parent folder.
             subfolder_name (str): The display name of the subfolder to find.
+            parent_folder_id (Optional[str]): The ID of the parent folder, if the caller already
+                                              resolved it. Otherwise it is looked up by display name.
 
         Returns:
             Optional[str]: The full resource name (folder ID) of the subfolder if found
@@ -257,38 +284,35 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
         Raises:
             Exception: If the parent folder is not found, preventing subfolder search.
         """
-        self.log_info(f"Searching for subfolder '{subfolder_name}' under parent '{parent_folder_name}'.")
-        # First, get the full resource ID of the parent folder.
-        parent_folder_id_match = self.check_if_resource_exist(parent_folder_name, resource_type="cloudresourcemanager.googleapis.com/Folder")
-        if not parent_folder_id_match:
-            # If the parent folder is not found, log an error and raise an exception.
-            error_message = f"Parent folder '{parent_folder_name}' not found. Cannot search for subfolder '{subfolder_name}'."
-            self.log_error(error_message)
-            raise GcpProvisioningError(error_message)
-
-        # Extract the clean folder ID from the matched parent folder resource name.
-        parent_folder_id = self._extract_folder_id(parent_folder_id_match)
+        self.log_info("Searching for subfolder '%s' under parent '%s'.", subfolder_name, parent_folder_name)
         if not parent_folder_id:
-            error_message = f"Could not extract ID for parent folder '{parent_folder_name}'. Cannot search for subfolder '{subfolder_name}'."
-            self.log_error(error_message)
-            raise GcpProvisioningError(error_message)
-
-        # Iterate through all fetched assets to find the subfolder.
-        for asset in self.assets:
-            # Check if the asset is a folder and its display name matches the subfolder name.
-            if (asset.asset_type == "cloudresourcemanager.googleapis.com/Folder" and
-                    asset.resource.data.get("displayName") == subfolder_name):
-                # Check if the parent_folder_id is in the asset's ancestors list.
-                # Ancestors are typically in the format "folders/ID" or "organizations/ID".
-                if asset.ancestors and parent_folder_id in asset.ancestors:
-                    self.log_info(f"Subfolder '{subfolder_name}' found under '{parent_folder_name}'. ID: {asset.name}")
-                    return asset.name
-                # Fallback for direct parent relationship if ancestors list is not comprehensive or direct parent is needed.
-                elif asset.resource.data.get("parent") == parent_folder_id:
-                    self.log_info(f"Subfolder '{subfolder_name}' found under '{parent_folder_name}'. ID: {asset.name}")
-                    return asset.name
-
-        self.log_info(f"Subfolder '{subfolder_name}' not found directly under folder '{parent_folder_name}'.")
+            # First, get the full resource ID of the parent folder.
+            parent_folder_id_match = self.check_if_resource_exist(parent_folder_name, resource_type=FOLDER_ASSET_TYPE)
+            if not parent_folder_id_match:
+                # If the parent folder is not found, log an error and raise an exception.
+                error_message = f"Parent folder '{parent_folder_name}' not found. Cannot search for subfolder '{subfolder_name}'."
+                self.log_error(error_message)
+                raise GcpProvisioningError(error_message)
+
+            # Extract the clean folder ID from the matched parent folder resource name.
+            parent_folder_id = self._extract_folder_id(parent_folder_id_match)
+            if not parent_folder_id:
+                error_message = f"Could not extract ID for parent folder '{parent_folder_name}'. Cannot search for subfolder '{subfolder_name}'."
+                self.log_error(error_message)
+                raise GcpProvisioningError(error_message)
+
+        # Only the folders whose display name matches the subfolder name are candidates.
+        for asset in self.folders_by_name.get(subfolder_name, ()):
+            # Check if the parent_folder_id is in the asset's ancestors list.
+            # Ancestors are typically in the format "folders/ID" or "organizations/ID".
+            ancestors = asset.ancestors
+            # Fallback for direct parent relationship if ancestors list is not comprehensive or direct parent is needed.
+            if (ancestors and parent_folder_id in ancestors) or asset.resource.data.get("parent") == parent_folder_id:
+                asset_name = asset.name
+                self.log_info("Subfolder '%s' found under '%s'. ID: %s", subfolder_name, parent_folder_name, asset_name)
+                return asset_name
+
+        self.log_info("Subfolder '%s' not found directly under folder '%s'.", subfolder_name, parent_folder_name)
         return None # Return None if the subfolder is not found under the specified parent.
 
 
@@ -309,14 +333,34 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
             self.validate_folder_and_projects_name()
             # Check if all specified environments have corresponding budget keys.
             self.check_budget_keys(self.config_data)
+            # Check that the data security level has a data type tag, before any YAML is built.
+            self.get_data_type_tag()
             self.log_info("Jira request validation for GCP project provisioning completed successfully.")
         except Exception as e:
             # Log the error and re-raise it as a GcpProvisioningError for consistent handling.
-            self.log_error(f"GCP project provisioning validation failed: {e}")
+            self.log_error("GCP project provisioning validation failed: %s", e)
             raise GcpProvisioningError(f"Project provisioning validation error: {e}")
 
 
-    def build_project_terraform_yaml(self, dw_env_project_name: str, env: str, data_type_tag: str) -> Dict[str, Any]:
+    def build_base_labels(self) -> Dict[str, Any]:
+        """
+        Builds the GCP labels shared by the projects of every environment of the request.
+
+        Returns:
+            Dict[str, Any]: The labels that do not depend on the environment.
+        """
+        config_data = self.config_data
+        return {
+            "project_type": config_data["PROJECT_TYPE"], # e.g., "internal" or "client".
+            "project_sub_type": config_data["PROJECT_TYPE_FOLDER"], # e.g., "asset", "sandbox", "poc".
+            "project_name_folder": config_data["FOLDER_NAME"], # Name of the overarching folder.
+            "data_security": config_data["DATASECURITY"], # Data security level.
+            "engagement_manager": config_data["ENGAGEMENT_MANAGER"], # Engagement manager's name.
+            "wbs": config_data["WBS"] # Work Breakdown Structure code.
+        }
+
+    def build_project_terraform_yaml(self, dw_env_project_name: str, env: str, data_type_tag: str,
+                                     base_labels: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Builds the Terraform YAML configuration for a single GCP project.
         This includes parent folder, Shared VPC settings, billing budgets,
@@ -326,13 +370,18 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
             dw_env_project_name (str): The full Datawave environment-prefixed project ID.
             env (str): The environment (e.g., "dev", "test", "prod").
             data_type_tag (str): The data type tag (e.g., "data-type/l0").
+            base_labels (Optional[Dict[str, Any]]): The labels shared by all environments,
+                                                    as returned by `build_base_labels`.
+                                                    Built from `config_data` when omitted.
 
         Returns:
             Dict[str, Any]: A dictionary representing the Terraform configuration for the project.
         """
-        self.log_info(f"Building Terraform YAML for project '{dw_env_project_name}' in environment '{env}'.")
+        self.log_info("Building Terraform YAML for project '%s' in environment '%s'.", dw_env_project_name, env)
         # Get the specific folder ID for the current environment from config_data.
         env_folder = f"FOLDER_{env.upper()}"
+        if base_labels is None:
+            base_labels = self.build_base_labels()
 
         return {
             "parent": self.config_data[env_folder], # Parent folder for this specific environment.
@@ -349,14 +398,9 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
                 "data-type": data_type_tag # e.g., "data-type/l0" based on data security.
             },
             "labels": { # GCP Labels for organization and cost allocation.
+                **base_labels,
                 "environment": env, # e.g., "dev", "test", "prod".
-                "project_type": self.config_data["PROJECT_TYPE"], # e.g., "internal" or "client".
-                "project_sub_type": self.config_data["PROJECT_TYPE_FOLDER"], # e.g., "asset", "sandbox", "poc".
-                "project_name_folder": self.config_data["FOLDER_NAME"], # Name of the overarching folder.
                 "project_name": dw_env_project_name, # Complete project ID with environment prefix.
-                "data_security": self.config_data["DATASECURITY"], # Data security level.
-                "engagement_manager": self.config_data["ENGAGEMENT_MANAGER"], # Engagement manager's name.
-                "wbs": self.config_data["WBS"] # Work Breakdown Structure code.
             }
         }
 
@@ -372,7 +416,7 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
         Returns:
             Dict[str, Any]: A dictionary representing the Terraform configuration for the budget.
         """
-        self.log_info(f"Building Terraform YAML for budget of project '{dw_env_project_name}'.")
+        self.log_info("Building Terraform YAML for budget of project '%s'.", dw_env_project_name)
         # Get the budget amount for the specific environment.
         env_budget_key = f"BUDGET_{env.upper()}"
         return {
@@ -411,20 +455,65 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
 
         Args:
             data_security (str): The data security level (e.g., "l0", "l1", "l2").
-            budget_dev (float): The budget allocated for the development environment.
+            budget_dev (float): The budget allocated for the development environment
+                                (a number or a numeric string).
 
         Returns:
             bool: True if auto-approval is allowed, False otherwise.
         """
-        # Auto-approval is restricted to 'l0' data security.
-        if data_security == "l0":
-            # For 'l0', auto-approval is further restricted by the development budget.
-            if budget_dev is not None and budget_dev < BUDGET_LIMIT:
-                return True # Auto-approve if budget is within limit.
-            else:
-                return False # Do not auto-approve if budget exceeds limit or is missing.
-        else:
+        # Auto-approval is restricted to 'l0' data security; other levels are rejected before parsing the budget.
+        if data_security != "l0":
             return False # Do not auto-approve for other data security levels.
+        # For 'l0', auto-approval is further restricted by the development budget.
+        try:
+            return float(budget_dev) < BUDGET_LIMIT # Auto-approve if budget is within limit.
+        except (TypeError, ValueError):
+            return False # Do not auto-approve if the budget is missing or not a number.
+
+    def _build_project_payload(self, dw_env_project_name: str, env: str, new_branch_name: str, issue_key: str,
+                               data_type_tag: str, base_labels: Dict[str, Any], autoapprove: bool) -> GitHubPayload:
+        """
+        Builds and encodes the budget and project Terraform YAML files of one environment-specific
+        project, and the GitHub operations to commit them.
+
+        Args:
+            dw_env_project_name (str): The full Datawave environment-prefixed project ID.
+            env (str): The environment (e.g., "dev", "test", "prod").
+            new_branch_name (str): The branch the files are committed to.
+            issue_key (str): The Jira issue key, used in the commit messages and the pull request title.
+            data_type_tag (str): The data type tag (see `get_data_type_tag`).
+            base_labels (Dict[str, Any]): The labels shared by all environments (see `build_base_labels`).
+            autoapprove (bool): Whether the pull request of this project is auto-approved.
+
+        Returns:
+            GitHubPayload: The GitHub operations of the project.
+        """
+        self.log_info("Processing project: %s", dw_env_project_name)
+
+        # Build and encode (UTF-8 bytes) the budget and project Terraform YAML files.
+        files = [
+            YamlFile(
+                path=f'data/{type_file}s/{dw_env_project_name}.yaml',
+                commit_message=f'[{issue_key}] Add configuration {type_file} for {dw_env_project_name} project.',
+                file=self.encode_yaml_file(yaml_data),
+            )
+            for type_file, yaml_data in (
+                ("budget", self.build_budget_terraform_yaml(dw_env_project_name, env)),
+                ("project", self.build_project_terraform_yaml(dw_env_project_name, env, data_type_tag, base_labels)),
+            )
+        ]
+
+        if autoapprove:
+            self.log_info("Auto-approval enabled for %s (dev, l0, budget within limit).", dw_env_project_name)
+        else:
+            self.log_info("Auto-approval disabled for %s.", dw_env_project_name)
+
+        return GitHubPayload(
+            new_branch_name=new_branch_name,
+            pr_title=f'[{issue_key}] PR for project creation: {dw_env_project_name}',
+            autoapprove=autoapprove,
+            files=files,
+        )
 
     def _built_terraform_yamls(self) -> None:
         """
@@ -440,66 +529,36 @@ class GcpProjectProvisioner(HierarchyrProvisioner):
         """
         self.log_info("Starting to build Terraform YAMLs for project creation and budgets.")
         try:
+            config_data = self.config_data
             # Generate a new branch name based on the Jira issue key.
-            new_branch_name = f'ticket-{self.config_data["ISSUE_KEY"]}'
+            new_branch_name = f'ticket-{config_data["ISSUE_KEY"]}'
+            issue_key = config_data.get("ISSUE_KEY", "N/A")
+            data_security = config_data["DATASECURITY"]
             # Get the data type tag based on the data security level.
-            data_type_tag = data_security_mapping[self.config_data["DATASECURITY"]]
-
-            # Iterate through each environment-specific project name that was validated earlier.
+            data_type_tag = self.get_data_type_tag()
+            # The labels that are identical for the projects of every environment.
+            base_labels = self.build_base_labels()
+            # Auto-approval is currently only for 'dev' environment with 'l0' data security and within budget limit.
+            # The budget condition does not depend on the environment, so it is evaluated once.
+            dev_autoapprove = self.allow_autoapprove_on_dev_budget_limit(
+                data_security,
+                config_data.get("BUDGET_DEV", 0.0)) # Use .get with default for safety
+
+            # Build the payload of each environment-specific project name that was validated earlier, in one pass.
             # It's important to process 'dev' first if auto-approval is a consideration.
-            for dw_env_project_name in self.dw_env_project_name_list:
-                self.log_info(f"Processing project: {dw_env_project_name}")
-
-                # Initialize a dictionary for this specific project within the github_payload.
-                self.github_payload[dw_env_project_name] = {}
-                # Set the pull request title for this project.
-                self.github_payload[dw_env_project_name]["pr_title"] = \
-                    f'[{self.config_data.get("ISSUE_KEY", "N/A")}] PR for project creation: {dw_env_project_name}'
-
-                # Extract the environment (e.g., "dev") from the project name.
-                self.github_payload[dw_env_project_name]["env"] = self.extract_dw_environment(dw_env_project_name)
-                self.github_payload[dw_env_project_name]["data_type_tag"] = data_type_tag
-                self.github_payload[dw_env_project_name]["new_branch_name"] = new_branch_name
-
-                # Initialize a nested dictionary for encoded YAML content for this project.
-                self.github_payload[dw_env_project_name]["yaml_content_encoded"] = {}
-
-                # Loop to build both budget and project YAML files.
-                for type_file in ["budget", "project"]:
-                    self.github_payload[dw_env_project_name]["yaml_content_encoded"][type_file] = {}
-                    if type_file == "budget":
-                        # Build and encode the budget Terraform YAML.
-                        self.github_payload[dw_env_project_name]["yaml_content_encoded"][type_file]["file"] = \
-                            self.encode_yaml_file(self.build_budget_terraform_yaml(
-                                dw_env_project_name, self.github_payload[dw_env_project_name]["env"]))
-                    elif type_file == "project":
-                        # Build and encode the project Terraform YAML.
-                        self.github_payload[dw_env_project_name]["yaml_content_encoded"][type_file]["file"] = \
-                            self.encode_yaml_file(self.build_project_terraform_yaml(
-                                dw_env_project_name, self.github_payload[dw_env_project_name]["env"], data_type_tag))
-
-                    # Set commit message and file path for the current YAML file.
-                    self.github_payload[dw_env_project_name]["yaml_content_encoded"][type_file]["commit_message"] = \
-                        f'[{self.config_data.get("ISSUE_KEY", "N/A")}] Add configuration {type_file} for {dw_env_project_name} project.'
-                    self.github_payload[dw_env_project_name]["yaml_content_encoded"][type_file]["path"] = \
-                        f'data/{type_file}s/{dw_env_project_name}.yaml'
-
-                # Determine if auto-approval is allowed for this project.
-                # Auto-approval is currently only for 'dev' environment with 'l0' data security and within budget limit.
-                if (self.github_payload[dw_env_project_name]["env"] == "dev" and
-                        self.allow_autoapprove_on_dev_budget_limit(
-                            self.config_data["DATASECURITY"],
-                            self.config_data.get("BUDGET_DEV", 0.0))): # Use .get with default for safety
-                    self.github_payload[dw_env_project_name]["autoapprove"] = True
-                    self.log_info(f"Auto-approval enabled for {dw_env_project_name} (dev, l0, budget within limit).")
-                else:
-                    self.github_payload[dw_env_project_name]["autoapprove"] = False
-                    self.log_info(f"Auto-approval disabled for {dw_env_project_name}.")
+            # The environment (e.g., "dev") of each project was recorded when its name was built.
+            self.github_payload = {
+                dw_env_project_name: self._build_project_payload(
+                    dw_env_project_name, env, new_branch_name, issue_key, data_type_tag, base_labels,
+                    autoapprove=env == "dev" and dev_autoapprove,
+                )
+                for env, dw_env_project_name in self.dw_env_project_list
+            }
 
             self.log_info("Terraform YAMLs built and GitHub payload prepared for all projects.")
 
         except Exception as e:
             # Log and re-raise any unexpected errors during YAML building.
-            self.log_error(f"An error occurred during building Terraform YAMLs: {e}")
+            self.log_error("An error occurred during building Terraform YAMLs: %s", e)
             raise GcpProvisioningError(f"Failed to build Terraform YAMLs: {e}")
 
@@ -0,0 +1,192 @@
+from typing import Any, Union
+import json
+import threading
+
+# orjson is an optional, much faster drop-in for the standard library json module.
+# When it is not installed, every helper below falls back to stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pysimdjson is an optional On-Demand style parser: documents are parsed lazily and only
+# the values that are actually accessed are converted into Python objects.
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Upper bound for the size of a single document handled by a reused simdjson parser (16 MiB).
+SIMDJSON_MAX_CAPACITY: int = 16 << 20
+
+# One simdjson parser per worker thread, reused across webhook invocations so its internal
+# buffers are allocated once per warm instance instead of once per request.
+_parser_local = threading.local()
+
+
+def json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Deserializes a JSON document into Python objects.
+
+    Args:
+        data (Union[bytes, bytearray, str]): The raw JSON document (e.g., a request body).
+
+    Returns:
+        Any: The decoded Python object.
+
+    Raises:
+        ValueError: If the document is not valid JSON. Both `orjson.JSONDecodeError`
+                    and `json.JSONDecodeError` are subclasses of ValueError.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serializes a Python object into a JSON string.
+
+    Args:
+        obj (Any): The object to serialize.
+        indent (bool): If True, pretty-prints the output with 2-space indentation.
+
+    Returns:
+        str: The JSON representation of the object.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serializes a Python object into UTF-8 encoded JSON, ready to be sent as a request body.
+
+    Args:
+        obj (Any): The object to serialize.
+        indent (bool): If True, pretty-prints the output with 2-space indentation.
+
+    Returns:
+        bytes: The JSON representation of the object (compact unless `indent` is set).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_parse_lazy(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Parses a JSON document without materializing it into Python objects upfront.
+
+    With pysimdjson installed, the returned document is a lazy `simdjson.Object`
+    (or `simdjson.Array`) proxy; values are only converted when accessed. Without it,
+    the document is fully decoded with `json_loads`.
+
+    Args:
+        data (Union[bytes, bytearray, str]): The raw JSON document.
+
+    Returns:
+        Any: A lazy document proxy or the fully decoded Python object.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if simdjson is not None:
+        return _parse_with_cached_parser(data)
+    return json_loads(data)
+
+
+def _parse_with_cached_parser(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Parses a document with the simdjson parser cached for the current thread.
+
+    A parser can only be reused once no proxies of its previous document are alive.
+    If a previous document is still referenced, a fresh parser replaces the cached one.
+
+    Args:
+        data (Union[bytes, bytearray, str]): The raw JSON document.
+
+    Returns:
+        Any: The lazy document proxy.
+    """
+    parser = getattr(_parser_local, "parser", None)
+    if parser is not None:
+        try:
+            return parser.parse(data)
+        except RuntimeError:
+            # The previous document is still referenced and must stay valid.
+            pass
+    parser = simdjson.Parser(max_capacity=SIMDJSON_MAX_CAPACITY)
+    _parser_local.parser = parser
+    return parser.parse(data)
+
+
+def is_json_array(value: Any) -> bool:
+    """
+    Checks whether a parsed value is a JSON array, either as a list or a lazy simdjson proxy.
+
+    Args:
+        value (Any): The value returned by `json_parse_lazy`, `json_loads` or `get_pointer`.
+
+    Returns:
+        bool: True if the value is a JSON array.
+    """
+    if simdjson is not None and isinstance(value, simdjson.Array):
+        return True
+    return isinstance(value, list)
+
+
+def materialize(value: Any) -> Any:
+    """
+    Converts a lazy simdjson proxy (object or array) into plain Python dicts and lists.
+    Any other value is returned unchanged.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: The fully materialized Python value.
+    """
+    if simdjson is not None:
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+    return value
+
+
+def get_pointer(document: Any, pointer: str) -> Any:
+    """
+    Resolves a JSON Pointer (RFC 6901, e.g. "/issue/fields/issuetype/name") against a document.
+
+    Lazy simdjson documents resolve the pointer natively; plain dicts and lists are walked
+    segment by segment.
+
+    Args:
+        document (Any): The parsed JSON document.
+        pointer (str): The JSON Pointer to resolve.
+
+    Returns:
+        Any: The value found at the pointer (lazy proxies are not materialized).
+
+    Raises:
+        KeyError: If the pointer does not resolve to a value in the document.
+    """
+    if simdjson is not None and isinstance(document, (simdjson.Object, simdjson.Array)):
+        try:
+            return document.at_pointer(pointer)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise KeyError(pointer) from e
+
+    value = document
+    for segment in pointer.split("/")[1:]:
+        segment = segment.replace("~1", "/").replace("~0", "~")
+        try:
+            value = value[int(segment)] if isinstance(value, list) else value[segment]
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise KeyError(pointer) from e
+    return value
@@ -1,3 +1,47 @@
+# Field configurations shared by the project and folder creation tickets. Both tables reference
+# the same dicts, so each shared field (and its validator) is defined and prepared only once.
+project_type_field = {
+    "type":  "dropdown",
+    "input_name": "customfield_10611",
+    "output_name": "PROJECT_TYPE",
+    "mandatory": True
+}
+
+project_type_folder_field = {
+    "type":  "dropdown_nested",
+    "input_name": "customfield_10611",
+    "output_name": "PROJECT_TYPE_FOLDER",
+    "mandatory": True
+}
+
+folder_name_field = {
+    "type": "textfield",
+    "input_name": "customfield_10578",
+    "output_name": "FOLDER_NAME",
+    "validation": r"^[0-9A-Za-z-_]{3,30}$", # up to 30 chars, need to be unique
+                                        # validate that the folder exists already
+    'regex_error_message': "'FOLDER_NAME' must be alphanumeric (letters, numbers, '-', '_') and between 3 and 30 characters long.",
+    "mandatory": True
+}
+
+wbs_field = { # commessa
+    "type": "textfield",
+    "input_name": "customfield_10644",
+    "output_name": "WBS",
+    "validation": r"^[0-9A-Za-z-_]{3,100}$", # up to 30 chars, need to be unique
+                                        # validate that the folder exists already
+    'regex_error_message': "'WBS' must be alphanumeric (letters, numbers, '-', '_') and between 3 and 100 characters long.",
+    "mandatory": False
+}
+
+engagement_manager_field = {
+    "type":  "reporter",
+    "input_name": "reporter",
+    "output_name": "ENGAGEMENT_MANAGER",
+    "mandatory": False
+}
+
+
 project_creation_ticket_fields = { 
             "DATASECURITY": {
                 "type":  "dropdown", 
@@ -7,22 +51,10 @@ project_creation_ticket_fields = {
             },
 
             # customfield_10611
-            "PROJECT_TYPE": {
-                "type":  "dropdown", 
-                "input_name": "customfield_10611",
-                "output_name": "PROJECT_TYPE",
-                "mandatory": True
-
-            },
+            "PROJECT_TYPE": project_type_field,
 
             # customfield_10611
-            "PROJECT_TYPE_FOLDER": {
-                "type":  "dropdown_nested",
-                "input_name": "customfield_10611",
-                "output_name": "PROJECT_TYPE_FOLDER",
-                "mandatory": True
-
-            },
+            "PROJECT_TYPE_FOLDER": project_type_folder_field,
 
             "ENVIRONMENT": {
                 "type":  "checklist", 
@@ -74,36 +106,11 @@ project_creation_ticket_fields = {
 
             },
 
-            "FOLDER_NAME": {
-                "type": "textfield",
-                "input_name": "customfield_10578",
-                "output_name": "FOLDER_NAME",
-                "validation": r"^[0-9A-Za-z-_]{3,30}$", # up to 30 chars, need to be unique
-                                                    # validate that the folder exists already
-                'regex_error_message': "'FOLDER_NAME' must be alphanumeric (letters, numbers, '-', '_') and between 3 and 30 characters long.",
-                "mandatory": True
-
-
-            },
+            "FOLDER_NAME": folder_name_field,
 
-            "WBS": { # commessa
-                "type": "textfield",
-                "input_name": "customfield_10644",
-                "output_name": "WBS",
-                "validation": r"^[0-9A-Za-z-_]{3,100}$", # up to 30 chars, need to be unique
-                                                    # validate that the folder exists already
-                'regex_error_message': "'WBS' must be alphanumeric (letters, numbers, '-', '_') and between 3 and 100 characters long.",
-                "mandatory": False
-
-
-            },
+            "WBS": wbs_field,
                 
-            "ENGAGEMENT_MANAGER": {
-                "type":  "reporter", 
-                "input_name": "reporter",
-                "output_name": "ENGAGEMENT_MANAGER",
-                "mandatory": False            
-                },
+            "ENGAGEMENT_MANAGER": engagement_manager_field,
 
             # "ENGAGEMENT_MANAGER": {
             #         "type":  "people", 
@@ -116,54 +123,17 @@ project_creation_ticket_fields = {
 folder_creation_ticket_fields = { 
 
             # customfield_10611
-            "PROJECT_TYPE": {
-                "type":  "dropdown", 
-                "input_name": "customfield_10611",
-                "output_name": "PROJECT_TYPE",
-                "mandatory": True
-
-            },
+            "PROJECT_TYPE": project_type_field,
 
             # customfield_10611
-            "PROJECT_TYPE_FOLDER": {
-                "type":  "dropdown_nested",
-                "input_name": "customfield_10611",
-                "output_name": "PROJECT_TYPE_FOLDER",
-                "mandatory": True
-
-            },
-
-
-            "FOLDER_NAME": {
-                "type": "textfield",
-                "input_name": "customfield_10578",
-                "output_name": "FOLDER_NAME",
-                "validation": r"^[0-9A-Za-z-_]{3,30}$", # up to 30 chars, need to be unique
-                                                    # validate that the folder exists already
-                'regex_error_message': "'FOLDER_NAME' must be alphanumeric (letters, numbers, '-', '_') and between 3 and 30 characters long.",
-                "mandatory": True
+            "PROJECT_TYPE_FOLDER": project_type_folder_field,
 
 
-            },
+            "FOLDER_NAME": folder_name_field,
 
-            "WBS": { # commessa
-                "type": "textfield",
-                "input_name": "customfield_10644",
-                "output_name": "WBS",
-                "validation": r"^[0-9A-Za-z-_]{3,100}$", # up to 30 chars, need to be unique
-                                                    # validate that the folder exists already
-                'regex_error_message': "'WBS' must be alphanumeric (letters, numbers, '-', '_') and between 3 and 100 characters long.",
-                "mandatory": False
-
-
-            },
+            "WBS": wbs_field,
                 
-            "ENGAGEMENT_MANAGER": {
-                "type":  "reporter", 
-                "input_name": "reporter",
-                "output_name": "ENGAGEMENT_MANAGER",
-                "mandatory": False            
-                },
+            "ENGAGEMENT_MANAGER": engagement_manager_field,
 
             # "ENGAGEMENT_MANAGER": {
             #         "type":  "people", 
@@ -7,11 +7,62 @@ from typing import Dict, Any
 # Import your custom exceptions and AppManager from your app package
 from app.exceptions import (
     InvalidPayloadError, InvalidJiraConfigurationParser,  MissingRequiredDataError, UnhandledIssueTypeError,
-    GcpProvisioningError, PermissionDeniedError, GitHubOperationError, JiraWebhookError, 
-    InvalidMethodError
+    GcpProvisioningError, PermissionDeniedError, GitHubOperationError, JiraWebhookError
 )
 from app.app_manager import AppManager
+from app.logger import flush_logs
+from collections import namedtuple
+
+
+# How a handled exception is answered: the HTTP status code and response body, the message logged
+# (None: not logged) and whether the error is also posted on the issue, which is then set as blocked.
+# `body` and `log_message` are format strings receiving the exception (`e`) and the issue key (`jira_id`).
+ErrorResponse = namedtuple("ErrorResponse", ["status_code", "body", "log_message", "block_issue"])
+
+# Error handling of each exception type. An exception is handled by the entry of the first class
+# of its MRO found here, so subclasses without an entry fall back to their closest base class.
+ERROR_RESPONSES: Dict[type, ErrorResponse] = {
+    InvalidJiraConfigurationParser: ErrorResponse(404, "{e}", None, False),
+    InvalidPayloadError: ErrorResponse(
+        400, "Bad Request: Invalid payload format or content. {e}",
+        "Invalid Jira payload for issue {jira_id}: {e}", False),
+    MissingRequiredDataError: ErrorResponse(
+        400, "Bad Request: Essential data missing from payload. {e}",
+        "Missing required data in Jira payload for issue {jira_id}: {e}", False),
+    GcpProvisioningError: ErrorResponse(
+        500, "Internal Server Error: GCP provisioning operation failed. {e}",
+        "GCP provisioning failed for issue {jira_id}: {e}", False),
+    PermissionDeniedError: ErrorResponse(
+        500, "Internal Server Error: Insufficient permissions for operation. {e}",
+        "Permission denied during operation for issue {jira_id}: {e}", False),
+    GitHubOperationError: ErrorResponse(
+        500, "Internal Server Error: GitHub operation failed. {e}",
+        "GitHub operation failed for issue {jira_id}: {e}", True),
+    JiraWebhookError: ErrorResponse(
+        500, "Internal Server Error: A processing error occurred. {e}",
+        "A general Jira webhook processing error occurred for issue {jira_id}: {e}", False),
+    # --- Catch-all for any unexpected system-level exceptions ---
+    Exception: ErrorResponse(
+        500, "Internal Server Error: An unexpected error occurred. Please check function logs.",
+        "An unexpected and unhandled critical error occurred processing Jira webhook for issue {jira_id}: {e}", True),
+}
+
+
+def get_error_response(e: Exception) -> ErrorResponse:
+    """
+    Finds how an exception raised while processing a webhook is handled.
 
+    Args:
+        e (Exception): The raised exception.
+
+    Returns:
+        ErrorResponse: The entry of the closest class of the exception in ERROR_RESPONSES.
+    """
+    for exception_class in type(e).__mro__:
+        error_response = ERROR_RESPONSES.get(exception_class)
+        if error_response is not None:
+            return error_response
+    return ERROR_RESPONSES[Exception]
 
 
 @functions_framework.http
@@ -19,69 +70,45 @@ def handle_jira_webhook(request: Request):
     """
     Processes a Jira webhook payload and calls different functions based on the issue type.
 
+    A new AppManager is created per request: it holds the state of the issue being processed,
+    while the reusable parts (HTTP session, clients, compiled field parsers) are module-level.
+
     Args:
         request (flask.Request): The Flask request object containing the webhook data.
     """
   
 
+    # Created before the try block, so that the error handlers can always use it.
+    am = AppManager()
     try:
-        am = AppManager()
-        am.check_if_post_request(request)
-        am.transform_into_json(request)
-        am.extract_issue()
+        # Only POST requests are processed for webhooks (checked inline, it runs on every request).
+        if request.method != "POST":
+            am.log_error("Received non-POST request: %s. Method Not Allowed.", request.method)
+            return "Method Not Allowed", 405
 
-        am.parse_jira_request()
-        am.select_provisioner()
-        am.validate_jira_request()
-
-        am.initialize_github_manager()
-        
-        
-        am.built_terraform_yaml()
+        am.transform_into_json(request)
 
-        am.push_to_github()
+        # Batched deliveries are processed issue by issue, each with its own AppManager.
+        if am.is_batch_request():
+            results = am.process_batch()
+            return f"Batched webhook processed: {results}", 200
 
-        am.change_issue_status("Set as done", jira_id= am.jira_id)    
+        am.process_issue()
         return "Webhook processed successfully", 200
 
-
-
-    except InvalidMethodError as e:
-        return 'Method Not Allowed', 405
-
-    except InvalidJiraConfigurationParser as e:
-        return e, 404 
-        
-    except InvalidPayloadError as e:
-        am.log_error(f"Invalid Jira payload for issue {am.jira_id}: {e}. Raw data sample: {str(webhook_data)[:200]}...")
-        return f"Bad Request: Invalid payload format or content. {e}", 400
-    
-
-    except MissingRequiredDataError as e:
-        am.log_error(f"Missing required data in Jira payload for issue {am.jira_id}: {e}. Raw data sample: {str(webhook_data)[:200]}...")
-        return f"Bad Request: Essential data missing from payload. {e}", 400
-
-    except GcpProvisioningError as e:
-        am.log_error(f"GCP provisioning failed for issue {am.jira_id}: {e}")
-        return f"Internal Server Error: GCP provisioning operation failed. {e}", 500
-
-    except PermissionDeniedError as e:
-        am.log_error(f"Permission denied during operation for issue {am.jira_id}: {e}")
-        return f"Internal Server Error: Insufficient permissions for operation. {e}", 500
-
-    except GitHubOperationError as e:
-        am.log_error(f"GitHub operation failed for issue {am.jira_id}: {e}")
-        am.add_comment_to_jira_issue(comment_text=e, jira_id= am.jira_id, comment_type = "error")
-        am.change_issue_status(jira_id= am.jira_id, transition_name = "Set as blocked")
-        return f"Internal Server Error: GitHub operation failed. {e}", 500
-
-    except JiraWebhookError as e:
-        am.log_error(f"A general Jira webhook processing error occurred for issue {am.jira_id}: {e}")
-        return f"Internal Server Error: A processing error occurred. {e}", 500
-
-    # --- Catch-all for any unexpected system-level exceptions ---
     except Exception as e:
-        am.log_error(f"An unexpected and unhandled critical error occurred processing Jira webhook for issue {am.jira_id}: {e}")
-        am.add_comment_to_jira_issue(comment_text=e, jira_id= am.jira_id, comment_type = "error")
-        am.change_issue_status(jira_id= am.jira_id, transition_name = "Set as blocked")
-        return "Internal Server Error: An unexpected error occurred. Please check function logs.", 500
+        error_response = get_error_response(e)
+        if error_response.log_message is not None:
+            am.log_error(error_response.log_message.format(e=e, jira_id=am.jira_id))
+        # Errors raised before the issue was identified (e.g., invalid payloads) have no issue to block.
+        if error_response.block_issue and am.jira_id:
+            try:
+                am.comment_and_change_issue_status(jira_id=am.jira_id, comment_text=str(e), transition_name="Set as blocked")
+            except Exception as notify_error:
+                # A failed Jira update must not mask the original error or its mapped response.
+                am.log_error(f"Could not block Jira issue {am.jira_id} after the error: {notify_error}")
+        return error_response.body.format(e=e, jira_id=am.jira_id), error_response.status_code
+
+    finally:
+        # Write the buffered log entries before the instance can be throttled.
+        flush_logs()
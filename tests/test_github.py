@@ -0,0 +1,65 @@
+import base64
+import unittest
+from unittest import mock
+
+from app.github import GitHubHandler
+from app.payloads import YamlFile
+
+
+class CommitFilesAsTreeTest(unittest.TestCase):
+    """Pushing YAML files whose path already exists on the base branch."""
+
+    HEAD_SHA = "base-sha"
+    PATH = "data/projects/dw-dev-project.yaml"
+
+    def setUp(self):
+        self.handler = GitHubHandler("token", "owner", "repo")
+        self.handler.branch_heads["feature"] = self.HEAD_SHA # The branch was just created from the base branch.
+        commit = mock.patch.object(self.handler, "_commit_tree_with_graphql", return_value="new-sha")
+        self.commit = commit.start()
+        self.addCleanup(commit.stop)
+
+    def _mock_base_branch(self, existing_content: bytes):
+        """Serves a base tree holding PATH with `existing_content`."""
+        blob_sha = GitHubHandler._git_blob_sha(existing_content)
+        responses = {
+            f"{self.handler.repo_url}/git/trees/{self.HEAD_SHA}?recursive=1": {
+                "truncated": False,
+                "tree": [{"path": self.PATH, "type": "blob", "sha": blob_sha}],
+            },
+            f"{self.handler.repo_url}/git/blobs/{blob_sha}": {
+                "content": base64.b64encode(existing_content).decode("ascii"),
+            },
+        }
+        get = mock.patch.object(self.handler, "_get_with_etag", side_effect=responses.__getitem__)
+        get.start()
+        self.addCleanup(get.stop)
+
+    def _push(self, content: bytes):
+        self.handler._commit_files_as_tree("feature", [YamlFile(self.PATH, "Add project", content)])
+
+    def test_different_content_raises_file_exists_error(self):
+        self._mock_base_branch(b"name: old\n")
+        with self.assertRaises(FileExistsError):
+            self._push(b"name: new\n")
+        self.commit.assert_not_called()
+
+    def test_identical_content_is_skipped(self):
+        self._mock_base_branch(b"name: same\n")
+        self._push(b"name: same\n")
+        self.commit.assert_not_called()
+
+    def test_content_differing_only_by_surrounding_whitespace_is_skipped(self):
+        self._mock_base_branch(b"name: same\n")
+        self._push(b"name: same\n\n")
+        self.commit.assert_not_called()
+
+    def test_new_path_is_committed(self):
+        self._mock_base_branch(b"name: other\n")
+        new_file = YamlFile("data/projects/dw-test-project.yaml", "Add project", b"name: new\n")
+        self.handler._commit_files_as_tree("feature", [new_file])
+        self.commit.assert_called_once_with("feature", self.HEAD_SHA, [new_file])
+
+
+if __name__ == "__main__":
+    unittest.main()